@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Synthetic SubRip files for benchmarks.
+
+Output only depends on the arguments: the same seed always gives the same
+file, so that timings of different revisions can be compared.
+
+    $ python benchmarks/generator.py output.srt [count] [encoding] [eol] [malformed]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import random
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, file_path)
+
+from pysrt import SubRipItem
+
+# Only characters available in every benchmarked encoding
+WORDS = (
+    u'the', u'of', u'and', u'to', u'in', u'is', u'you', u'that', u'it',
+    u'he', u'was', u'for', u'on', u'are', u'as', u'with', u'his', u'they',
+    u'caf\xe9', u'na\xefve', u'\xe0', u'gar\xe7on', u'\xfcber', u'stra\xdfe',
+    u'don\u2019t', u'\xbfqu\xe9?', u'se\xf1or', u'd\xe9j\xe0',
+)
+TAGS = (u'<i>%s</i>', u'<b>%s</b>', u'<font color="#ffff00">%s</font>')
+POSITIONS = (u'X1:40 X2:600 Y1:20 Y2:50', u'X1:100 X2:500 Y1:400 Y2:450')
+MALFORMED = (
+    # Timestamps without milliseconds
+    lambda index, start, end, text: u'%d\n%s --> %s\n%s\n' % (
+        index, (u'%s' % start)[:-4], (u'%s' % end)[:-4], text),
+    # Missing timestamps line
+    lambda index, start, end, text: u'%d\n%s\n' % (index, text),
+    # Garbage timestamps
+    lambda index, start, end, text: u'%d\nsometime --> later\n%s\n' % (
+        index, text),
+)
+
+
+def generate_text(generator):
+    lines = []
+    for _ in range(generator.choice((1, 1, 2, 2, 3))):
+        words = [generator.choice(WORDS)
+                 for _ in range(generator.randint(2, 9))]
+        line = u' '.join(words)
+        if generator.random() < 0.1:
+            line = generator.choice(TAGS) % line
+        lines.append(line[0].upper() + line[1:])
+    return u'\n'.join(lines)
+
+
+def generate_items(count, seed=0, shuffle=False):
+    """
+    generate_items(count[, seed][, shuffle]) -> list of SubRipItem
+
+    Cues follow each other with random gaps and durations unless `shuffle`.
+    """
+    generator = random.Random(seed)
+    items = []
+    ordinal = 0
+    for index in range(1, count + 1):
+        ordinal += generator.randint(0, 3000)
+        end = ordinal + generator.randint(500, 6000)
+        position = generator.choice(POSITIONS) \
+            if generator.random() < 0.02 else u''
+        items.append(SubRipItem(index, ordinal, end,
+                                generate_text(generator), position))
+        ordinal = end
+    if shuffle:
+        generator.shuffle(items)
+    return items
+
+
+def generate(count, eol=u'\n', malformed=0.0, seed=0):
+    """
+    generate(count[, eol][, malformed][, seed]) -> unicode
+
+    Return the source of a file of `count` cues, a `malformed` ratio of
+    which cannot be parsed.
+    """
+    generator = random.Random(seed)
+    blocks = []
+    for item in generate_items(count, seed):
+        if malformed and generator.random() < malformed:
+            blocks.append(generator.choice(MALFORMED)(
+                item.index, item.start, item.end, item.text))
+        else:
+            blocks.append(u'%s' % item)
+    source = u'\n'.join(blocks)
+    if eol != u'\n':
+        source = source.replace(u'\n', eol)
+    return source
+
+
+def write(path, count, encoding='utf-8', eol=u'\n', malformed=0.0, seed=0):
+    """
+    write(path, count[, encoding][, eol][, malformed][, seed]) -> size
+
+    Write a generated file, with a byte order mark for UTF-16 and UTF-32.
+    """
+    data = generate(count, eol, malformed, seed).encode(encoding)
+    with open(path, 'wb') as output_file:
+        output_file.write(data)
+    return len(data)
+
+
+if __name__ == '__main__':
+    arguments = sys.argv[1:]
+    if not arguments:
+        print(__doc__.strip().splitlines()[-1].strip())
+        sys.exit(1)
+    write(arguments[0],
+          int(arguments[1]) if len(arguments) > 1 else 10000,
+          arguments[2] if len(arguments) > 2 else 'utf-8',
+          {'crlf': u'\r\n', 'cr': u'\r'}.get(
+              arguments[3] if len(arguments) > 3 else 'lf', u'\n'),
+          float(arguments[4]) if len(arguments) > 4 else 0.0)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Measure the memory held per cue by a parsed SubRipFile.
+
+The "dict" rows emulate the previous, non slotted, SubRipTime and
+SubRipItem classes by subclassing them without __slots__. Texts are shared
+between variants so only the per-cue overhead is measured.
+
+    $ python benchmarks/memory.py [file.srt]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import tracemalloc
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, file_path)
+
+from pysrt import SubRipFile, SubRipItem, SubRipTime
+
+
+class DictSubRipTime(SubRipTime):
+    pass
+
+
+class DictSubRipItem(SubRipItem):
+
+    def __init__(self, *args, **kwargs):
+        super(DictSubRipItem, self).__init__(*args, **kwargs)
+        self.start = DictSubRipTime.from_ordinal(self.start.ordinal)
+        self.end = DictSubRipTime.from_ordinal(self.end.ordinal)
+
+
+def measure(build):
+    tracemalloc.start()
+    try:
+        subs = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / float(len(subs))
+
+
+def main(path):
+    items = list(SubRipFile.open(path))
+    cases = (
+        ('dict', lambda: SubRipFile([DictSubRipItem(i.index, i.start, i.end,
+            i.text, i.position) for i in items])),
+        # Times are built afresh in both cases, like parsing would
+        ('slots', lambda: SubRipFile([SubRipItem(i.index,
+            SubRipTime.from_ordinal(i.start.ordinal),
+            SubRipTime.from_ordinal(i.end.ordinal),
+            i.text, i.position) for i in items])),
+        ('columnar', lambda: SubRipFile(items,
+            storage=SubRipFile.STORAGE_COLUMNAR)),
+    )
+    print('%-10s %12s' % ('variant', 'bytes/cue'))
+    for name, build in cases:
+        print('%-10s %12.1f' % (name, measure(build)))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else
+         os.path.join(file_path, 'tests', 'static', 'utf-8.srt'))
@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite of the parse, serialize and transform paths and of the srt
+command, run on generated files (see generator.py).
+
+Results are written as JSON, to stdout unless --output is given, and
+summed up on stderr. Giving the results of a previous run to --compare
+reports each case against it and exits with status 1 if any got slower
+than --threshold times its previous timing.
+
+    $ python benchmarks/run.py --output before.json
+    $ python benchmarks/run.py --compare before.json --filter 'open|shift'
+"""
+from __future__ import print_function
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import timeit
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, file_path)
+
+import pysrt
+from pysrt import SubRipFile, VERSION_STRING
+from pysrt import commands
+from pysrt.srtoffsets import OffsetIndex
+
+import generator
+
+FORMAT_VERSION = 1
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.1
+
+# name -> (encoding, eol, malformed ratio)
+CORPORA = {
+    'utf-8': ('utf-8', '\n', 0.0),
+    'utf-8-malformed': ('utf-8', '\n', 0.05),
+    'utf-16-crlf': ('utf-16', '\r\n', 0.0),
+    'windows-1252-crlf': ('windows-1252', '\r\n', 0.0),
+}
+ALL_CORPORA = sorted(CORPORA)
+WELL_FORMED = ('utf-8', 'utf-16-crlf', 'windows-1252-crlf')
+
+SLICES_COUNT = 100
+AT_COUNT = 1000
+
+
+class Corpus(object):
+    """
+    A generated file, written on first use into `directory`.
+    """
+
+    def __init__(self, name, size, directory):
+        self.name = name
+        self.size = size
+        self.encoding, self.eol, self.malformed = CORPORA[name]
+        self.path = os.path.join(directory, '%s-%d.srt' % (name, size))
+        self.bytes = None
+        self._binary = None
+
+    def prepare(self):
+        if self.bytes is None:
+            self.bytes = generator.write(self.path, self.size, self.encoding,
+                                         self.eol, self.malformed)
+        return self
+
+    def source(self):
+        with io.open(self.path, encoding=self.encoding) as source_file:
+            return source_file.read()
+
+    def parsed(self):
+        """
+        Return a new SubRipFile of the corpus items, quickly rebuilt from
+        a binary dump after the first call.
+        """
+        if self._binary is None:
+            subs = SubRipFile.open(self.path, encoding=self.encoding)
+            self._binary = subs.to_binary()
+            return subs
+        return SubRipFile.from_binary(self._binary)
+
+
+class Case(object):
+    """
+    A benchmarked operation: `prepare(corpus)` builds, untimed, the argument
+    of `run()`, which is then timed.
+    """
+
+    def __init__(self, name, corpora, prepare, run):
+        self.name = name
+        self.corpora = corpora
+        self.prepare = prepare
+        self.run = run
+
+
+def read_stream(corpus):
+    source_file = io.open(corpus.path, encoding=corpus.encoding)
+    try:
+        for _ in SubRipFile.stream(source_file):
+            pass
+    finally:
+        source_file.close()
+
+
+def shuffled(corpus):
+    subs = corpus.parsed()
+    random.Random(0).shuffle(subs.data)
+    return subs
+
+
+def shifted(corpus, milliseconds):
+    subs = corpus.parsed()
+    subs.shift(milliseconds=milliseconds)
+    return subs
+
+
+def windows(subs, count, duration):
+    """
+    Return `count` (start, end) ordinals evenly spread over `subs`.
+    """
+    last = subs[-1].end.ordinal if subs else 0
+    step = max(last // count, 1)
+    return [(start, start + duration) for start in range(0, last, step)][:count]
+
+
+def run_slices(argument):
+    subs, bounds = argument
+    for start, end in bounds:
+        subs.slice(ends_after=start, starts_before=end)
+
+
+def run_at(argument):
+    subs, bounds = argument
+    for timestamp, _ in bounds:
+        subs.at(timestamp)
+
+
+def run_at_frozen(argument):
+    subs, bounds = argument
+    for timestamp, _ in bounds:
+        subs.at(timestamp, frozen=True)
+
+
+def prepare_range(corpus):
+    index = OffsetIndex.for_file(corpus.path, corpus.encoding)
+    return corpus.path, index, windows(corpus.parsed(), SLICES_COUNT, 60000)
+
+
+def run_open_range(argument):
+    path, index, bounds = argument
+    for start, end in bounds:
+        SubRipFile.open_range(path, start, end, index=index)
+
+
+def command(*args):
+    """
+    Return a function running the srt command with `args` followed by the
+    corpus path and its output directory.
+    """
+    def prepare(corpus):
+        # Start from an empty in memory encoding cache on every run
+        commands._encoding_detectors.clear()
+        output_dir = tempfile.mkdtemp()
+        return ['-o', output_dir] + list(args) + [corpus.path], output_dir
+    return prepare
+
+
+def run_command(argument):
+    args, output_dir = argument
+    stderr = sys.stderr
+    sys.stderr = io.StringIO() if sys.version_info[0] > 2 else io.BytesIO()
+    try:
+        status = commands.SubRipShifter().run(args)
+    finally:
+        sys.stderr = stderr
+        shutil.rmtree(output_dir)
+    if status:
+        raise RuntimeError('srt %s failed' % ' '.join(args))
+
+
+CASES = (
+    Case('open', ALL_CORPORA, lambda corpus: corpus,
+         lambda corpus: SubRipFile.open(corpus.path, encoding=corpus.encoding)),
+    Case('open_fast', ALL_CORPORA, lambda corpus: corpus,
+         lambda corpus: SubRipFile.open(corpus.path, encoding=corpus.encoding,
+                                        parser=SubRipFile.PARSER_FAST)),
+    Case('open_columnar', ('utf-8', ), lambda corpus: corpus,
+         lambda corpus: SubRipFile.open(
+             corpus.path, encoding=corpus.encoding,
+             storage=SubRipFile.STORAGE_COLUMNAR)),
+    Case('open_parallel', ('utf-8', ), lambda corpus: corpus,
+         lambda corpus: SubRipFile.open(corpus.path, encoding=corpus.encoding,
+                                        workers=0)),
+    Case('from_string', ALL_CORPORA, Corpus.source, SubRipFile.from_string),
+    Case('from_string_fast', ALL_CORPORA, Corpus.source,
+         lambda source: SubRipFile.from_string(
+             source, parser=SubRipFile.PARSER_FAST)),
+    Case('stream', ALL_CORPORA, lambda corpus: corpus, read_stream),
+    Case('write_into', ('utf-8', ),
+         lambda corpus: (corpus.parsed(), io.StringIO()),
+         lambda argument: argument[0].write_into(argument[1])),
+    Case('save', ('utf-8', 'utf-16-crlf'),
+         lambda corpus: (corpus.parsed(), corpus.path + '.out', corpus.encoding),
+         lambda argument: argument[0].save(argument[1], encoding=argument[2])),
+    Case('shift', ('utf-8', ), Corpus.parsed,
+         lambda subs: subs.shift(seconds=1)),
+    Case('slice', ('utf-8', ),
+         lambda corpus: (corpus.parsed(), windows(corpus.parsed(),
+                                                  SLICES_COUNT, 60000)),
+         run_slices),
+    Case('at', ('utf-8', ),
+         lambda corpus: (corpus.parsed(), windows(corpus.parsed(),
+                                                  AT_COUNT, 0)),
+         run_at),
+    Case('at_frozen', ('utf-8', ),
+         lambda corpus: (corpus.parsed(), windows(corpus.parsed(),
+                                                  AT_COUNT, 0)),
+         run_at_frozen),
+    Case('open_range', ('utf-8', 'utf-16-crlf'), prepare_range,
+         run_open_range),
+    Case('merge', ('utf-8', ), lambda corpus: (corpus.parsed(),
+                                               shifted(corpus, 700)),
+         lambda argument: pysrt.merge(*argument)),
+    Case('analyze', ('utf-8', ), Corpus.parsed, SubRipFile.analyze),
+    Case('text_metrics', ('utf-8', ), Corpus.parsed, SubRipFile.text_metrics),
+    Case('clean_indexes', ('utf-8', ), shuffled, SubRipFile.clean_indexes),
+    Case('srt_shift', WELL_FORMED, command('shift', '1s500ms'), run_command),
+    Case('srt_rate', ('utf-8', ), command('rate', '23.9', '25'), run_command),
+    Case('srt_split', ('utf-8', ), command('split', '20m', '20m'), run_command),
+    Case('srt_break', ('utf-8', ), command('break', '32'), run_command),
+    Case('srt_merge', ('utf-8', ), command('merge', '-t', '100ms'), run_command),
+)
+
+
+def measure(case, corpus, repeat):
+    timings = []
+    for _ in range(repeat):
+        argument = case.prepare(corpus)
+        started = timeit.default_timer()
+        case.run(argument)
+        timings.append(timeit.default_timer() - started)
+    timings.sort()
+    return {
+        'case': case.name,
+        'corpus': corpus.name,
+        'size': corpus.size,
+        'bytes': corpus.bytes,
+        'encoding': corpus.encoding,
+        'eol': corpus.eol,
+        'malformed': corpus.malformed,
+        'repeat': repeat,
+        'best': timings[0],
+        'median': timings[len(timings) // 2],
+        'timings': timings,
+    }
+
+
+def git_revision():
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=file_path,
+            stderr=open(os.devnull, 'w'))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def metadata():
+    optional = {}
+    for module in ('numpy', 'chardet'):
+        try:
+            optional[module] = __import__(module).__version__
+        except ImportError:
+            optional[module] = None
+    return {
+        'format': FORMAT_VERSION,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'pysrt': VERSION_STRING,
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'optional': optional,
+    }
+
+
+def result_key(result):
+    return (result['case'], result['corpus'], result['size'])
+
+
+def compare(results, baseline, threshold):
+    """
+    Print each result against `baseline` results and return the keys of
+    those slower than `threshold` times their baseline best timing.
+    """
+    previous = dict((result_key(result), result) for result in baseline)
+    regressions = []
+    for result in results:
+        reference = previous.get(result_key(result))
+        if reference is None:
+            continue
+        ratio = result['best'] / max(reference['best'], 1e-9)
+        flag = ''
+        if ratio > threshold:
+            flag = ' REGRESSION'
+            regressions.append(result_key(result))
+        print('%-14s %-18s %7d %10.4f %10.4f %6.2fx%s' % (
+            result['case'], result['corpus'], result['size'],
+            reference['best'], result['best'], ratio, flag), file=sys.stderr)
+    return regressions
+
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma separated numbers of cues per file')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Runs per case, the best one being kept')
+    parser.add_argument('--filter', default=None,
+                        help='Only run cases whose name matches this regex')
+    parser.add_argument('--output', default=None,
+                        help='Write JSON results to this file')
+    parser.add_argument('--compare', default=None,
+                        help='JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Slowdown ratio reported as a regression')
+    parser.add_argument('--list', action='store_true',
+                        help='List cases and exit')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    arguments = parse_args(sys.argv[1:] if args is None else args)
+    if arguments.list:
+        for case in CASES:
+            print('%-14s %s' % (case.name, ', '.join(case.corpora)))
+        return 0
+    pattern = re.compile(arguments.filter) if arguments.filter else None
+    sizes = [int(size) for size in arguments.sizes.split(',')]
+
+    directory = tempfile.mkdtemp(prefix='pysrt-benchmarks-')
+    corpora = {}
+    results = []
+    try:
+        for size in sizes:
+            for case in CASES:
+                if pattern and not pattern.search(case.name):
+                    continue
+                for name in case.corpora:
+                    key = (name, size)
+                    if key not in corpora:
+                        corpora[key] = Corpus(name, size, directory).prepare()
+                    result = measure(case, corpora[key], arguments.repeat)
+                    results.append(result)
+                    print('%-14s %-18s %7d %10.4f' % (
+                        case.name, name, size, result['best']),
+                        file=sys.stderr)
+    finally:
+        shutil.rmtree(directory)
+
+    report = {'metadata': metadata(), 'results': results}
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            output_file.write(output + '\n')
+    else:
+        print(output)
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        print('\n%-14s %-18s %7s %10s %10s %7s' % (
+            'case', 'corpus', 'size', 'before', 'after', 'ratio'),
+            file=sys.stderr)
+        if compare(results, baseline, arguments.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Time clean_indexes() and plain comparisons on shuffled cues.
+
+The "legacy" row replays the former item comparison: a tuple of two
+SubRipTime compared through ComparableMixin and SubRipTime.coerce.
+Only sorting and renumbering are timed, on freshly shuffled copies.
+
+    $ python benchmarks/sort.py [count]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, file_path)
+
+from pysrt import SubRipFile
+
+import generator
+
+
+def legacy_compare(left, right, method):
+    # ComparableMixin._compare as it was, lambdas included
+    try:
+        return method(left, right)
+    except (AttributeError, TypeError):
+        return NotImplemented
+
+
+class LegacyTime(object):
+    __slots__ = ('ordinal', )
+
+    def __init__(self, ordinal):
+        self.ordinal = ordinal
+
+    def coerce(self, other):
+        if isinstance(other, LegacyTime):
+            return other
+        raise TypeError
+
+    def __lt__(self, other):
+        return legacy_compare(self.ordinal, self.coerce(other).ordinal,
+                              lambda s, o: s < o)
+
+    def __eq__(self, other):
+        return legacy_compare(self.ordinal, self.coerce(other).ordinal,
+                              lambda s, o: s == o)
+
+
+class LegacyItem(object):
+    __slots__ = ('start', 'end')
+
+    def __init__(self, item):
+        self.start = LegacyTime(item.start.ordinal)
+        self.end = LegacyTime(item.end.ordinal)
+
+    def __lt__(self, other):
+        return legacy_compare((self.start, self.end), (other.start, other.end),
+                              lambda s, o: s < o)
+
+
+def best_of(prepare, function, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        argument = prepare()
+        start = timeit.default_timer()
+        function(argument)
+        timings.append(timeit.default_timer() - start)
+    return min(timings)
+
+
+def main(count):
+    items = generator.generate_items(count, shuffle=True)
+    binary = SubRipFile(items).to_binary()
+    cases = (
+        ('legacy', lambda: [LegacyItem(item) for item in items],
+         lambda legacy_items: legacy_items.sort()),
+        ('list.sort()', lambda: list(items), lambda copy: copy.sort()),
+        ('clean_indexes', lambda: SubRipFile(list(items)),
+         SubRipFile.clean_indexes),
+        ('columnar', lambda: SubRipFile.from_binary(
+            binary, storage=SubRipFile.STORAGE_COLUMNAR),
+         SubRipFile.clean_indexes),
+    )
+    print('%d items' % count)
+    print('%-14s %10s' % ('variant', 'seconds'))
+    for name, prepare, function in cases:
+        print('%-14s %10.4f' % (name, best_of(prepare, function)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compare the chunked writer with the previous per item one.
+
+The "legacy" rows replay the former SubRipFile.save and write_into: a
+codecs stream writer and two write calls per item.
+
+    $ python benchmarks/writer.py [file.srt] [copies]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import codecs
+import tempfile
+import timeit
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, file_path)
+
+from pysrt import SubRipFile
+from pysrt.compat import str
+
+
+def legacy_write_into(subs, output_file, eol):
+    for item in subs:
+        string_repr = str(item)
+        if eol != '\n':
+            string_repr = string_repr.replace('\n', eol)
+        output_file.write(string_repr)
+        if not string_repr.endswith(2 * eol):
+            output_file.write(eol)
+
+
+def legacy_save(subs, path, encoding, eol):
+    save_file = codecs.open(path, 'w+', encoding=encoding)
+    legacy_write_into(subs, save_file, eol)
+    save_file.close()
+
+
+def best_of(function, repeat=5):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main(path, copies):
+    items = list(SubRipFile.open(path))
+    subs = SubRipFile(items * copies)
+    handle, output_path = tempfile.mkstemp(suffix='.srt')
+    os.close(handle)
+    try:
+        cases = (
+            ('legacy save', lambda: legacy_save(subs, output_path, 'utf-16',
+                                                '\r\n')),
+            ('save', lambda: subs.save(output_path, encoding='utf-16',
+                                       eol='\r\n')),
+            ('to_bytes', lambda: subs.to_bytes('utf-16', eol='\r\n')),
+        )
+        print('%d items' % len(subs))
+        print('%-12s %10s' % ('variant', 'seconds'))
+        for name, function in cases:
+            print('%-12s %10.4f' % (name, best_of(function)))
+    finally:
+        os.remove(output_path)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else
+         os.path.join(file_path, 'tests', 'static', 'utf-8.srt'),
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
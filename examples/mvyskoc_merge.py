@@ -9,58 +9,19 @@
 
 # See https://github.com/byroot/pysrt/issues/17 for more detailed information
 
+# The merge itself is now pysrt.merge, also available as `srt merge`
+
 import sys
 import getopt
 from pysrt import SubRipFile
-from pysrt import SubRipItem
 from pysrt import SubRipTime
-
-
-def join_lines(txtsub1, txtsub2):
-    if (len(txtsub1) > 0) & (len(txtsub2) > 0):
-        return txtsub1 + '\n' + txtsub2
-    else:
-        return txtsub1 + txtsub2
-
-
-def find_subtitle(subtitle, from_t, to_t, lo=0):
-    i = lo
-    while (i < len(subtitle)):
-        if (subtitle[i].start >= to_t):
-            break
-
-        if (subtitle[i].start <= from_t) & (to_t  <= subtitle[i].end):
-            return subtitle[i].text, i
-        i += 1
-
-    return "", i
-
+from pysrt import merge
 
 
 def merge_subtitle(sub_a, sub_b, delta):
-    out = SubRipFile()
-    intervals = [item.start.ordinal for item in sub_a]
-    intervals.extend([item.end.ordinal for item in sub_a])
-    intervals.extend([item.start.ordinal for item in sub_b])
-    intervals.extend([item.end.ordinal for item in sub_b])
-    intervals.sort()
-
-    j = k = 0
-    for i in xrange(1, len(intervals)):
-        start = SubRipTime.from_ordinal(intervals[i-1])
-        end = SubRipTime.from_ordinal(intervals[i])
-
-        if (end-start) > delta:
-            text_a, j = find_subtitle(sub_a, start, end, j)
-            text_b, k = find_subtitle(sub_b, start, end, k)
-
-            text = join_lines(text_a, text_b)
-            if len(text) > 0:
-                item = SubRipItem(0, start, end, text)
-                out.append(item)
-
-    out.clean_indexes()
-    return out
+    # Parts shorter than delta are dropped, see pysrt.merge
+    return merge(sub_a, sub_b, tolerance=delta)
+
 
 def usage():
     print "Usage: ./srtmerge [options] lang1.srt lang2.srt out.srt"
@@ -1,18 +1,34 @@
 from pysrt.srttime import SubRipTime
 from pysrt.srtitem import SubRipItem
 from pysrt.srtfile import SubRipFile
-from pysrt.srtexc import Error, InvalidItem, InvalidTimeString
+from pysrt.srtpush import SubRipPushParser
+from pysrt.srtstats import SubRipStats
+from pysrt.srtreport import SubRipReport
+from pysrt.srtmerge import merge
+from pysrt.srtexc import Error, InvalidItem, InvalidTimeString, InvalidBinary
 from pysrt.version import VERSION, VERSION_STRING
 
 __all__ = [
-    'SubRipFile', 'SubRipItem', 'SubRipFile', 'SUPPORT_UTF_32_LE',
-    'SUPPORT_UTF_32_BE', 'InvalidItem', 'InvalidTimeString'
+    'SubRipFile', 'SubRipItem', 'SubRipFile', 'SubRipPushParser', 'SubRipStats',
+    'SubRipReport',
+    'SUPPORT_UTF_32_LE', 'SUPPORT_UTF_32_BE', 'InvalidItem', 'InvalidTimeString', 'InvalidBinary'
 ]
 
 ERROR_PASS = SubRipFile.ERROR_PASS
 ERROR_LOG = SubRipFile.ERROR_LOG
 ERROR_RAISE = SubRipFile.ERROR_RAISE
+ERROR_COLLECT = SubRipFile.ERROR_COLLECT
+
+STORAGE_LIST = SubRipFile.STORAGE_LIST
+STORAGE_COLUMNAR = SubRipFile.STORAGE_COLUMNAR
+
+PARSER_TOLERANT = SubRipFile.PARSER_TOLERANT
+PARSER_FAST = SubRipFile.PARSER_FAST
+
+ENCODING_AUTO = SubRipFile.ENCODING_AUTO
 
 open = SubRipFile.open
+open_mmap = SubRipFile.open_mmap
+open_range = SubRipFile.open_range
 stream = SubRipFile.stream
 from_string = SubRipFile.from_string
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio API
+
+Blocking file operations run in an executor so they never stall the event
+loop, and subtitles can be streamed from asyncio stream readers. Returned
+objects are the usual SubRipFile and SubRipItem instances.
+
+Requires Python 3.5 or later, this module is not imported by pysrt.
+"""
+import asyncio
+import inspect
+from collections import deque
+from functools import partial
+from itertools import islice
+
+from pysrt.srtfile import SubRipFile
+from pysrt.srtpush import SubRipPushParser
+
+# Number of items parsed per executor call by stream()
+STREAM_BATCH_SIZE = 256
+# Number of bytes requested per read on stream readers
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def _get_loop():
+    return getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)()
+
+
+async def open(path='', encoding=None, executor=None, **kwargs):
+    """
+    open([path][, encoding][, executor], **kwargs) -> SubRipFile
+
+    Same as pysrt.open, run in `executor`, the loop default one if None.
+    """
+    function = partial(SubRipFile.open, path, encoding=encoding, **kwargs)
+    return await _get_loop().run_in_executor(executor, function)
+
+
+async def save(srt_file, path=None, encoding=None, eol=None, executor=None):
+    """
+    save(srt_file[, path][, encoding][, eol][, executor])
+
+    Same as SubRipFile.save, run in `executor`, the loop default one if
+    None. `srt_file` must not be changed until saving is done.
+    """
+    function = partial(srt_file.save, path, encoding=encoding, eol=eol)
+    await _get_loop().run_in_executor(executor, function)
+
+
+def stream(source, encoding=None, error_handling=SubRipFile.ERROR_PASS,
+           executor=None):
+    """
+    stream(source[, encoding][, error_handling][, executor])
+    -> asynchronous iterator of SubRipItem
+
+    `source` -> either a path, read and parsed by batches in `executor`, or
+        an asyncio.StreamReader (or any object with a `read(size)`
+        coroutine method) whose data is parsed as it arrives.
+
+    Encoding is detected from the byte order mark if not provided.
+
+    Example:
+        >>> async for item in pysrt.aio.stream(reader):
+        ...     print(item.text)
+    """
+    read = getattr(source, 'read', None)
+    if isinstance(source, asyncio.StreamReader) or \
+            inspect.iscoroutinefunction(read):
+        return _ReaderStream(source, encoding, error_handling)
+    return _FileStream(source, encoding, error_handling, executor)
+
+
+class _FileStream(object):
+
+    def __init__(self, path, encoding, error_handling, executor):
+        self.path = path
+        self.encoding = encoding
+        self.error_handling = error_handling
+        self.executor = executor
+        self.items = deque()
+        self.source_file = None
+        self.iterator = None
+        self.done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.items:
+            if not self.done:
+                batch = await _get_loop().run_in_executor(self.executor,
+                                                          self._next_batch)
+                self.items.extend(batch)
+            if not self.items:
+                raise StopAsyncIteration
+        return self.items.popleft()
+
+    async def aclose(self):
+        if self.source_file is not None and not self.done:
+            await _get_loop().run_in_executor(self.executor, self._close)
+
+    def _next_batch(self):
+        if self.iterator is None:
+            self.source_file, _ = SubRipFile._open_unicode_file(
+                self.path, claimed_encoding=self.encoding)
+            self.iterator = SubRipFile.stream(
+                self.source_file, error_handling=self.error_handling)
+        batch = list(islice(self.iterator, STREAM_BATCH_SIZE))
+        if len(batch) < STREAM_BATCH_SIZE:
+            self._close()
+        return batch
+
+    def _close(self):
+        self.done = True
+        self.source_file.close()
+
+
+class _ReaderStream(object):
+
+    def __init__(self, reader, encoding, error_handling):
+        self.reader = reader
+        self.parser = SubRipPushParser(encoding, error_handling)
+        self.items = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.items:
+            if self.parser.closed:
+                raise StopAsyncIteration
+            data = await self.reader.read(READ_CHUNK_SIZE)
+            if data:
+                self.items.extend(self.parser.feed(data))
+            else:
+                self.items.extend(self.parser.close())
+        return self.items.popleft()
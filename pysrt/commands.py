@@ -6,13 +6,19 @@ from __future__ import print_function
 import os
 import re
 import sys
+import glob
+import time
 import codecs
 import shutil
 import argparse
+import multiprocessing
+from copy import copy
 from textwrap import dedent
 
-from chardet import detect
-from pysrt import SubRipFile, SubRipTime, VERSION_STRING
+from pysrt import SubRipFile, SubRipTime, SubRipReport, VERSION_STRING
+from pysrt.srtfile import CODECS_BOMS
+from pysrt.srtmerge import merge
+from pysrt.srtencoding import EncodingDetector, CACHE_ENVIRONMENT_VARIABLE
 
 
 def underline(string):
@@ -20,21 +26,43 @@ def underline(string):
 
 
 class TimeAwareArgumentParser(argparse.ArgumentParser):
+    """
+    ArgumentParser accepting negative time offsets, like -1s, as positional
+    arguments. Its subparsers are TimeAwareArgumentParser too, each one
+    looking for offsets in the arguments it is given.
+    """
 
     RE_TIME_REPRESENTATION = re.compile(r'^\-?(\d+[hms]{0,2}){1,4}$')
 
-    def parse_args(self, args=None, namespace=None):
-        time_index = -1
+    def __init__(self, *args, **kwargs):
+        # Set before ArgumentParser.__init__ adds --help
+        self.option_actions = {}
+        super(TimeAwareArgumentParser, self).__init__(*args, **kwargs)
+
+    def add_argument(self, *args, **kwargs):
+        action = super(TimeAwareArgumentParser, self).add_argument(*args, **kwargs)
+        for option_string in action.option_strings:
+            self.option_actions[option_string] = action
+        return action
+
+    def parse_known_args(self, args=None, namespace=None):
+        args = list(sys.argv[1:] if args is None else args)
+        skip_value = False
         for index, arg in enumerate(args):
-            match = self.RE_TIME_REPRESENTATION.match(arg)
-            if match:
-                time_index = index
+            if skip_value:  # e.g. the 4 of "-j 4" is not a time offset
+                skip_value = False
+                continue
+            action = self.option_actions.get(arg)
+            if action is not None:
+                skip_value = action.nargs != 0
+            elif self.RE_TIME_REPRESENTATION.match(arg):
+                args.insert(index, '--')
+                break
+            elif arg == '--' or not arg.startswith('-'):
+                # Anything after a command is left to its subparser
                 break
 
-        if time_index >= 0:
-            args.insert(time_index, '--')
-
-        return super(TimeAwareArgumentParser, self).parse_args(args, namespace)
+        return super(TimeAwareArgumentParser, self).parse_known_args(args, namespace)
 
 
 class SubRipShifter(object):
@@ -51,7 +79,7 @@ class SubRipShifter(object):
     DESCRIPTION = dedent("""\
         Srt subtitle editor
 
-        It can either shift, split or change the frame rate.
+        It can either shift, split, change the frame rate, merge or check files.
     """)
     TIMESTAMP_HELP = "A timestamp in the form: [-][Hh][Mm]S[s][MSms]"
     SHIFT_EPILOG = dedent("""\
@@ -96,9 +124,50 @@ class SubRipShifter(object):
         Break lines longer than defined length
     """)
     LENGTH_HELP = "Maximum number of characters per line"
+    MERGE_EPILOG = dedent("""\
+
+        Examples:
+            Show english and french subtitles together:
+                $ srt merge movie.en.srt movie.fr.srt > movie.en-fr.srt
+
+            Drop parts shown less than half a second:
+                $ srt merge --tolerance 500ms movie.en.srt movie.fr.srt > movie.en-fr.srt
+    """)
+    TOLERANCE_HELP = "Parts not longer than this are dropped, in the form: [Hh][Mm]S[s][MSms]"
+    TRACKS_HELP = "Files to merge, their texts being shown in this order"
+    CHECK_EPILOG = dedent("""\
+
+        Report overlapping cues, too short gaps, negative durations, cues read
+        too fast and invalid blocks. Exit with status 1 if any is found.
+
+        Examples:
+            $ srt check movie.srt
+            $ srt check --min-gap 120ms --max-cps 20 subtitles/
+    """)
+    MIN_GAP_HELP = "Shortest gap between two cues, in the form: [Hh][Mm]S[s][MSms]. Default to %dms" % SubRipReport.MIN_GAP
+    MAX_CPS_HELP = "Highest reading speed in characters per second. Default to %g" % SubRipReport.MAX_CPS
+
+    FILES_HELP = dedent("""\
+        Files to process. Directories are searched recursively for .srt files
+        and glob patterns are expanded.
+    """)
+    JOBS_HELP = dedent("""\
+        Number of files processed in parallel, 0 meaning one per CPU.
+        Processing several files requires either --in-place or --output-dir.
+    """)
+    OUTPUT_DIR_HELP = "Write processed files into this directory instead of stdout"
+    SOURCE_EXTENSION = '.srt'
+
+    ENCODING_CACHE_HELP = dedent("""\
+        JSON file caching detected encodings, so that unchanged files are not
+        sampled again on later runs. Default to $%s.
+    """ % CACHE_ENVIRONMENT_VARIABLE)
 
     def __init__(self):
         self.output_file_path = None
+        self.input_eol = None
+        self.input_encoding = None
+        self.items_count = 0
 
     def build_parser(self):
         parser = TimeAwareArgumentParser(description=self.DESCRIPTION, formatter_class=argparse.RawTextHelpFormatter)
@@ -106,41 +175,235 @@ class SubRipShifter(object):
             help="Edit file in-place, saving a backup as file.bak (do not works for the split command)")
         parser.add_argument('-e', '--output-encoding', metavar=underline('encoding'), action='store', dest='output_encoding',
             type=self.parse_encoding, help=self.ENCODING_HELP)
+        parser.add_argument('-j', '--jobs', metavar=underline('jobs'), action='store', dest='jobs', type=int,
+            default=None, help=self.JOBS_HELP)
+        parser.add_argument('-o', '--output-dir', metavar=underline('directory'), action='store', dest='output_dir',
+            help=self.OUTPUT_DIR_HELP)
+        parser.add_argument('--encoding-cache', metavar=underline('file'), action='store', dest='encoding_cache',
+            default=os.environ.get(CACHE_ENVIRONMENT_VARIABLE), help=self.ENCODING_CACHE_HELP)
         parser.add_argument('-v', '--version', action='version', version='%%(prog)s %s' % VERSION_STRING)
         subparsers = parser.add_subparsers(title='commands')
 
         shift_parser = subparsers.add_parser('shift', help="Shift subtitles by specified time offset", epilog=self.SHIFT_EPILOG, formatter_class=argparse.RawTextHelpFormatter)
         shift_parser.add_argument('time_offset', action='store', metavar=underline('offset'),
             type=self.parse_time, help=self.TIMESTAMP_HELP)
-        shift_parser.set_defaults(action=self.shift)
+        shift_parser.add_argument('files', action='store', nargs='+', metavar=underline('file'), help=self.FILES_HELP)
+        shift_parser.set_defaults(action='shift')
 
         rate_parser = subparsers.add_parser('rate', help="Convert subtitles from a frame rate to another", epilog=self.RATE_EPILOG, formatter_class=argparse.RawTextHelpFormatter)
         rate_parser.add_argument('initial', action='store', type=float, help=self.FRAME_RATE_HELP)
         rate_parser.add_argument('final', action='store', type=float, help=self.FRAME_RATE_HELP)
-        rate_parser.set_defaults(action=self.rate)
+        rate_parser.add_argument('files', action='store', nargs='+', metavar=underline('file'), help=self.FILES_HELP)
+        rate_parser.set_defaults(action='rate')
 
         split_parser = subparsers.add_parser('split', help="Split a file in multiple parts", epilog=self.SPLIT_EPILOG, formatter_class=argparse.RawTextHelpFormatter)
         split_parser.add_argument('limits', action='store', nargs='+', type=self.parse_time, help=self.LIMITS_HELP)
-        split_parser.set_defaults(action=self.split)
+        split_parser.add_argument('files', action='store', nargs=1, metavar=underline('file'))
+        split_parser.set_defaults(action='split')
 
         break_parser = subparsers.add_parser('break', help="Break long lines", epilog=self.BREAK_EPILOG, formatter_class=argparse.RawTextHelpFormatter)
         break_parser.add_argument('length', action='store', type=int, help=self.LENGTH_HELP)
-        break_parser.set_defaults(action=self.break_lines)
-
-        parser.add_argument('file', action='store')
+        break_parser.add_argument('files', action='store', nargs='+', metavar=underline('file'), help=self.FILES_HELP)
+        break_parser.set_defaults(action='break_lines')
+
+        merge_parser = subparsers.add_parser('merge', help="Merge several files into one", epilog=self.MERGE_EPILOG, formatter_class=argparse.RawTextHelpFormatter)
+        merge_parser.add_argument('-t', '--tolerance', metavar=underline('duration'), action='store', dest='tolerance',
+            type=self.parse_time, default=0, help=self.TOLERANCE_HELP)
+        merge_parser.add_argument('files', action='store', nargs='+', metavar=underline('file'), help=self.TRACKS_HELP)
+        merge_parser.set_defaults(action='merge')
+
+        check_parser = subparsers.add_parser('check', help="Check timings and reading speed", epilog=self.CHECK_EPILOG, formatter_class=argparse.RawTextHelpFormatter)
+        check_parser.add_argument('--min-gap', metavar=underline('duration'), action='store', dest='min_gap',
+            type=self.parse_time, default=SubRipReport.MIN_GAP, help=self.MIN_GAP_HELP)
+        check_parser.add_argument('--max-cps', metavar=underline('cps'), action='store', dest='max_cps',
+            type=float, default=SubRipReport.MAX_CPS, help=self.MAX_CPS_HELP)
+        check_parser.add_argument('files', action='store', nargs='+', metavar=underline('file'), help=self.FILES_HELP)
+        check_parser.set_defaults(action='check')
 
         return parser
 
     def run(self, args):
-        self.arguments = self.build_parser().parse_args(args)
-
-        if os.path.isfile(self.arguments.file):
-            if self.arguments.in_place:
-                self.create_backup()
-            self.arguments.action()
-
+        parser = self.build_parser()
+        self.arguments = parser.parse_args(args)
+        files = self.arguments.files
+
+        if self.arguments.action == 'merge':
+            return self.run_merge()
+        if self.arguments.action == 'check':
+            return self.run_check()
+
+        if (len(files) == 1 and self.arguments.jobs is None and not self.arguments.output_dir
+                and not os.path.isdir(files[0]) and not glob.has_magic(files[0])):
+            self.arguments.file = files[0]
+            if not os.path.isfile(self.arguments.file):
+                print('No such file', self.arguments.file)
+                return 1
+            self.process()
+            self.encoding_detector.save()
+            return 0
+
+        if not (self.arguments.in_place or self.arguments.output_dir):
+            parser.error('processing several files requires either --in-place or --output-dir')
+        sources = list(self.expand_files(files))
+        if not self.arguments.in_place:
+            outputs = {}
+            for path, output_name in sources:
+                other_path = outputs.setdefault(os.path.normcase(os.path.normpath(output_name)), path)
+                if other_path != path:
+                    parser.error('%s and %s would both be written to %s' % (
+                        other_path, path, os.path.join(self.arguments.output_dir, output_name)))
+        return self.run_batch(sources)
+
+    def run_merge(self):
+        """
+        Merge all input files into a single output, written on stdout
+        unless --output-dir is given.
+        """
+        for path in self.arguments.files:
+            if not os.path.isfile(path):
+                print('No such file', path)
+                return 1
+        self.arguments.file = self.arguments.files[0]
+        if self.arguments.output_dir:
+            if not os.path.isdir(self.arguments.output_dir):
+                os.makedirs(self.arguments.output_dir)
+            self.output_file_path = os.path.join(self.arguments.output_dir,
+                                                 os.path.basename(self.arguments.file))
+        try:
+            self.merge()
+        finally:
+            if getattr(self, '_output_file', sys.stdout) is not sys.stdout:
+                self._output_file.close()
+        self.encoding_detector.save()
+        return 0
+
+    def run_check(self):
+        """
+        Print the report of each input file. Return 1 if any has a problem
+        or can't be read, 0 otherwise.
+        """
+        status = 0
+        for path, _ in self.expand_files(self.arguments.files):
+            if not os.path.isfile(path):
+                print('No such file', path)
+                status = 1
+                continue
+            srt_file = SubRipFile.open(path, encoding=self.encoding_detector.detect(path),
+                                       error_handling=SubRipFile.ERROR_COLLECT)
+            report = srt_file.analyze(self.arguments.min_gap, self.arguments.max_cps)
+            self.print_report(path, srt_file, report)
+            if report.problems_count or srt_file.errors.count:
+                status = 1
+        self.encoding_detector.save()
+        return status
+
+    def print_report(self, path, srt_file, report):
+        def name(row):
+            return '#%s' % srt_file[row].index
+
+        print('%s: %d cues, %d invalid blocks, %d overlaps, %d short gaps, %d negative durations, %d over %g cps'
+              % (path, report.count, srt_file.errors.count, len(report.overlaps), len(report.short_gaps),
+                 len(report.negative_durations), len(report.cps_outliers), self.arguments.max_cps))
+        if report.count:
+            print('  durations from %.3fs (%s) to %.3fs (%s)' % (
+                report.min_duration[0] / 1000.0, name(report.min_duration[1]),
+                report.max_duration[0] / 1000.0, name(report.max_duration[1])))
+        for record in srt_file.errors:
+            print('  line %d: invalid block (%s)' % (record.line, record.error.__name__))
+        for row, other_row, overlap in report.overlaps:
+            print('  %s overlaps %s by %dms' % (name(row), name(other_row), overlap))
+        for row, next_row, gap in report.short_gaps:
+            print('  %s is followed by %s after %dms' % (name(row), name(next_row), gap))
+        for row in report.negative_durations:
+            print('  %s ends before it starts' % name(row))
+        for row, cps in report.cps_outliers:
+            print('  %s is read at %.1f cps' % (name(row), cps))
+
+    def process(self):
+        """
+        Apply the command to `self.arguments.file`.
+        """
+        if self.arguments.in_place:
+            self.create_backup()
+        try:
+            getattr(self, self.arguments.action)()
+        finally:
+            if getattr(self, '_output_file', sys.stdout) is not sys.stdout:
+                self._output_file.close()
+
+    def expand_files(self, patterns):
+        """
+        Yield a (path, output name) tuple for each file matched by `patterns`.
+        Output names are relative to the directory given, or to the leading
+        directories of a glob pattern without wildcards, so that the tree
+        is kept in --output-dir. Paths matching nothing are yielded as is so
+        they get reported.
+        """
+        for pattern in patterns:
+            if os.path.isdir(pattern):
+                for directory, dirs, names in os.walk(pattern):
+                    dirs.sort()
+                    for name in sorted(names):
+                        if name.lower().endswith(self.SOURCE_EXTENSION):
+                            path = os.path.join(directory, name)
+                            yield path, os.path.relpath(path, pattern)
+            elif glob.has_magic(pattern):
+                root = pattern
+                while glob.has_magic(root):
+                    root = os.path.dirname(root)
+                for path in sorted(glob.glob(pattern)):
+                    if os.path.isfile(path):
+                        yield path, os.path.relpath(path, root or os.curdir)
+            else:
+                yield pattern, os.path.basename(pattern)
+
+    def run_batch(self, sources):
+        """
+        Process `sources` across a pool of `--jobs` processes, reporting each
+        file on stderr as soon as it is done, then the overall throughput.
+        Return 1 if any file failed, 0 otherwise.
+        """
+        jobs = self.arguments.jobs
+        if jobs is None:
+            jobs = 1
+        elif jobs <= 0:
+            jobs = multiprocessing.cpu_count()
+        tasks = [(self.arguments, path, output_name) for path, output_name in sources]
+
+        started = time.time()
+        processed = failed = total_size = total_items = 0
+        pool = None
+        if jobs > 1 and len(tasks) > 1:
+            pool = multiprocessing.Pool(min(jobs, len(tasks)))
+            results = pool.imap_unordered(process_file, tasks)
         else:
-            print('No such file', self.arguments.file)
+            results = (process_file(task) for task in tasks)
+        try:
+            for path, error, size, items, duration, encodings in results:
+                processed += 1
+                self.encoding_detector.update(encodings)
+                if error:
+                    failed += 1
+                    print('%s: error: %s' % (path, error), file=sys.stderr)
+                    continue
+                total_size += size
+                total_items += items
+                print('%s: %d subtitles in %.3fs' % (path, items, duration), file=sys.stderr)
+        except BaseException:
+            if pool is not None:
+                pool.terminate()
+            raise
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        self.encoding_detector.save()
+        elapsed = max(time.time() - started, 1e-6)
+        print('%d files processed, %d failed, in %.2fs (%.1f files/s, %.2f MB/s, %d subtitles/s)'
+              % (processed, failed, elapsed, processed / elapsed,
+                 total_size / elapsed / 1024 / 1024, total_items / elapsed), file=sys.stderr)
+        return 1 if failed else 0
 
     def parse_time(self, time_string):
         negative = time_string.startswith('-')
@@ -158,23 +421,41 @@ class SubRipShifter(object):
         return encoding_name
 
     def shift(self):
-        self.input_file.shift(milliseconds=self.arguments.time_offset)
-        self.input_file.write_into(self.output_file)
+        items = self.read_items()
+        self.write_items(self.shift_items(items, milliseconds=self.arguments.time_offset))
 
     def rate(self):
         ratio = self.arguments.final / self.arguments.initial
-        self.input_file.shift(ratio=ratio)
-        self.input_file.write_into(self.output_file)
+        items = self.read_items()
+        self.write_items(self.shift_items(items, ratio=ratio))
+
+    @staticmethod
+    def shift_items(items, **kwargs):
+        for item in items:
+            item.shift(**kwargs)
+            yield item
 
     def split(self):
         limits = [0] + self.arguments.limits + [self.input_file[-1].end.ordinal + 1]
-        base_name, extension = os.path.splitext(self.arguments.file)
+        base_name, extension = os.path.splitext(self.output_file_path or self.arguments.file)
         for index, (start, end) in enumerate(zip(limits[:-1], limits[1:])):
             file_name = '%s.%s%s' % (base_name, index + 1, extension)
             part_file = self.input_file.slice(ends_after=start, starts_before=end)
             part_file.shift(milliseconds=-start)
             part_file.clean_indexes()
-            part_file.save(path=file_name, encoding=self.output_encoding)
+            with codecs.open(file_name, 'w', encoding=self.output_encoding) as part_output:
+                part_output.write(self.output_bom)
+                part_file.write_into(part_output)
+
+    def merge(self):
+        tracks = [SubRipFile.open(path, encoding=self.encoding_detector.detect(path),
+                                  error_handling=SubRipFile.ERROR_LOG)
+                  for path in self.arguments.files]
+        self.input_encoding = tracks[0].encoding
+        self.input_eol = tracks[0].eol
+        merged = merge(*tracks, tolerance=self.arguments.tolerance)
+        self.items_count = len(merged)
+        self.write_items(merged)
 
     def create_backup(self):
         backup_file = self.arguments.file + self.BACKUP_EXTENSION
@@ -185,24 +466,71 @@ class SubRipShifter(object):
 
     def break_lines(self):
         split_re = re.compile(r'(.{,%i})(?:\s+|$)' % self.arguments.length)
-        for item in self.input_file:
+        self.write_items(self.break_items(self.read_items(), split_re))
+
+    @staticmethod
+    def break_items(items, split_re):
+        for item in items:
             item.text = '\n'.join(split_re.split(item.text)[1::2])
-        self.input_file.write_into(self.output_file)
+            yield item
+
+    def read_items(self):
+        """
+        Open the input file and return an iterator parsing its items one at
+        a time, so that commands working item per item run in constant
+        memory.
+        """
+        source_file, self.input_encoding = SubRipFile._open_unicode_file(
+            self.arguments.file, claimed_encoding=self.detect_encoding())
+        self.input_eol = SubRipFile._guess_eol(source_file)
+        return self._iter_items(source_file)
+
+    def _iter_items(self, source_file):
+        try:
+            for item in SubRipFile.stream(source_file, error_handling=SubRipFile.ERROR_LOG):
+                self.items_count += 1
+                yield item
+        finally:
+            source_file.close()
+
+    def write_items(self, items):
+        """
+        Write each item to the output file as soon as it is produced.
+        """
+        # Opened upfront so that the output is emptied even without items
+        output_file = self.output_file
+        for chunk in SubRipFile.serialize(items, self.input_eol, chunk_size=1):
+            output_file.write(chunk)
+
+    def detect_encoding(self):
+        return self.encoding_detector.detect(self.arguments.file)
+
+    @property
+    def encoding_detector(self):
+        return get_encoding_detector(self.arguments.encoding_cache)
 
     @property
     def output_encoding(self):
-        return self.arguments.output_encoding or self.input_file.encoding
+        return self.arguments.output_encoding or self.input_encoding
+
+    @property
+    def output_bom(self):
+        """
+        Byte order mark of the input file, kept as long as its encoding is.
+        """
+        if self.arguments.output_encoding or self.input_encoding not in CODECS_BOMS:
+            return ''
+        if not SubRipFile._bom_length(self.arguments.file, self.input_encoding):
+            return ''
+        return CODECS_BOMS[self.input_encoding]
 
     @property
     def input_file(self):
         if not hasattr(self, '_source_file'):
-            with open(self.arguments.file, 'rb') as f:
-                content = f.read()
-                encoding = detect(content).get('encoding')
-                encoding = self.normalize_encoding(encoding)
-
             self._source_file = SubRipFile.open(self.arguments.file,
-                encoding=encoding, error_handling=SubRipFile.ERROR_LOG)
+                encoding=self.detect_encoding(), error_handling=SubRipFile.ERROR_LOG)
+            self.input_encoding = self._source_file.encoding
+            self.items_count = len(self._source_file)
         return self._source_file
 
     @property
@@ -210,16 +538,66 @@ class SubRipShifter(object):
         if not hasattr(self, '_output_file'):
             if self.output_file_path:
                 self._output_file = codecs.open(self.output_file_path, 'w+', encoding=self.output_encoding)
+                self._output_file.write(self.output_bom)
             else:
                 self._output_file = sys.stdout
         return self._output_file
 
-    def normalize_encoding(self, encoding):
-        return encoding.lower().replace('-', '_')
+
+_encoding_detectors = {}
+
+
+def get_encoding_detector(cache_path):
+    """
+    Return the EncodingDetector of the current process using `cache_path`.
+    """
+    if cache_path not in _encoding_detectors:
+        _encoding_detectors[cache_path] = EncodingDetector(cache_path)
+    return _encoding_detectors[cache_path]
+
+
+def process_file(task):
+    """
+    Run a command on a single file of a batch.
+
+    `task` is an (arguments, path, output name) tuple. Return a (path, error,
+    size, subtitles count, duration, detected encodings) tuple, `error` being
+    None on success. Detected encodings are handed over to the parent
+    process which saves the encoding cache once at the end.
+    """
+    arguments, path, output_name = task
+    started = time.time()
+    shifter = SubRipShifter()
+    shifter.arguments = copy(arguments)
+    shifter.arguments.file = path
+    try:
+        if not os.path.isfile(path):
+            raise IOError('No such file')
+        size = os.path.getsize(path)
+        if arguments.output_dir and not arguments.in_place:
+            output_path = os.path.join(arguments.output_dir, output_name)
+            output_directory = os.path.dirname(output_path)
+            if output_directory and not os.path.isdir(output_directory):
+                try:
+                    os.makedirs(output_directory)
+                except OSError:  # created meanwhile by another worker
+                    if not os.path.isdir(output_directory):
+                        raise
+            shifter.output_file_path = output_path
+        shifter.process()
+        items = shifter.items_count
+    except Exception as exception:
+        error = '%s: %s' % (exception.__class__.__name__, exception)
+        size = items = 0
+    else:
+        error = None
+    detector = shifter.encoding_detector
+    encodings, detector.new_entries = detector.new_entries, {}
+    return path, error, size, items, time.time() - started, encodings
 
 
 def main():
-    SubRipShifter().run(sys.argv[1:])
+    sys.exit(SubRipShifter().run(sys.argv[1:]))
 
 if __name__ == '__main__':
     main()
@@ -1,4 +1,9 @@
+import operator
+
+
 class ComparableMixin(object):
+    __slots__ = ()
+
     def _compare(self, other, method):
         try:
             return method(self._cmpkey(), other._cmpkey())
@@ -8,19 +13,19 @@ class ComparableMixin(object):
             return NotImplemented
 
     def __lt__(self, other):
-        return self._compare(other, lambda s, o: s < o)
+        return self._compare(other, operator.lt)
 
     def __le__(self, other):
-        return self._compare(other, lambda s, o: s <= o)
+        return self._compare(other, operator.le)
 
     def __eq__(self, other):
-        return self._compare(other, lambda s, o: s == o)
+        return self._compare(other, operator.eq)
 
     def __ge__(self, other):
-        return self._compare(other, lambda s, o: s >= o)
+        return self._compare(other, operator.ge)
 
     def __gt__(self, other):
-        return self._compare(other, lambda s, o: s > o)
+        return self._compare(other, operator.gt)
 
     def __ne__(self, other):
-        return self._compare(other, lambda s, o: s != o)
+        return self._compare(other, operator.ne)
@@ -15,8 +15,10 @@ from io import open as io_open
 if is_py2:
     basestring = basestring
     str = unicode
+    chr = unichr
     open = io_open
 elif is_py3:
     basestring = (str, bytes)
     str = str
+    chr = chr
     open = open
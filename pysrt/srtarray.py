@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk timing operations over integer ordinal columns.
+
+NumPy is optional: it is only imported on first use, and every operation
+but the conversion to and from NumPy arrays falls back to pure Python
+when it is not installed.
+"""
+from array import array
+
+_numpy = None
+
+
+def get_numpy(required=True):
+    """
+    get_numpy([required]) -> numpy module or None
+
+    Import NumPy on first call. Raise ImportError if it is missing and
+    `required`, return None otherwise.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    if _numpy is False:
+        if required:
+            raise ImportError('NumPy is required for array based timing '
+                              'operations')
+        return None
+    return _numpy
+
+
+def to_numpy(column):
+    """
+    Return an int64 NumPy copy of an ordinal column, either an array.array
+    or any sequence of integers.
+    """
+    numpy = get_numpy()
+    if isinstance(column, array):
+        values = numpy.frombuffer(column, dtype=column.typecode)
+        return values.astype(numpy.int64)
+    return numpy.array(column, dtype=numpy.int64).reshape(-1)
+
+
+def from_numpy(values, typecode):
+    """
+    Return the content of a NumPy integer array as an array.array of
+    `typecode`.
+    """
+    return array(typecode, values.astype(typecode).tobytes())
+
+
+def rescale(column, ratio=None, offset=0):
+    """
+    rescale(column[, ratio][, offset]) -> array.array
+
+    Return a new ordinal column where each value is multiplied by `ratio`,
+    rounded, then increased by `offset`, like SubRipTime.shift does.
+    """
+    numpy = get_numpy(required=False)
+    offset = int(offset)
+    if numpy is None:
+        if ratio is None:
+            return array(column.typecode, [o + offset for o in column])
+        return array(column.typecode,
+                     [int(round(o * ratio)) + offset for o in column])
+
+    values = to_numpy(column)
+    if ratio is not None:
+        # numpy.rint rounds half to even, like Python 3 round()
+        values = numpy.rint(values * ratio).astype(numpy.int64)
+    if offset:
+        values += offset
+    return from_numpy(values, column.typecode)
+
+
+def clip(column, minimum=None, maximum=None):
+    """
+    clip(column[, minimum][, maximum]) -> array.array
+
+    Return a new ordinal column with values limited to the given bounds.
+    """
+    numpy = get_numpy(required=False)
+    if minimum is None and maximum is None:
+        return array(column.typecode, column)
+    if numpy is None:
+        values = list(column)
+        if minimum is not None:
+            values = [max(o, minimum) for o in values]
+        if maximum is not None:
+            values = [min(o, maximum) for o in values]
+        return array(column.typecode, values)
+    values = numpy.clip(to_numpy(column), minimum, maximum)
+    return from_numpy(values, column.typecode)
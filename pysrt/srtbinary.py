@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary serialization of SubRip cues.
+
+Layout, all integers being little endian:
+
+    header      magic, version, flags, cues count, positions count,
+                string indexes count
+    eol         length prefixed UTF-8
+    encoding    length prefixed UTF-8
+    starts      int64 per cue
+    ends        int64 per cue
+    indexes     int64 per cue, 0 if the index is not an integer
+    index kinds uint8 per cue, see INDEX_* below
+    positions   uint32 position id per cue
+    strings     three tables: texts, distinct positions and non integer
+                indexes, each as uint32 character offsets followed by a
+                single UTF-8 blob
+
+Every table is read with a single struct.unpack_from call and every blob
+decoded once, then sliced.
+"""
+import struct
+
+from pysrt.srtexc import InvalidBinary
+from pysrt.compat import str
+
+MAGIC = b'PSRT'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBBIII')
+LENGTH = struct.Struct('<I')
+
+INDEX_INTEGER = 0
+INDEX_NONE = 1
+INDEX_STRING = 2
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def _pack_string(string):
+    data = string.encode('utf-8')
+    return LENGTH.pack(len(data)) + data
+
+
+def _pack_strings(strings):
+    offsets = [0]
+    offset = 0
+    for string in strings:
+        offset += len(string)
+        offsets.append(offset)
+    blob = ''.join(strings).encode('utf-8')
+    return (struct.pack('<%dI' % len(offsets), *offsets)
+            + LENGTH.pack(len(blob)) + blob)
+
+
+def dumps(rows, eol='', encoding=''):
+    """
+    dumps(rows[, eol][, encoding]) -> bytes
+
+    `rows` -> iterable of (index, start ordinal, end ordinal, text,
+        position) tuples.
+    """
+    starts = []
+    ends = []
+    indexes = []
+    kinds = []
+    texts = []
+    position_ids = []
+    positions = ['']
+    position_table = {'': 0}
+    string_indexes = []
+    for index, start, end, text, position in rows:
+        starts.append(int(start))
+        ends.append(int(end))
+        if isinstance(index, int) and INT64_MIN <= index <= INT64_MAX:
+            indexes.append(index)
+            kinds.append(INDEX_INTEGER)
+        elif index is None:
+            indexes.append(0)
+            kinds.append(INDEX_NONE)
+        else:
+            indexes.append(0)
+            kinds.append(INDEX_STRING)
+            string_indexes.append(str(index))
+        texts.append(text)
+        try:
+            position_ids.append(position_table[position])
+        except KeyError:
+            position_ids.append(len(positions))
+            position_table[position] = len(positions)
+            positions.append(position)
+
+    count = len(starts)
+    return b''.join((
+        HEADER.pack(MAGIC, VERSION, 0, count, len(positions),
+                    len(string_indexes)),
+        _pack_string(eol or ''),
+        _pack_string(encoding or ''),
+        struct.pack('<%dq' % count, *starts),
+        struct.pack('<%dq' % count, *ends),
+        struct.pack('<%dq' % count, *indexes),
+        struct.pack('<%dB' % count, *kinds),
+        struct.pack('<%dI' % count, *position_ids),
+        _pack_strings(texts),
+        _pack_strings(positions),
+        _pack_strings(string_indexes),
+    ))
+
+
+class _Reader(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, format_string):
+        values = struct.unpack_from(format_string, self.data, self.offset)
+        self.offset += struct.calcsize(format_string)
+        return values
+
+    def string(self):
+        length, = self.unpack('<I')
+        return self.blob(length)
+
+    def blob(self, length):
+        start = self.offset
+        self.offset += length
+        if self.offset > len(self.data):
+            raise InvalidBinary('Truncated data')
+        return bytes(self.data[start:self.offset]).decode('utf-8')
+
+    def strings(self, count):
+        offsets = self.unpack('<%dI' % (count + 1))
+        length, = self.unpack('<I')
+        blob = self.blob(length)
+        return [blob[offsets[i]:offsets[i + 1]] for i in range(count)]
+
+
+def loads(data):
+    """
+    loads(data) -> (eol, encoding, columns)
+
+    `columns` is an (indexes, starts, ends, texts, positions, position_ids)
+    tuple, `positions` being the table of distinct positions referenced by
+    `position_ids`, whose first entry is always ''.
+    """
+    reader = _Reader(data)
+    try:
+        (magic, version, _, count, positions_count,
+         string_indexes_count) = reader.unpack(HEADER.format)
+        if magic != MAGIC:
+            raise InvalidBinary('Not a pysrt binary file')
+        if version != VERSION:
+            raise InvalidBinary('Unsupported version: %d' % version)
+        eol = reader.string()
+        encoding = reader.string()
+        starts = reader.unpack('<%dq' % count)
+        ends = reader.unpack('<%dq' % count)
+        indexes = list(reader.unpack('<%dq' % count))
+        kinds = reader.unpack('<%dB' % count)
+        position_ids = reader.unpack('<%dI' % count)
+        texts = reader.strings(count)
+        positions = reader.strings(positions_count)
+        string_indexes = iter(reader.strings(string_indexes_count))
+    except (struct.error, UnicodeDecodeError) as error:
+        raise InvalidBinary(str(error))
+
+    for row, kind in enumerate(kinds if any(kinds) else ()):
+        if kind == INDEX_NONE:
+            indexes[row] = None
+        elif kind == INDEX_STRING:
+            indexes[row] = next(string_indexes)
+    return eol, encoding, (indexes, starts, ends, texts, positions,
+                           position_ids)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Cache of parsed SubRip files
+"""
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from pysrt import srtbinary
+
+
+class ParseCache(object):
+    """
+    ParseCache([max_size][, directory][, max_disk_size][, hash_content])
+
+    Least recently used cache of parsed files, given to SubRipFile.open.
+    Entries are compact binary dumps (see pysrt.srtbinary) kept in memory
+    and, if `directory` is set, on disk so that they survive the process
+    and are shared between processes. Each level evicts its least recently
+    used entries once their total size exceeds `max_size`, respectively
+    `max_disk_size`, bytes.
+
+    Files are identified by path, size and modification time, or by a
+    hash of their content if `hash_content` is True: files are then read
+    on every open, but neither decoded nor parsed.
+    """
+    MAX_SIZE = 64 * 1024 * 1024
+    MAX_DISK_SIZE = 512 * 1024 * 1024
+    EXTENSION = '.psrt'
+
+    def __init__(self, max_size=MAX_SIZE, directory=None,
+                 max_disk_size=MAX_DISK_SIZE, hash_content=False):
+        self.max_size = max_size
+        self.directory = directory
+        self.max_disk_size = max_disk_size
+        self.hash_content = hash_content
+        self.entries = OrderedDict()
+        self.size = 0
+        self.disk_size = None
+        self.lock = threading.Lock()
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def key(self, path, encoding=None):
+        """
+        key(path[, encoding]) -> str
+
+        Return the key of `path` opened with `encoding`.
+        """
+        digest = hashlib.sha1()
+        if self.hash_content:
+            with open(path, 'rb') as source_file:
+                for chunk in iter(lambda: source_file.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        else:
+            status = os.stat(path)
+            digest.update(repr((os.path.abspath(path), status.st_size,
+                                status.st_mtime)).encode('utf-8'))
+        digest.update(repr((encoding, srtbinary.VERSION)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        get(key) -> bytes or None
+        """
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                del self.entries[key]
+                self.entries[key] = data
+                return data
+        if not self.directory:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as entry_file:
+                data = entry_file.read()
+            os.utime(path, None)  # mark as recently used
+        except (IOError, OSError):
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """
+        put(key, data)
+        """
+        self._remember(key, data)
+        if self.directory:
+            self._write(key, data)
+
+    def discard(self, key):
+        """
+        Forget `key`, e.g. because its data could not be loaded.
+        """
+        with self.lock:
+            data = self.entries.pop(key, None)
+            if data is not None:
+                self.size -= len(data)
+        if self.directory:
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Empty the memory level of the cache.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def _remember(self, key, data):
+        if len(data) > self.max_size:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_size:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + self.EXTENSION)
+
+    def _write(self, key, data):
+        if len(data) > self.max_disk_size:
+            return
+        handle, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(handle, 'wb') as entry_file:
+            entry_file.write(data)
+        getattr(os, 'replace', os.rename)(temporary_path, self._entry_path(key))
+
+        with self.lock:
+            if self.disk_size is None:
+                self.disk_size = sum(size for _, size, _ in self._disk_entries())
+            else:
+                self.disk_size += len(data)
+            if self.disk_size > self.max_disk_size:
+                self._evict_disk()
+
+    def _disk_entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.EXTENSION):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                status = os.stat(path)
+            except OSError:  # evicted by another process
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+        return entries
+
+    def _evict_disk(self):
+        # Other processes may share the directory: start from its real size
+        entries = sorted(self._disk_entries())
+        self.disk_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.disk_size <= self.max_disk_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.disk_size -= size
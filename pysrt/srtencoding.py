@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Encoding detection for SubRip files
+"""
+import os
+import json
+import atexit
+import codecs
+
+try:
+    from chardet import UniversalDetector
+except ImportError:
+    UniversalDetector = None
+
+BOMS = ((codecs.BOM_UTF32_LE, 'utf_32_le'),
+        (codecs.BOM_UTF32_BE, 'utf_32_be'),
+        (codecs.BOM_UTF16_LE, 'utf_16_le'),
+        (codecs.BOM_UTF16_BE, 'utf_16_be'),
+        (codecs.BOM_UTF8, 'utf_8'))
+BIGGER_BOM = max(len(bom) for bom, encoding in BOMS)
+
+ENCODING_AUTO = 'auto'
+CACHE_ENVIRONMENT_VARIABLE = 'PYSRT_ENCODING_CACHE'
+
+
+def normalize_encoding(encoding):
+    return encoding.lower().replace('-', '_')
+
+
+class EncodingDetector(object):
+    """
+    EncodingDetector([cache_path][, sample_size][, chunk_size][, fallback])
+
+    Guess the encoding of files from a bounded sample of their first bytes:
+
+    - a byte order mark, if any, wins;
+    - otherwise the sample is decoded as strict UTF-8, which nearly never
+      succeeds on non ASCII text in another encoding;
+    - otherwise chardet, if installed, is fed chunk by chunk until it is
+      confident or the sample is exhausted;
+    - otherwise `fallback`, which decodes anything, is returned.
+
+    Results are cached in memory by path, size and modification time. If
+    `cache_path` is set, the cache is loaded from and saved to this JSON
+    file so that later runs skip detection of unchanged files.
+    """
+    SAMPLE_SIZE = 256 * 1024
+    CHUNK_SIZE = 16 * 1024
+    FALLBACK_ENCODING = 'latin_1'
+
+    def __init__(self, cache_path=None, sample_size=SAMPLE_SIZE,
+                 chunk_size=CHUNK_SIZE, fallback=FALLBACK_ENCODING):
+        self.cache_path = cache_path
+        self.sample_size = sample_size
+        self.chunk_size = chunk_size
+        self.fallback = fallback
+        self.cache = {}
+        self.new_entries = {}
+        if cache_path and os.path.exists(cache_path):
+            self.load()
+
+    def detect(self, path):
+        """
+        detect(path) -> encoding name
+        """
+        path = os.path.abspath(path)
+        status = os.stat(path)
+        key = [status.st_size, status.st_mtime]
+        entry = self.cache.get(path)
+        if entry is not None and entry[:2] == key:
+            return entry[2]
+
+        with open(path, 'rb') as source_file:
+            encoding = self.detect_stream(source_file)
+        self.cache[path] = self.new_entries[path] = key + [encoding]
+        return encoding
+
+    def detect_stream(self, source_file):
+        """
+        detect_stream(source_file) -> encoding name
+
+        Guess the encoding of a binary file object from its current
+        position. Read at most `sample_size` bytes.
+        """
+        sample = []
+        sample_length = 0
+        head = source_file.read(min(self.chunk_size, self.sample_size))
+        for bom, encoding in BOMS:
+            if head.startswith(bom):
+                return encoding
+
+        chunk = head
+        decoder = codecs.getincrementaldecoder('utf_8')()
+        is_utf_8 = True
+        while chunk:
+            sample.append(chunk)
+            sample_length += len(chunk)
+            if is_utf_8:
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    is_utf_8 = False
+            if sample_length >= self.sample_size:
+                break
+            chunk = source_file.read(min(self.chunk_size,
+                                         self.sample_size - sample_length))
+        else:
+            # The whole file is in the sample: it must not end in the middle
+            # of a character.
+            if is_utf_8:
+                try:
+                    decoder.decode(b'', True)
+                except UnicodeDecodeError:
+                    is_utf_8 = False
+        if is_utf_8:
+            return 'utf_8'
+        return self.detect_chunks(sample)
+
+    def detect_chunks(self, chunks):
+        """
+        Ask chardet about `chunks`, stopping as soon as it is confident.
+        """
+        if UniversalDetector is None:
+            return self.fallback
+        detector = UniversalDetector()
+        for chunk in chunks:
+            detector.feed(chunk)
+            if detector.done:
+                break
+        detector.close()
+        encoding = detector.result.get('encoding')
+        if not encoding:
+            return self.fallback
+        encoding = normalize_encoding(encoding)
+        return 'utf_8' if encoding == 'ascii' else encoding
+
+    def update(self, entries):
+        """
+        Merge cache entries detected elsewhere, e.g. in another process.
+        """
+        self.cache.update(entries)
+        self.new_entries.update(entries)
+
+    def load(self):
+        with open(self.cache_path) as cache_file:
+            try:
+                self.cache.update(json.load(cache_file))
+            except ValueError:  # corrupted, it will be overwritten
+                pass
+
+    def save(self):
+        """
+        Write the cache to `cache_path`, if any and if anything changed.
+        """
+        if not self.cache_path or not self.new_entries:
+            return
+        cache = {}
+        if os.path.exists(self.cache_path):
+            # Keep entries saved meanwhile by concurrent runs
+            with open(self.cache_path) as cache_file:
+                try:
+                    cache = json.load(cache_file)
+                except ValueError:
+                    pass
+        cache.update(self.new_entries)
+        temporary_path = '%s.%d.tmp' % (self.cache_path, os.getpid())
+        with open(temporary_path, 'w') as cache_file:
+            json.dump(cache, cache_file)
+        getattr(os, 'replace', os.rename)(temporary_path, self.cache_path)
+        self.new_entries = {}
+
+
+# Created on first use, so that importing pysrt has no side effect
+default_detector = None
+
+
+def detect(path):
+    """
+    detect(path) -> encoding name
+
+    Guess the encoding of `path` with the default EncodingDetector, whose
+    cache is persisted in the file named by the PYSRT_ENCODING_CACHE
+    environment variable, if set.
+    """
+    global default_detector
+    if default_detector is None:
+        default_detector = EncodingDetector(
+            cache_path=os.environ.get(CACHE_ENVIRONMENT_VARIABLE))
+        atexit.register(default_detector.save)
+    return default_detector.detect(path)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Compact records of invalid blocks, collected by SubRipFile.ERROR_COLLECT
+"""
+import codecs
+from collections import namedtuple
+
+# line -> number of the first line of the block, starting at 1
+# offset -> byte offset of the block in the encoded source
+# error -> the exception class, e.g. InvalidTimeString
+ErrorRecord = namedtuple('ErrorRecord', ('line', 'offset', 'error'))
+
+
+class SubRipErrors(list):
+    """
+    SubRipErrors([max_errors][, encoding][, offset][, line])
+
+    List of ErrorRecord filled by parsers running with ERROR_COLLECT. No
+    exception is kept around, only its class and where the block is.
+
+    max_errors -> int: records kept at most, further errors only being
+        counted in `dropped`. Unlimited if None.
+    encoding -> str: encoding of the source, byte offsets are computed
+        with it.
+    offset -> int: byte offset of the first line, e.g. after a byte order
+        mark stripped before decoding.
+    line -> int: number of lines before the first one.
+    """
+
+    # Tracked lines are only encoded, to compute offsets, when an error is
+    # recorded or about once that many of them are kept.
+    PENDING_LINES = 1024
+
+    def __init__(self, max_errors=None, encoding='utf-8', offset=0, line=0):
+        super(SubRipErrors, self).__init__()
+        self.max_errors = max_errors
+        self.encoding = encoding
+        self.offset = offset
+        self.line = line
+        self.dropped = 0
+        self.block_line = None
+        self.block_offset = None
+        self._encoder = None
+        # number of lines, and bytes, before the first pending line
+        self._line = line
+        self._offset = offset
+        self._pending = []
+        self._text_lines = None
+        self._text_line = 0
+        self._position = 0
+
+    @property
+    def full(self):
+        return self.max_errors is not None and len(self) >= self.max_errors
+
+    @property
+    def count(self):
+        """
+        Total number of errors, including dropped ones.
+        """
+        return len(self) + self.dropped
+
+    def add(self, error):
+        """
+        Record `error`, an exception or its class, as found in the current
+        block.
+        """
+        if self.full:
+            self.dropped += 1
+            return
+        if not isinstance(error, type):
+            error = type(error)
+        self.append(ErrorRecord(self.block_line, self._get_block_offset(),
+                                error))
+
+    def part(self, line, offset):
+        """
+        part(line, offset) -> SubRipErrors
+
+        Return an empty SubRipErrors for the part of the source starting
+        `line` lines and `offset` bytes after the start of this one.
+        """
+        return self.__class__(self.max_errors, self.encoding,
+                              self.offset + offset, self.line + line)
+
+    def update(self, other):
+        """
+        Append the records of another SubRipErrors, e.g. filled from a
+        later part of the source, within the `max_errors` limit.
+        """
+        for record in other:
+            if self.full:
+                self.dropped += 1
+            else:
+                self.append(record)
+        self.dropped += other.dropped
+
+    def track(self, lines):
+        """
+        track(lines) -> iterator
+
+        Yield `lines`, the decoded source lines, keeping those of the last
+        blocks until `mark()` tells which one is invalid. Successive calls
+        carry on where the previous one stopped.
+        """
+        pending = self._pending
+        limit = len(pending) + self.PENDING_LINES
+        for line in lines:
+            if len(pending) >= limit:
+                limit = self._flush() + self.PENDING_LINES
+            pending.append(line)
+            yield line
+
+    def mark(self, line):
+        """
+        Set the current block as starting at `line` of the tracked lines.
+        Its offset is only computed if an error is recorded.
+        """
+        self.block_line = line
+        self.block_offset = None
+
+    def _flush(self):
+        """
+        Encode pending lines up to the last blank one, the lines after it
+        being those of a block which may still be marked. Return how many
+        lines are left pending.
+        """
+        pending = self._pending
+        for count in range(len(pending), 0, -1):
+            if not pending[count - 1].strip():
+                self._skip(count)
+                break
+        return len(pending)
+
+    def _skip(self, count):
+        pending = self._pending
+        self._line += count
+        self._offset += len(self._get_encoder().encode(
+            ''.join(pending[:count])))
+        del pending[:count]
+
+    def _get_block_offset(self):
+        if self.block_offset is None:
+            self._skip(self.block_line - 1 - self._line)
+            self.block_offset = self._offset
+        return self.block_offset
+
+    def _get_encoder(self):
+        if self._encoder is None:
+            self._encoder = codecs.getincrementalencoder(
+                self.encoding or 'utf-8')()
+        return self._encoder
+
+    def locate(self, text, line, position=None):
+        """
+        Set the current block as starting at `line` of `text`, the whole
+        decoded source, and at character `position` if known. Blocks must
+        be located in increasing order.
+        """
+        if position is not None:
+            chunk = text[self._position:position]
+            self._position = position
+        else:
+            if self._text_lines is None:
+                self._text_lines = text.splitlines(True)
+            start = self._text_line
+            self._text_line += line - 1 - self._line
+            chunk = ''.join(self._text_lines[start:self._text_line])
+        self._offset += len(self._get_encoder().encode(chunk))
+        self._line = line - 1
+        self.block_line = line
+        self.block_offset = self._offset
+
+    def __getstate__(self):
+        # Only records are worth sending back from parallel workers, and
+        # encoders can't be pickled everywhere.
+        state = self.__dict__.copy()
+        state.update(_encoder=None, _pending=[], _text_lines=None)
+        return state
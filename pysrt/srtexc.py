@@ -29,3 +29,10 @@ class InvalidIndex(InvalidItem):
     Raised when parser fail to parse a sub title index
     """
     pass
+
+
+class InvalidBinary(Error):
+    """
+    Raised when loading data which is not a valid pysrt binary dump
+    """
+    pass
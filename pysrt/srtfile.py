@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import io
 import os
 import sys
 import codecs
@@ -9,19 +10,23 @@ except ImportError:
     from UserList import UserList
 
 from itertools import chain
-from copy import copy
+from functools import partial
 
-from pysrt.srtexc import Error
-from pysrt.srtitem import SubRipItem
-from pysrt.compat import str
+from pysrt.srtexc import Error, InvalidBinary
+from pysrt.srtitem import SubRipItem, LazySubRipItem, TextMetrics
+from pysrt.srttime import SubRipTime
+from pysrt.srtindex import IntervalIndex
+from pysrt.srtstorage import ColumnarStorage
+from pysrt.srtmmap import MappedStorage
+from pysrt import srtparser, srtarray, srtencoding, srtbinary, srtparallel
+from pysrt.srtencoding import BOMS, BIGGER_BOM
+from pysrt.srterrors import SubRipErrors
+from pysrt.srtreport import SubRipReport
+from pysrt.compat import str, basestring
 
-BOMS = ((codecs.BOM_UTF32_LE, 'utf_32_le'),
-        (codecs.BOM_UTF32_BE, 'utf_32_be'),
-        (codecs.BOM_UTF16_LE, 'utf_16_le'),
-        (codecs.BOM_UTF16_BE, 'utf_16_be'),
-        (codecs.BOM_UTF8, 'utf_8'))
 CODECS_BOMS = dict((codec, str(bom, codec)) for bom, codec in BOMS)
-BIGGER_BOM = max(len(bom) for bom, encoding in BOMS)
+# Number of items serialized in each string written by write_into and save
+WRITE_CHUNK_SIZE = 512
 
 
 class SubRipFile(UserList, object):
@@ -30,7 +35,7 @@ class SubRipFile(UserList, object):
 
     Provide a pure Python mapping on all metadata.
 
-    SubRipFile(items, eol, path, encoding)
+    SubRipFile(items, eol, path, encoding, storage)
 
     items -> list of SubRipItem. Default to [].
     eol -> str: end of line character. Default to linesep used in opened file
@@ -38,18 +43,43 @@ class SubRipFile(UserList, object):
     path -> str: path where file will be saved. To open an existent file see
         SubRipFile.open.
     encoding -> str: encoding used at file save. Default to utf-8.
+    storage -> str: either SubRipFile.STORAGE_LIST (the default) to keep a
+        list of SubRipItem, or SubRipFile.STORAGE_COLUMNAR to keep cues in
+        compact arrays and materialize items only on access.
     """
     ERROR_PASS = 0
     ERROR_LOG = 1
     ERROR_RAISE = 2
+    ERROR_COLLECT = 3
+
+    STORAGE_LIST = 'list'
+    STORAGE_COLUMNAR = 'columnar'
+
+    PARSER_TOLERANT = 'tolerant'
+    PARSER_FAST = 'fast'
 
     DEFAULT_ENCODING = 'utf_8'
+    ENCODING_AUTO = srtencoding.ENCODING_AUTO
 
-    def __init__(self, items=None, eol=None, path=None, encoding='utf-8'):
-        UserList.__init__(self, items or [])
+    def __init__(self, items=None, eol=None, path=None, encoding='utf-8',
+                 storage=STORAGE_LIST):
+        self._interval_index = None
+        self._index_ordinals = None
+        # Timing changes counter, shared with the clones returned by slice()
+        # since they hold the same items
+        self._timings_version = [0]
+        self._index_version = 0
+        if storage == self.STORAGE_COLUMNAR:
+            UserList.__init__(self)
+            self.data = ColumnarStorage(items or [])
+        elif storage in (None, self.STORAGE_LIST):
+            UserList.__init__(self, items or [])
+        else:
+            raise ValueError('Unknown storage: %r' % (storage, ))
         self._eol = eol
         self.path = path
         self.encoding = encoding
+        self.errors = SubRipErrors(encoding=encoding)
 
     def _get_eol(self):
         return self._eol or os.linesep
@@ -60,10 +90,10 @@ class SubRipFile(UserList, object):
     eol = property(_get_eol, _set_eol)
 
     def slice(self, starts_before=None, starts_after=None, ends_before=None,
-              ends_after=None):
+              ends_after=None, frozen=False):
         """
-        slice([starts_before][, starts_after][, ends_before][, ends_after]) \
--> SubRipFile clone
+        slice([starts_before][, starts_after][, ends_before][, ends_after]\
+[, frozen]) -> SubRipFile clone
 
         All arguments are optional, and should be coercible to SubRipTime
         object.
@@ -75,26 +105,31 @@ class SubRipFile(UserList, object):
         subtitles. So if you shift this returned set, subs contained in the
         original SubRipFile instance will be altered too.
 
+        Queries are answered by a time index built on first use and dropped
+        on every change made through the SubRipFile, or through any clone
+        sharing its items. Items timing is still compared with the one the
+        index was built from on each query, so that items altered directly
+        are found too. Pass `frozen=True` to skip this O(n) check when
+        querying many times a file whose items are not altered directly.
+
         Example:
             >>> subs.slice(ends_after={'seconds': 20}).shift(seconds=2)
         """
-        clone = copy(self)
+        bounds = self._coerce_bounds(starts_before, starts_after,
+                                     ends_before, ends_after)
+        positions = self._get_interval_index(frozen).query(*bounds)
 
-        if starts_before:
-            clone.data = (i for i in clone.data if i.start < starts_before)
-        if starts_after:
-            clone.data = (i for i in clone.data if i.start > starts_after)
-        if ends_before:
-            clone.data = (i for i in clone.data if i.end < ends_before)
-        if ends_after:
-            clone.data = (i for i in clone.data if i.end > ends_after)
-
-        clone.data = list(clone.data)
+        # Not copy(), which would copy data first
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._interval_index = clone._index_ordinals = None
+        data = self.data
+        clone.data = [data[position] for position in positions]
         return clone
 
-    def at(self, timestamp=None, **kwargs):
+    def at(self, timestamp=None, frozen=False, **kwargs):
         """
-        at(timestamp) -> SubRipFile clone
+        at(timestamp[, frozen]) -> SubRipFile clone
 
         timestamp argument should be coercible to SubRipFile object.
 
@@ -104,9 +139,11 @@ class SubRipFile(UserList, object):
         Example:
             >>> subs.at((0, 0, 20, 0)).shift(seconds=2)
             >>> subs.at(seconds=20).shift(seconds=2)
+            >>> for frame in range(frames):
+            ...     subs.at(milliseconds=frame * 40, frozen=True)
         """
         time = timestamp or kwargs
-        return self.slice(starts_before=time, ends_after=time)
+        return self.slice(starts_before=time, ends_after=time, frozen=frozen)
 
     def shift(self, *args, **kwargs):
         """shift(hours, minutes, seconds, milliseconds, ratio)
@@ -121,9 +158,171 @@ class SubRipFile(UserList, object):
         All "time" arguments are optional and have a default value of 0.
         Example to delay all subs from 2 seconds and half
         >>> subs.shift(seconds=2, milliseconds=500)
+
+        Files using SubRipFile.STORAGE_COLUMNAR are shifted in bulk, with
+        NumPy if it is installed.
+        """
+        self.invalidate_index()
+        ratio = kwargs.pop('ratio', None)
+        offset = SubRipTime(*args, **kwargs).ordinal
+        data = self.data
+        if isinstance(data, ColumnarStorage):
+            data.starts = srtarray.rescale(data.starts, ratio, offset)
+            data.ends = srtarray.rescale(data.ends, ratio, offset)
+            return
+        for item in data:
+            for time in (item.start, item.end):
+                if ratio is not None:
+                    time.ordinal = int(round(time.ordinal * ratio))
+                time.ordinal += offset
+
+    def clamp(self, minimum=0, maximum=None):
+        """
+        clamp([minimum][, maximum])
+
+        Bring `start` and `end` attributes of each items back between
+        `minimum` and `maximum`, which should be coercible to SubRipTime
+        object or None.
+
+        Example to get rid of negative times after a backward shift:
+        >>> subs.shift(seconds=-5)
+        >>> subs.clamp()
+        """
+        self.invalidate_index()
+        minimum, maximum = [None if bound is None
+                            else SubRipTime.coerce(bound).ordinal
+                            for bound in (minimum, maximum)]
+        data = self.data
+        if isinstance(data, ColumnarStorage):
+            data.starts = srtarray.clip(data.starts, minimum, maximum)
+            data.ends = srtarray.clip(data.ends, minimum, maximum)
+            return
+        for item in data:
+            for time in (item.start, item.end):
+                if minimum is not None and time.ordinal < minimum:
+                    time.ordinal = minimum
+                if maximum is not None and time.ordinal > maximum:
+                    time.ordinal = maximum
+
+    def timings_array(self):
+        """
+        timings_array() -> numpy.ndarray
+
+        Return a (n, 2) int64 NumPy array holding start and end ordinals of
+        each item. Changes made to the array are not reflected on items
+        until it is given back to `apply_timings()`.
+
+        Requires NumPy.
+
+        Example to convert subtitles from 23.976 fps to 25 fps:
+        >>> timings = subs.timings_array()
+        >>> subs.apply_timings(numpy.rint(timings * (25 / 23.976)))
+        """
+        numpy = srtarray.get_numpy()
+        starts, ends = self._ordinals()
+        timings = numpy.empty((len(starts), 2), dtype=numpy.int64)
+        timings[:, 0] = srtarray.to_numpy(starts)
+        timings[:, 1] = srtarray.to_numpy(ends)
+        return timings
+
+    def apply_timings(self, timings):
+        """
+        apply_timings(timings)
+
+        Set start and end ordinals of each item from a (n, 2) array like
+        the one returned by `timings_array()`. Float values are rounded.
+
+        Requires NumPy.
+        """
+        numpy = srtarray.get_numpy()
+        timings = numpy.asarray(timings)
+        if timings.shape != (len(self.data), 2):
+            raise ValueError('Expected timings of shape (%d, 2), got %r'
+                             % (len(self.data), timings.shape))
+        if timings.dtype.kind == 'f':
+            timings = numpy.rint(timings)
+        timings = timings.astype(numpy.int64)
+
+        self.invalidate_index()
+        data = self.data
+        if isinstance(data, ColumnarStorage):
+            data.starts = srtarray.from_numpy(timings[:, 0],
+                                              data.starts.typecode)
+            data.ends = srtarray.from_numpy(timings[:, 1], data.ends.typecode)
+            return
+        for item, (start, end) in zip(data, timings.tolist()):
+            item.start.ordinal = start
+            item.end.ordinal = end
+
+    def slice_mask(self, starts_before=None, starts_after=None,
+                   ends_before=None, ends_after=None):
+        """
+        slice_mask([starts_before][, starts_after][, ends_before][, ends_after]) \
+-> numpy.ndarray
+
+        Same as `slice()`, but return a boolean NumPy array telling for
+        each item whether it matches given time constraints. Masks can be
+        combined with `&`, `|` and `~` before being used on
+        `timings_array()`.
+
+        Requires NumPy.
+        """
+        numpy = srtarray.get_numpy()
+        starts_before, starts_after, ends_before, ends_after = \
+            self._coerce_bounds(starts_before, starts_after, ends_before,
+                                ends_after)
+        timings = self.timings_array()
+        starts, ends = timings[:, 0], timings[:, 1]
+        mask = numpy.ones(len(timings), dtype=bool)
+        if starts_before is not None:
+            mask &= starts < starts_before
+        if starts_after is not None:
+            mask &= starts > starts_after
+        if ends_before is not None:
+            mask &= ends < ends_before
+        if ends_after is not None:
+            mask &= ends > ends_after
+        return mask
+
+    def invalidate_index(self):
+        """
+        invalidate_index()
+
+        Drop the time index used by `slice()` and `at()`, as well as the
+        ones of clones sharing the same items. Only needed before frozen
+        queries, after changing items start or end without going through
+        the SubRipFile.
+        """
+        self._interval_index = self._index_ordinals = None
+        self._timings_version[0] += 1
+
+    def _get_interval_index(self, frozen=False):
+        index = self._interval_index
+        version = self._timings_version[0]
+        stale = (index is None or len(index) != len(self.data)
+                 or self._index_version != version)
+        if stale or not frozen:
+            ordinals = self._ordinals()
+            if stale or ordinals != self._index_ordinals:
+                index = self._interval_index = IntervalIndex(*ordinals)
+                # Copied since columns are the live arrays of the storage
+                self._index_ordinals = tuple(column[:] for column in ordinals)
+                self._index_version = version
+        return index
+
+    @staticmethod
+    def _coerce_bounds(*bounds):
+        return [SubRipTime.coerce(bound).ordinal if bound else None
+                for bound in bounds]
+
+    def _ordinals(self):
+        """
+        Return start and end ordinals of all items as two sequences.
         """
-        for item in self:
-            item.shift(*args, **kwargs)
+        if isinstance(self.data, ColumnarStorage):
+            return self.data.starts, self.data.ends
+        return ([item.start.ordinal for item in self.data],
+                [item.end.ordinal for item in self.data])
 
     def clean_indexes(self):
         """
@@ -132,26 +331,168 @@ class SubRipFile(UserList, object):
         Sort subs and reset their index attribute. Should be called after
         destructive operations like split or such.
         """
-        self.sort()
+        if isinstance(self.data, list):
+            self.sort(key=SubRipItem.sort_key)
+        else:
+            self.sort()  # storages sort on their own timing columns
         for index, item in enumerate(self):
             item.index = index + 1
 
+    def analyze(self, min_gap=SubRipReport.MIN_GAP,
+                max_cps=SubRipReport.MAX_CPS):
+        """
+        analyze([min_gap][, max_cps]) -> SubRipReport
+
+        Check timings in a single pass over cues sorted by start: overlaps,
+        gaps shorter than `min_gap` milliseconds, negative durations,
+        shortest and longest durations, and cues read faster than `max_cps`
+        characters per second (not checked if None). See
+        pysrt.srtreport.
+
+        Example:
+            >>> report = subs.analyze(max_cps=20)
+            >>> for row, other_row, overlap in report.overlaps:
+            ...     print(subs[row].index, subs[other_row].index, overlap)
+        """
+        starts, ends = self._ordinals()
+        speeds = None
+        if max_cps is not None:
+            speeds = [metrics.characters_per_second
+                      for metrics in self.text_metrics()]
+        return SubRipReport.analyze(starts, ends, speeds, min_gap, max_cps)
+
+    def text_metrics(self):
+        """
+        text_metrics() -> list of TextMetrics
+
+        Return the text without tags, characters and lines counts, and
+        characters per second of every item, in a single pass. Files using
+        SubRipFile.STORAGE_COLUMNAR are measured from their columns without
+        building any item, others through the cache of each item, see
+        SubRipItem.text_metrics.
+        """
+        data = self.data
+        if isinstance(data, ColumnarStorage):
+            measure = SubRipItem.measure_text
+            rows = ((measure(text), end - start) for text, start, end
+                    in zip(data.texts, data.starts, data.ends))
+        else:
+            rows = ((item._get_text_cache()[1:],
+                     item.end.ordinal - item.start.ordinal) for item in data)
+        return [TextMetrics(plain_text, characters, lines,
+                            characters / (duration / 1000.0) if duration
+                            else 0.0)
+                for (plain_text, characters, lines), duration in rows]
+
     @property
     def text(self):
         return '\n'.join(i.text for i in self)
 
     @classmethod
-    def open(cls, path='', encoding=None, error_handling=ERROR_PASS):
+    def open(cls, path='', encoding=None, error_handling=ERROR_PASS,
+             storage=STORAGE_LIST, parser=PARSER_TOLERANT, lazy=False,
+             cache=None, stats=None, max_errors=None, workers=None):
         """
         open([path, [encoding]])
 
         If you do not provide any encoding, it can be detected if the file
         contain a bit order mark, unless it is set to utf-8 as default.
+        Use SubRipFile.ENCODING_AUTO to also guess encodings of files without
+        byte order mark, see pysrt.srtencoding.
+
+        `storage` -> see SubRipFile. Use SubRipFile.STORAGE_COLUMNAR to lower
+            memory usage of files kept around for a long time.
+        `parser`, `lazy` -> see SubRipFile.stream.
+        `cache` -> a pysrt.srtcache.ParseCache. Files found in it are loaded
+            from their binary dump without being decoded nor parsed, so
+            parsing errors of cached files are only reported once.
+        `stats` -> a pysrt.SubRipStats recording bytes read and parsing
+            counters and timings, see SubRipFile.stream.
+        `max_errors` -> with SubRipFile.ERROR_COLLECT, maximum number of
+            records kept in the `errors` attribute of the returned file.
+        `workers` -> see SubRipFile.read.
         """
+        if cache is not None:
+            key = cache.key(path, encoding)
+            data = cache.get(key)
+            if data is not None:
+                try:
+                    return cls.from_binary(data, path=path, storage=storage)
+                except InvalidBinary:
+                    cache.discard(key)
+
         source_file, encoding = cls._open_unicode_file(path, claimed_encoding=encoding)
-        new_file = cls(path=path, encoding=encoding)
-        new_file.read(source_file, error_handling=error_handling)
+        new_file = cls(path=path, encoding=encoding, storage=storage)
+        if error_handling == cls.ERROR_COLLECT:
+            new_file.errors = SubRipErrors(max_errors, encoding,
+                                           cls._bom_length(path, encoding))
+        new_file.read(source_file, error_handling=error_handling,
+                      parser=parser, lazy=lazy, stats=stats, workers=workers)
+        if stats is not None:
+            stats.bytes_read += source_file.tell()
         source_file.close()
+        if cache is not None:
+            cache.put(key, new_file.to_binary())
+        return new_file
+
+    @classmethod
+    def open_mmap(cls, path, encoding=None, error_handling=ERROR_PASS):
+        """
+        open_mmap(path[, encoding][, error_handling]) -> SubRipFile
+
+        Memory map `path` and only locate its cues upfront: each cue is
+        decoded and parsed the first time it is accessed, which makes
+        opening huge files cheap when only a few cues are needed.
+
+        Encoding is detected like in `open()`.
+        """
+        if error_handling == cls.ERROR_COLLECT:
+            raise ValueError('open_mmap does not support ERROR_COLLECT')
+        storage, eol = MappedStorage.open(path, encoding=encoding,
+                                          error_handling=error_handling)
+        new_file = cls(eol=eol, path=path, encoding=storage.encoding)
+        new_file.data = storage
+        return new_file
+
+    @classmethod
+    def open_range(cls, path, start=None, end=None, encoding=None,
+                   error_handling=ERROR_PASS, index=None):
+        """
+        open_range(path[, start][, end][, encoding][, error_handling]
+                   [, index]) -> SubRipFile
+
+        Read the items of `path` ending after `start` and starting before
+        `end`, like `slice(ends_after=start, starts_before=end)` would, but
+        only decoding and parsing the part of the file holding them.
+
+        Byte offsets of cues are looked up in `index`, a
+        pysrt.srtoffsets.OffsetIndex. If None, it is loaded from its
+        sidecar file next to `path`, which is built on the first call and
+        again whenever `path` changes. See OffsetIndex.for_file.
+
+        Example:
+            >>> subs = SubRipFile.open_range('movie.srt', {'minutes': 10},
+            ...                              {'minutes': 12})
+        """
+        from pysrt.srtoffsets import OffsetIndex
+        if error_handling == cls.ERROR_COLLECT:
+            raise ValueError('open_range does not support ERROR_COLLECT')
+        if index is None:
+            index = OffsetIndex.for_file(path, encoding)
+        start, end = [None if bound is None else SubRipTime.coerce(bound).ordinal
+                      for bound in (start, end)]
+
+        new_file = cls(eol=index.eol, path=path, encoding=index.encoding)
+        with open(path, 'rb') as source_file:
+            for span_start, span_end in index.spans(start, end):
+                source_file.seek(span_start)
+                source = source_file.read(span_end - span_start).decode(
+                    index.encoding)
+                for item in cls.stream(source.splitlines(True),
+                                       error_handling=error_handling):
+                    if (start is None or item.end.ordinal > start) and \
+                            (end is None or item.start.ordinal < end):
+                        new_file.data.append(item)
         return new_file
 
     @classmethod
@@ -161,36 +502,93 @@ class SubRipFile(UserList, object):
 
         `source` -> a unicode instance or at least a str instance encoded with
         `sys.getdefaultencoding()`
+        `parser` -> see SubRipFile.stream. With SubRipFile.PARSER_FAST,
+            `source` is parsed as is, without being split into lines.
         """
         error_handling = kwargs.pop('error_handling', None)
+        parser = kwargs.pop('parser', cls.PARSER_TOLERANT)
+        lazy = kwargs.pop('lazy', False)
+        stats = kwargs.pop('stats', None)
+        max_errors = kwargs.pop('max_errors', None)
+        workers = kwargs.pop('workers', None)
         new_file = cls(**kwargs)
-        new_file.read(source.splitlines(True), error_handling=error_handling)
+        if error_handling == cls.ERROR_COLLECT:
+            new_file.errors = SubRipErrors(max_errors, new_file.encoding)
+        if workers is not None:
+            # Split by the workers, not upfront
+            source = io.StringIO(source, newline='')
+        elif parser != cls.PARSER_FAST:
+            source = source.splitlines(True)
+        new_file.read(source, error_handling=error_handling, parser=parser,
+                      lazy=lazy, stats=stats, workers=workers)
         return new_file
 
-    def read(self, source_file, error_handling=ERROR_PASS):
+    def read(self, source_file, error_handling=ERROR_PASS,
+             parser=PARSER_TOLERANT, lazy=False, stats=None, workers=None):
         """
-        read(source_file, [error_handling])
+        read(source_file, [error_handling][, parser][, lazy][, stats]
+             [, workers])
 
         This method parse subtitles contained in `source_file` and append them
         to the current instance.
 
         `source_file` -> Any iterable that yield unicode strings, like a file
             opened with `codecs.open()` or an array of unicode.
+
+        With SubRipFile.ERROR_COLLECT, invalid blocks are recorded in the
+        `errors` attribute, see pysrt.srterrors.
+
+        `workers` -> if not None, the whole source is read at once then
+            parsed by that many processes, one per CPU if 0. Items and
+            errors are the same as without, only worth it for sources of
+            several megabytes. `lazy` is not supported. See
+            pysrt.srtparallel.
         """
         self.eol = self._guess_eol(source_file)
-        self.extend(self.stream(source_file, error_handling=error_handling))
+        errors = self.errors if error_handling == self.ERROR_COLLECT else None
+        if workers is None:
+            items = self.stream(source_file, error_handling=error_handling,
+                                parser=parser, lazy=lazy, stats=stats,
+                                errors=errors)
+        elif lazy:
+            raise ValueError('lazy items can not be parsed in parallel')
+        else:
+            items = srtparallel.parse(source_file, workers, error_handling,
+                                      parser, stats, errors)
+        self.extend(items)
         return self
 
     @classmethod
-    def stream(cls, source_file, error_handling=ERROR_PASS):
+    def stream(cls, source_file, error_handling=ERROR_PASS,
+               parser=PARSER_TOLERANT, lazy=False, stats=None, errors=None):
         """
-        stream(source_file, [error_handling])
+        stream(source_file, [error_handling][, parser][, lazy][, stats]
+               [, errors])
 
         This method yield SubRipItem instances a soon as they have been parsed
         without storing them. It is a kind of SAX parser for .srt files.
 
         `source_file` -> Any iterable that yield unicode strings, like a file
             opened with `codecs.open()` or an array of unicode.
+        `parser` -> SubRipFile.PARSER_TOLERANT (the default) parses each
+            cue line by line. SubRipFile.PARSER_FAST reads the whole source
+            at once and extracts well formed cues in a single regex pass,
+            falling back to the tolerant parser for malformed ones. Both
+            yield the same items, the latter is much faster on big files.
+            It reads file objects, like those of open(), and strings given
+            to from_string() at once. Other iterables of lines have to be
+            joined first, which costs a bit of its gain.
+        `lazy` -> if True, yield LazySubRipItem instances: start and end
+            are parsed right away, but text and position are only built
+            from the source lines when first read. Much cheaper when only
+            timings are needed.
+        `error_handling` -> SubRipFile.ERROR_PASS (the default) skips
+            invalid blocks, ERROR_LOG reports them on stderr, ERROR_RAISE
+            raises an exception and ERROR_COLLECT records them in `errors`.
+        `stats` -> a pysrt.SubRipStats to which lines, cues, errors and
+            decoding, parsing and building times are added.
+        `errors` -> a pysrt.srterrors.SubRipErrors, required by
+            ERROR_COLLECT.
 
         Example:
             >>> import pysrt
@@ -200,57 +598,293 @@ class SubRipFile(UserList, object):
             ...     sub.text += "\nHello !"
             ...     print unicode(sub)
         """
+        if error_handling == cls.ERROR_COLLECT:
+            if errors is None:
+                raise ValueError('ERROR_COLLECT requires an errors list')
+        else:
+            errors = None
+        if parser == cls.PARSER_FAST:
+            return cls._stream_fast(source_file, error_handling, lazy, stats,
+                                    errors)
+        if parser in (None, cls.PARSER_TOLERANT):
+            return cls._stream_tolerant(source_file, error_handling, lazy,
+                                        stats, errors)
+        raise ValueError('Unknown parser: %r' % (parser, ))
+
+    @classmethod
+    def _stream_tolerant(cls, source_file, error_handling, lazy=False,
+                         stats=None, errors=None, line_offset=0):
+        # `line_offset` -> number of lines before `source_file` when it is
+        # part of a bigger source, added to reported line numbers.
+        if stats is not None:
+            for item in cls._stream_tolerant_stats(source_file, error_handling,
+                                                   lazy, stats, errors,
+                                                   line_offset):
+                yield item
+            return
+        if errors is not None:
+            source_file = errors.track(source_file)
+        item_class = LazySubRipItem if lazy else SubRipItem
         string_buffer = []
-        for index, line in enumerate(chain(source_file, '\n')):
+        for index, line in enumerate(chain(source_file, '\n'), line_offset):
             if line.strip():
                 string_buffer.append(line)
             else:
                 source = string_buffer
                 string_buffer = []
                 if source and all(source):
-                    try:
-                        yield SubRipItem.from_lines(source)
-                    except Error as error:
-                        error.args += (''.join(source), )
-                        cls._handle_error(error, error_handling, index)
+                    item = cls._parse_block(item_class, source,
+                                            error_handling, index,
+                                            errors=errors)
+                    if item is not None:
+                        yield item
+
+    @classmethod
+    def _stream_tolerant_stats(cls, source_file, error_handling, lazy, stats,
+                               errors, line_offset=0):
+        # Same as _stream_tolerant, timing each step
+        item_class = LazySubRipItem if lazy else SubRipItem
+        clock = stats.clock
+        decode_time = stats.decode_time
+        lines = stats.timed(source_file, 'decode_time')
+        tracked_lines = lines if errors is None else errors.track(lines)
+        busy = 0.0
+        index = line_offset
+        string_buffer = []
+        resumed = clock()
+        try:
+            for index, line in enumerate(chain(tracked_lines, '\n'),
+                                         line_offset):
+                if line.strip():
+                    string_buffer.append(line)
+                else:
+                    source = string_buffer
+                    string_buffer = []
+                    if source and all(source):
+                        started = clock()
+                        busy += started - resumed
+                        item = cls._parse_block(item_class, source,
+                                                error_handling, index, stats,
+                                                errors)
+                        resumed = clock()
+                        stats.build_time += resumed - started
+                        if item is not None:
+                            stats.cues += 1
+                            yield item
+                            resumed = clock()
+            busy += clock() - resumed
+        finally:
+            lines.close()
+            stats.lines += index - line_offset
+            # Time spent in the loop, but neither decoding nor building
+            stats.parse_time += busy - (stats.decode_time - decode_time)
 
-    def save(self, path=None, encoding=None, eol=None):
+    @classmethod
+    def _parse_block(cls, item_class, lines, error_handling, index,
+                     stats=None, errors=None):
+        """
+        Return the item parsed from a block of non blank `lines`, or None
+        if it is invalid and `error_handling` allows to go on. `index` is
+        the number of the blank line ending the block.
         """
-        save([path][, encoding][, eol])
+        try:
+            return item_class.from_lines(lines)
+        except Error as error:
+            if errors is not None:
+                errors.mark(index - len(lines) + 1)
+            elif error_handling in (cls.ERROR_LOG, cls.ERROR_RAISE):
+                error.args += (''.join(lines), )
+            cls._handle_error(error, error_handling, index, stats, errors)
+
+    @classmethod
+    def _stream_fast(cls, source_file, error_handling, lazy=False,
+                     stats=None, errors=None, line_offset=0):
+        item_class = LazySubRipItem if lazy else SubRipItem
+        if stats is not None:
+            clock = stats.clock
+            started = clock()
+        if isinstance(source_file, basestring):
+            buffer = source_file
+        elif hasattr(source_file, 'read'):
+            buffer = source_file.read()
+        else:
+            buffer = ''.join(source_file)
+        if stats is not None:
+            resumed = clock()
+            stats.decode_time += resumed - started
+        source_text = buffer
+        buffer = srtparser.normalize_newlines(buffer)
+
+        line_count = start_line_count = line_offset
+        position = start_position = 0
+        for block in srtparser.iter_blocks(buffer):
+            match = srtparser.match_cue(buffer, block)
+            if stats is not None:
+                started = clock()
+                stats.parse_time += started - resumed
+            if match is not None:
+                item = srtparser.item_from_match(match, lazy)
+            else:
+                source = block.group()
+                try:
+                    item = item_class.from_lines(source.splitlines(True))
+                except Error as error:
+                    # Report the same line number than the tolerant parser:
+                    # the one of the blank line ending the block.
+                    line_count += buffer.count('\n', position, block.end())
+                    position = block.end()
+                    index = line_count if source.endswith('\n') \
+                        else line_count + 1
+                    if errors is not None:
+                        start_line_count += buffer.count(
+                            '\n', start_position, block.start())
+                        start_position = block.start()
+                        errors.locate(source_text, start_line_count + 1,
+                                      block.start() if source_text is buffer
+                                      else None)
+                    elif error_handling in (cls.ERROR_LOG, cls.ERROR_RAISE):
+                        error.args += (source, )
+                    cls._handle_error(error, error_handling, index, stats,
+                                      errors)
+                    item = None
+            if stats is not None:
+                resumed = clock()
+                stats.build_time += resumed - started
+                if item is not None:
+                    stats.cues += 1
+            if item is not None:
+                yield item
+                if stats is not None:
+                    resumed = clock()
+        if stats is not None:
+            stats.parse_time += clock() - resumed
+            stats.lines += buffer.count('\n') + (
+                1 if buffer and not buffer.endswith('\n') else 0)
+
+    def save(self, path=None, encoding=None, eol=None, stats=None):
+        """
+        save([path][, encoding][, eol][, stats])
 
         Use initial path if no other provided.
         Use initial encoding if no other provided.
         Use initial eol if no other provided.
+        `stats` -> a pysrt.SubRipStats to which serialization counters and
+            timings are added.
         """
         path = path or self.path
         encoding = encoding or self.encoding
 
-        save_file = codecs.open(path, 'w+', encoding=encoding)
-        self.write_into(save_file, eol=eol)
-        save_file.close()
+        with open(path, 'wb') as save_file:
+            self._write_chunks(save_file, self.iter_bytes(encoding, eol, stats),
+                               stats)
 
-    def write_into(self, output_file, eol=None):
+    def write_into(self, output_file, eol=None, stats=None):
         """
-        write_into(output_file [, eol])
+        write_into(output_file [, eol][, stats])
 
         Serialize current state into `output_file`.
 
         `output_file` -> Any instance that respond to `write()`, typically a
         file object
+        `stats` -> a pysrt.SubRipStats, see save().
+        """
+        self._write_chunks(output_file, self.iter_chunks(eol, stats=stats),
+                           stats)
+
+    @staticmethod
+    def _write_chunks(output_file, chunks, stats):
+        if stats is None:
+            for chunk in chunks:
+                output_file.write(chunk)
+            return
+        clock = stats.clock
+        for chunk in chunks:
+            started = clock()
+            output_file.write(chunk)
+            stats.write_time += clock() - started
+
+    def to_bytes(self, encoding=None, eol=None, stats=None):
         """
-        output_eol = eol or self.eol
+        to_bytes([encoding][, eol][, stats]) -> bytes
 
-        for item in self:
+        Serialize current state into a bytes string, as `save()` would write
+        it. Use initial encoding and eol if no other provided.
+        """
+        return b''.join(self.iter_bytes(encoding, eol, stats))
+
+    def iter_bytes(self, encoding=None, eol=None, stats=None):
+        """
+        iter_bytes([encoding][, eol][, stats]) -> iterator of bytes
+
+        Serialize current state into encoded chunks. A byte order mark, if
+        the encoding needs one, is only emitted at the start.
+        """
+        encoder = codecs.getincrementalencoder(encoding or self.encoding)()
+        encode = encoder.encode
+        if stats is not None:
+            encode = partial(self._timed_encode, encode, stats)
+        empty = True
+        for chunk in self.iter_chunks(eol, stats=stats):
+            empty = False
+            yield encode(chunk)
+        if not empty:  # an empty file gets no byte order mark
+            tail = encode('', True)
+            if tail:
+                yield tail
+
+    @staticmethod
+    def _timed_encode(encode, stats, chunk, final=False):
+        started = stats.clock()
+        data = encode(chunk, final)
+        stats.encode_time += stats.clock() - started
+        stats.bytes_written += len(data)
+        return data
+
+    def iter_chunks(self, eol=None, chunk_size=WRITE_CHUNK_SIZE, stats=None):
+        """
+        iter_chunks([eol][, chunk_size][, stats]) -> iterator of unicode
+
+        Serialize current state into strings holding up to `chunk_size`
+        items each, so that output can be written with a few large writes.
+        """
+        return self.serialize(self, eol or self.eol, chunk_size, stats)
+
+    @classmethod
+    def serialize(cls, items, eol=None, chunk_size=WRITE_CHUNK_SIZE,
+                  stats=None):
+        """
+        serialize(items[, eol][, chunk_size][, stats]) -> iterator of unicode
+
+        Same as `iter_chunks()` for any iterable of SubRipItem, e.g. the one
+        returned by `stream()`. Items are consumed one chunk at a time.
+        Time spent producing `items` is not part of `stats` serialize_time.
+        """
+        output_eol = eol or os.linesep
+        double_eol = 2 * output_eol
+        chunk = []
+        if stats is not None:
+            clock = stats.clock
+        for count, item in enumerate(items, 1):
+            if stats is not None:
+                started = clock()
             string_repr = str(item)
             if output_eol != '\n':
                 string_repr = string_repr.replace('\n', output_eol)
-            output_file.write(string_repr)
+            chunk.append(string_repr)
             # Only add trailing eol if it's not already present.
             # It was kept in the SubRipItem's text before but it really
             # belongs here. Existing applications might give us subtitles
             # which already contain a trailing eol though.
-            if not string_repr.endswith(2 * output_eol):
-                output_file.write(output_eol)
+            if not string_repr.endswith(double_eol):
+                chunk.append(output_eol)
+            if stats is not None:
+                stats.serialize_time += clock() - started
+                stats.cues_written += 1
+            if not count % chunk_size:
+                yield ''.join(chunk)
+                chunk = []
+        if chunk:
+            yield ''.join(chunk)
 
     @classmethod
     def _guess_eol(cls, string_iterable):
@@ -262,6 +896,10 @@ class SubRipFile(UserList, object):
 
     @classmethod
     def _get_first_line(cls, string_iterable):
+        if isinstance(string_iterable, basestring):
+            # Only split up to the first \n
+            head = string_iterable[:string_iterable.find('\n') + 1 or None]
+            return (head.splitlines(True) or [''])[0]
         if hasattr(string_iterable, 'tell'):
             previous_position = string_iterable.tell()
 
@@ -287,8 +925,23 @@ class SubRipFile(UserList, object):
         # TODO: maybe a chardet integration
         return cls.DEFAULT_ENCODING
 
+    @classmethod
+    def _bom_length(cls, path, encoding):
+        """
+        Return the length of the byte order mark stripped from `path` when
+        opened with `encoding`.
+        """
+        possible_bom = CODECS_BOMS.get(encoding, None)
+        if not possible_bom:
+            return 0
+        bom = possible_bom.encode(encoding)
+        with open(path, 'rb') as source_file:
+            return len(bom) if source_file.read(len(bom)) == bom else 0
+
     @classmethod
     def _open_unicode_file(cls, path, claimed_encoding=None):
+        if claimed_encoding == cls.ENCODING_AUTO:
+            claimed_encoding = srtencoding.detect(path)
         encoding = claimed_encoding or cls._detect_encoding(path)
         source_file = codecs.open(path, 'r', encoding=encoding)
 
@@ -300,13 +953,162 @@ class SubRipFile(UserList, object):
                 source_file.seek(0)  # if not rewind
         return source_file, encoding
 
+    def to_binary(self):
+        """
+        to_binary() -> bytes
+
+        Serialize items, eol and encoding into a compact binary string,
+        much faster to load than the SubRip source. See pysrt.srtbinary.
+        """
+        data = self.data
+        if isinstance(data, ColumnarStorage):
+            rows = (data._get_row(row) for row in range(len(data)))
+        else:
+            rows = ((item.index, item.start.ordinal, item.end.ordinal,
+                     item.text, item.position) for item in data)
+        return srtbinary.dumps(rows, eol=self._eol, encoding=self.encoding)
+
+    @classmethod
+    def from_binary(cls, data, path=None, storage=STORAGE_LIST):
+        """
+        from_binary(data[, path][, storage]) -> SubRipFile
+
+        Load a file serialized by `to_binary()`. Items are plain SubRipItem
+        instances, or columns if `storage` is SubRipFile.STORAGE_COLUMNAR.
+        Raise InvalidBinary if `data` can't be loaded.
+        """
+        eol, encoding, columns = srtbinary.loads(data)
+        new_file = cls(eol=eol or None, path=path, encoding=encoding or None,
+                       storage=storage)
+        if storage == cls.STORAGE_COLUMNAR:
+            new_file.data = ColumnarStorage.from_columns(*columns)
+            return new_file
+
+        indexes, starts, ends, texts, positions, position_ids = columns
+        # Values are known to be valid: skip SubRipItem and SubRipTime
+        # __init__ which dominate loading time otherwise.
+        new_item = SubRipItem.__new__
+        new_time = SubRipTime.__new__
+        items = []
+        append = items.append
+        for index, start, end, text, position_id in zip(
+                indexes, starts, ends, texts, position_ids):
+            item = new_item(SubRipItem)
+            item.index = index
+            item.start = start_time = new_time(SubRipTime)
+            start_time.ordinal = start
+            item.end = end_time = new_time(SubRipTime)
+            end_time.ordinal = end
+            item.text = text
+            item.position = positions[position_id]
+            append(item)
+        new_file.data = items
+        return new_file
+
+    # Every list mutation may change the cues matched by slice() and at()
+
+    def __setitem__(self, i, item):
+        self._interval_index = None
+        UserList.__setitem__(self, i, item)
+
+    def __delitem__(self, i):
+        self._interval_index = None
+        UserList.__delitem__(self, i)
+
+    if hasattr(UserList, '__setslice__'):  # Python 2
+        def __setslice__(self, i, j, other):
+            self._interval_index = None
+            UserList.__setslice__(self, i, j, other)
+
+        def __delslice__(self, i, j):
+            self._interval_index = None
+            UserList.__delslice__(self, i, j)
+
+    def __iadd__(self, other):
+        self._interval_index = None
+        return UserList.__iadd__(self, other)
+
+    def __imul__(self, n):
+        self._interval_index = None
+        return UserList.__imul__(self, n)
+
+    def append(self, item):
+        self._interval_index = None
+        UserList.append(self, item)
+
+    def insert(self, i, item):
+        self._interval_index = None
+        UserList.insert(self, i, item)
+
+    def pop(self, i=-1):
+        self._interval_index = None
+        return UserList.pop(self, i)
+
+    def remove(self, item):
+        self._interval_index = None
+        UserList.remove(self, item)
+
+    if hasattr(UserList, 'clear'):  # Python 3
+        def clear(self):
+            self._interval_index = None
+            UserList.clear(self)
+
+    def extend(self, other):
+        self._interval_index = None
+        UserList.extend(self, other)
+
+    def sort(self, *args, **kwargs):
+        self._interval_index = None
+        UserList.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        self._interval_index = None
+        UserList.reverse(self)
+
+    def __copy__(self):
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.data = self.data[:]
+        return clone
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_interval_index'] = state['_index_ordinals'] = None
+        data = self.data
+        # Plain items and columns are pickled as a single binary dump rather
+        # than item by item, anything else as is.
+        if isinstance(data, ColumnarStorage):
+            state['data'] = (self.STORAGE_COLUMNAR, self.to_binary())
+        elif isinstance(data, list) and all(
+                item.__class__ is SubRipItem for item in data):
+            state['data'] = (self.STORAGE_LIST, self.to_binary())
+        else:
+            state['data'] = (None, list(data))
+        return state
+
+    def __setstate__(self, state):
+        storage, data = state.pop('data')
+        self.__dict__.update(state)
+        if storage is None:
+            self.data = data
+        else:
+            self.data = self.from_binary(data, storage=storage).data
+
     @classmethod
-    def _handle_error(cls, error, error_handling, index):
-        if error_handling == cls.ERROR_RAISE:
+    def _handle_error(cls, error, error_handling, index, stats=None,
+                      errors=None):
+        if stats is not None:
+            stats.add_error(error)
+        if error_handling == cls.ERROR_COLLECT:
+            errors.add(error)
+        elif error_handling == cls.ERROR_RAISE:
             error.args = (index, ) + error.args
             raise error
-        if error_handling == cls.ERROR_LOG:
+        elif error_handling == cls.ERROR_LOG:
             name = type(error).__name__
             sys.stderr.write('PySRT-%s(line %s): \n' % (name, index))
-            sys.stderr.write(error.args[0].encode('ascii', 'replace'))
+            # Keep the log readable whatever the terminal encoding
+            sys.stderr.write(error.args[0].encode('ascii', 'replace')
+                             .decode('ascii'))
             sys.stderr.write('\n')
+
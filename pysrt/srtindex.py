@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Time interval index used by SubRipFile.slice and SubRipFile.at
+"""
+from bisect import bisect_left, bisect_right
+
+
+class IntervalIndex(object):
+    """
+    IntervalIndex(starts, ends)
+
+    Static index over cues given as two sequences of start and end
+    ordinals. Cues are sorted by start so that start constraints resolve
+    to a contiguous range with a bisection, and two segment trees holding
+    the minimum and maximum end of each subtree prune the search for end
+    constraints. A query costs O(log n + k) on typical subtitle files.
+    """
+
+    def __init__(self, starts, ends):
+        self.length = len(starts)
+        self.positions = sorted(range(self.length), key=starts.__getitem__)
+        self.starts = [starts[p] for p in self.positions]
+        self.ends = [ends[p] for p in self.positions]
+
+        size = 1
+        while size < self.length:
+            size *= 2
+        self.size = size
+        self.max_ends = self._build_tree(self.ends, max, float('-inf'))
+        self.min_ends = self._build_tree(self.ends, min, float('inf'))
+
+    def __len__(self):
+        return self.length
+
+    def query(self, starts_before=None, starts_after=None, ends_before=None,
+              ends_after=None):
+        """
+        query([starts_before][, starts_after][, ends_before][, ends_after])
+        -> list of positions
+
+        All arguments are ordinals or None. Return the positions, in the
+        original order, of cues strictly matching all given constraints.
+        """
+        low, high = 0, self.length
+        if starts_after is not None:
+            low = bisect_right(self.starts, starts_after)
+        if starts_before is not None:
+            high = min(high, bisect_left(self.starts, starts_before))
+        if low >= high:
+            return []
+
+        if ends_after is not None:
+            rows = self._search(self.max_ends, low, high,
+                                lambda end: end > ends_after)
+            if ends_before is not None:
+                rows = [r for r in rows if self.ends[r] < ends_before]
+        elif ends_before is not None:
+            rows = self._search(self.min_ends, low, high,
+                                lambda end: end < ends_before)
+        else:
+            rows = range(low, high)
+
+        positions = self.positions
+        return sorted(positions[row] for row in rows)
+
+    def _build_tree(self, values, reduce_function, neutral):
+        tree = [neutral] * (2 * self.size)
+        tree[self.size:self.size + self.length] = values
+        for node in range(self.size - 1, 0, -1):
+            tree[node] = reduce_function(tree[2 * node], tree[2 * node + 1])
+        return tree
+
+    def _search(self, tree, low, high, accept):
+        """
+        Return the rows in [low, high) whose end is accepted, skipping every
+        subtree whose extremum already fails the predicate.
+        """
+        rows = []
+        stack = [(1, 0, self.size)]
+        while stack:
+            node, node_low, node_high = stack.pop()
+            if node_high <= low or high <= node_low or not accept(tree[node]):
+                continue
+            if node >= self.size:
+                rows.append(node - self.size)
+                continue
+            middle = (node_low + node_high) // 2
+            stack.append((2 * node + 1, middle, node_high))
+            stack.append((2 * node, node_low, middle))
+        return rows
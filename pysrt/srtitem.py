@@ -7,8 +7,13 @@ from pysrt.srtexc import InvalidItem, InvalidIndex
 from pysrt.srttime import SubRipTime
 from pysrt.comparablemixin import ComparableMixin
 from pysrt.compat import str, is_py2
+from collections import namedtuple
 import re
 
+# Text derived values of a cue, see SubRipItem.text_metrics
+TextMetrics = namedtuple('TextMetrics', ('plain_text', 'characters', 'lines',
+                                         'characters_per_second'))
+
 
 class SubRipItem(ComparableMixin):
     """
@@ -19,8 +24,11 @@ class SubRipItem(ComparableMixin):
     text -> unicode: text content for item.
     position -> unicode: raw srt/vtt "display coordinates" string
     """
+    __slots__ = ('index', 'start', 'end', 'text', 'position', '_text_cache')
+
     ITEM_PATTERN = str('%s\n%s --> %s%s\n%s\n')
     TIMESTAMP_SEPARATOR = '-->'
+    RE_TAG = re.compile(r'<[^>]*?>')
 
     def __init__(self, index=0, start=None, end=None, text='', position=''):
         try:
@@ -33,22 +41,70 @@ class SubRipItem(ComparableMixin):
         self.position = str(position)
         self.text = str(text)
 
+    def __getstate__(self):
+        return (self.index, self.start, self.end, self.text, self.position)
+
+    def __setstate__(self, state):
+        self.index, self.start, self.end, self.text, self.position = state
+
     @property
     def duration(self):
         return self.end - self.start
 
+    @classmethod
+    def measure_text(cls, text):
+        """
+        measure_text(text) -> (text without tags, characters, lines)
+
+        Characters are counted without tags nor line breaks.
+        """
+        plain_text = cls.RE_TAG.sub('', text) if '<' in text else text
+        breaks = plain_text.count('\n')
+        return (plain_text, len(plain_text) - breaks,
+                breaks + 1 if plain_text else 0)
+
+    def _get_text_cache(self):
+        # Values derived from the text are kept until another string is
+        # assigned to `text`, whatever the item class stores it in.
+        text = self.text
+        try:
+            cache = self._text_cache
+        except AttributeError:  # built without __init__
+            cache = None
+        if cache is None or cache[0] is not text:
+            cache = self._text_cache = (text, ) + self.measure_text(text)
+        return cache
+
     @property
     def text_without_tags(self):
-        RE_TAG = re.compile(r'<[^>]*?>')
-        return RE_TAG.sub('', self.text)
+        return self._get_text_cache()[1]
+
+    @property
+    def characters_count(self):
+        return self._get_text_cache()[2]
+
+    @property
+    def lines_count(self):
+        return self._get_text_cache()[3]
 
     @property
     def characters_per_second(self):
-        characters_count = len(self.text_without_tags.replace('\n', ''))
-        try:
-            return characters_count / (self.duration.ordinal / 1000.0)
-        except ZeroDivisionError:
+        duration = self.end.ordinal - self.start.ordinal
+        if not duration:
             return 0.0
+        return self._get_text_cache()[2] / (duration / 1000.0)
+
+    @property
+    def text_metrics(self):
+        """
+        TextMetrics of the item: text without tags, characters and lines
+        counts, and characters per second.
+        """
+        _, plain_text, characters, lines = self._get_text_cache()
+        duration = self.end.ordinal - self.start.ordinal
+        return TextMetrics(plain_text, characters, lines,
+                           characters / (duration / 1000.0) if duration
+                           else 0.0)
 
     def __str__(self):
         position = ' %s' % self.position if self.position.strip() else ''
@@ -61,7 +117,17 @@ class SubRipItem(ComparableMixin):
             raise NotImplementedError('Use unicode() instead!')
 
     def _cmpkey(self):
-        return (self.start, self.end)
+        return (self.start.ordinal, self.end.ordinal)
+
+    @staticmethod
+    def sort_key(item):
+        """
+        sort_key(item) -> (start ordinal, end ordinal)
+
+        Key ordering items like comparisons do, without building any
+        SubRipTime comparison on the way.
+        """
+        return (item.start.ordinal, item.end.ordinal)
 
     def shift(self, *args, **kwargs):
         """
@@ -99,3 +165,65 @@ class SubRipItem(ComparableMixin):
         end = end_and_position[0]
         position = end_and_position[1] if len(end_and_position) > 1 else ''
         return (s.strip() for s in (start, end, position))
+
+
+class LazySubRipItem(SubRipItem):
+    """
+    LazySubRipItem(index, start, end, raw_lines)
+
+    SubRipItem parsing start and end right away but keeping its raw source
+    lines until `text` or `position` is first read. Useful when only
+    timings are needed.
+
+    raw_lines -> sequence of unicode: the timestamps line followed by the
+        text lines, as found in the source.
+    """
+    __slots__ = ('_raw_lines', '_text', '_position')
+
+    def __init__(self, index=0, start=None, end=None, raw_lines=()):
+        try:
+            self.index = int(index)
+        except (TypeError, ValueError):
+            self.index = index
+
+        self.start = SubRipTime.coerce(start or 0)
+        self.end = SubRipTime.coerce(end or 0)
+        self._raw_lines = raw_lines
+        self._text = self._position = None
+
+    def _get_text(self):
+        if self._text is None:
+            self._text = '\n'.join(line.rstrip()
+                                   for chunk in self._raw_lines[1:]
+                                   for line in chunk.splitlines())
+        return self._text
+
+    def _set_text(self, text):
+        self._text = str(text)
+
+    text = property(_get_text, _set_text)
+
+    def _get_position(self):
+        if self._position is None:
+            if self._raw_lines:
+                _, _, self._position = \
+                    self.split_timestamps(self._raw_lines[0].rstrip())
+            else:
+                self._position = ''
+        return self._position
+
+    def _set_position(self, position):
+        self._position = str(position)
+
+    position = property(_get_position, _set_position)
+
+    @classmethod
+    def from_lines(cls, lines):
+        if len(lines) < 2:
+            raise InvalidItem()
+        index = None
+        if cls.TIMESTAMP_SEPARATOR not in lines[0]:
+            index = lines[0].rstrip()
+            lines = lines[1:]
+        start, end, _ = cls.split_timestamps(lines[0].rstrip())
+        return cls(index, start, end, lines)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Merge of several subtitle tracks into one
+"""
+from bisect import insort
+
+from pysrt.srtfile import SubRipFile
+from pysrt.srtitem import SubRipItem
+from pysrt.srttime import SubRipTime
+
+START = 1
+END = 0  # sorted first, so that cues ending when others start never overlap
+
+
+def _new_item(index, start, end, text):
+    # Timings are known to be valid ordinals: skip SubRipItem and
+    # SubRipTime __init__, like SubRipFile.from_binary
+    item = SubRipItem.__new__(SubRipItem)
+    item.index = index
+    item.start = start_time = SubRipTime.__new__(SubRipTime)
+    start_time.ordinal = start
+    item.end = end_time = SubRipTime.__new__(SubRipTime)
+    end_time.ordinal = end
+    item.text = text
+    item.position = ''
+    return item
+
+
+def merge(*tracks, **kwargs):
+    """
+    merge(*tracks[, tolerance][, separator], **kwargs) -> SubRipFile
+
+    Merge several tracks, e.g. of different languages, into a single one.
+    The time line is cut wherever a cue of any track starts or ends, and
+    each part shows the text of every cue visible during it, track after
+    track.
+
+    tracks -> SubRipFile instances, or any iterables of SubRipItem.
+    tolerance -> SubRipTime or coercible: parts which are not longer than
+        that are dropped, and the parts around them merged when they show
+        the same text. Default to 0.
+    separator -> unicode: joins texts of a part. Default to '\\n'.
+
+    Other keyword arguments are given to SubRipFile, eol and encoding
+    defaulting to the ones of the first track.
+
+    Cues are swept once in time order: merging takes O(n log n) for n cues
+    whatever the number of tracks.
+
+    Example:
+        >>> merged = pysrt.merge(english, french, tolerance={'milliseconds': 500})
+    """
+    tolerance = SubRipTime.coerce(kwargs.pop('tolerance', 0)).ordinal
+    separator = kwargs.pop('separator', '\n')
+    if tracks and isinstance(tracks[0], SubRipFile):
+        kwargs.setdefault('eol', tracks[0]._eol)
+        kwargs.setdefault('encoding', tracks[0].encoding)
+
+    texts = []
+    cue_tracks = []
+    events = []
+    for track_number, track in enumerate(tracks):
+        for item in track:
+            start = item.start.ordinal
+            end = item.end.ordinal
+            if end <= start or not item.text:
+                continue
+            events.append((start, START, len(texts)))
+            events.append((end, END, len(texts)))
+            texts.append(item.text)
+            cue_tracks.append(track_number)
+    events.sort()
+
+    items = []
+    # Cues visible in the current part, by track then in track order
+    visible = [[] for _ in tracks]
+    part = None  # [start, end, text] of the last part not output yet
+    position = 0
+    count = len(events)
+    while position < count:
+        time = events[position][0]
+        while position < count and events[position][0] == time:
+            _, kind, cue = events[position]
+            if kind == START:
+                insort(visible[cue_tracks[cue]], cue)
+            else:
+                visible[cue_tracks[cue]].remove(cue)
+            position += 1
+        if position == count:
+            break
+
+        next_time = events[position][0]
+        if next_time - time <= tolerance:
+            continue
+        text = separator.join(texts[cue] for cues in visible for cue in cues)
+        if part is not None and (not text or part[2] != text):
+            items.append(_new_item(len(items) + 1, *part))
+            part = None
+        if part is not None:
+            part[1] = next_time
+        elif text:
+            part = [time, next_time, text]
+    if part is not None:
+        items.append(_new_item(len(items) + 1, *part))
+    return SubRipFile(items, **kwargs)
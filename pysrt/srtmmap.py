@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+Memory mapped SubRip reader
+"""
+import os
+import re
+import mmap
+import codecs
+from array import array
+
+try:
+    from collections.abc import MutableSequence
+except ImportError:
+    from collections import MutableSequence
+
+from pysrt import srtencoding
+from pysrt.srtexc import Error
+from pysrt.srtitem import SubRipItem
+from pysrt.srttime import SubRipTime
+from pysrt.srtstorage import INTEGER_TYPECODE
+from pysrt.compat import chr
+
+# Byte sequences decoded as whitespace, and as a line boundary, by the
+# tolerant line parser in every supported encoding.
+WHITESPACES = ' \t\r\f\v'
+NEWLINE = '\n'
+SEPARATOR = '-->'
+# Every other character stripped by str.strip() or ending a line for
+# str.splitlines(), \r being one only when not followed by \n.
+SPECIAL_CHARACTERS = u''.join(
+    c for c in map(chr, range(0x3001))
+    if c.isspace() and c not in u' \t\r\n')
+
+
+def build_cue_pattern(encoding):
+    """
+    Return a compiled bytes regex matching, from the current position, any
+    number of blank lines followed by a block of non blank lines in group 1.
+
+    Every match ends where the next one starts, so that patterns built for
+    multi bytes encodings never get out of code unit alignment.
+    """
+    width = len(NEWLINE.encode(encoding))
+    if width == 1:
+        whitespace = b'[' + re.escape(WHITESPACES.encode(encoding)) + b']'
+        printable = b'[^' + re.escape((WHITESPACES + NEWLINE).encode(encoding)) + b']'
+        newline = re.escape(NEWLINE.encode(encoding))
+        any_but_newline = b'[^' + newline + b']'
+    else:
+        units = [re.escape(c.encode(encoding)) for c in WHITESPACES]
+        whitespace = b'(?:' + b'|'.join(units) + b')'
+        newline = re.escape(NEWLINE.encode(encoding))
+        unit = b'.{' + str(width).encode('ascii') + b'}'
+        printable = b'(?:(?!' + whitespace + b'|' + newline + b')' + unit + b')'
+        any_but_newline = b'(?:(?!' + newline + b')' + unit + b')'
+    blank_line = whitespace + b'*' + newline
+    line = (whitespace + b'*' + printable + any_but_newline + b'*'
+            + b'(?:' + newline + b'|\\Z)')
+    return re.compile(b'(?:' + blank_line + b')*((?:' + line + b')+)',
+                      re.DOTALL)
+
+
+def build_special_pattern(encoding):
+    """
+    Return a compiled bytes regex finding the characters the tolerant line
+    parser does not split or strip like the pattern returned by
+    build_cue_pattern(). Matches may be out of code unit alignment.
+    """
+    newline = re.escape(NEWLINE.encode(encoding))
+    characters = [re.escape(u'\r'.encode(encoding)) + b'(?!' + newline + b')']
+    for character in SPECIAL_CHARACTERS:
+        try:
+            characters.append(re.escape(character.encode(encoding)))
+        except UnicodeError:  # can't be found in this encoding anyway
+            pass
+    return re.compile(b'|'.join(characters))
+
+
+def count_lines(mapping, newline, start, end):
+    """
+    Count the `newline` code units between `start` and `end`, `start`
+    being aligned on a code unit.
+    """
+    chunk = mapping[start:end]
+    count = chunk.count(newline)
+    width = len(newline)
+    if width == 1 or not count:
+        return count
+    # Skip byte sequences straddling two code units
+    count = 0
+    position = chunk.find(newline)
+    while position >= 0:
+        if position % width:
+            position = chunk.find(newline, position + 1)
+        else:
+            count += 1
+            position = chunk.find(newline, position + width)
+    return count
+
+
+def count_blank_lines(mapping, encoding, start, end):
+    """
+    Count the blank lines between `start` and `end` the way str.splitlines()
+    splits them, which is not only on \\n.
+    """
+    if start == end:
+        return 0
+    return len(mapping[start:end].decode(encoding).splitlines())
+
+
+def map_file(path, encoding=None):
+    """
+    map_file(path[, encoding]) -> (mapping, encoding, offset)
+
+    Map `path` in memory for reading. Encoding is detected from the byte
+    order mark if not provided, `offset` being the length of that mark.
+    """
+    from pysrt.srtfile import BOMS, SubRipFile
+    if encoding == SubRipFile.ENCODING_AUTO:
+        encoding = srtencoding.detect(path)
+    with open(path, 'rb') as source_file:
+        if os.fstat(source_file.fileno()).st_size:
+            mapping = mmap.mmap(source_file.fileno(), 0,
+                                access=mmap.ACCESS_READ)
+        else:  # empty files can't be mapped
+            mapping = b''
+
+    offset = 0
+    for bom, bom_encoding in BOMS:
+        if mapping[:len(bom)] == bom:
+            offset = len(bom)
+            encoding = encoding or bom_encoding
+            if codecs.lookup(encoding).name in ('utf-16', 'utf-32'):
+                encoding = bom_encoding
+            break
+    return mapping, encoding or SubRipFile.DEFAULT_ENCODING, offset
+
+
+def guess_eol(mapping, encoding, offset=0):
+    """
+    Return the end of line of the first line starting at `offset`.
+    """
+    from pysrt.srtfile import SubRipFile
+    newline = NEWLINE.encode(encoding)
+    first_line_end = mapping.find(newline, offset)
+    if first_line_end < 0:
+        first_line = mapping[offset:]
+    else:
+        first_line = mapping[offset:first_line_end + len(newline)]
+    return SubRipFile._guess_eol([first_line.decode(encoding, 'replace')])
+
+
+class MappedStorage(MutableSequence):
+    """
+    MappedStorage(mapping, encoding, offset, error_handling)
+
+    Mutable sequence of SubRipItem backed by a memory mapped SubRip file.
+
+    Cue boundaries are located directly in the mapped bytes, then each cue
+    is only decoded and parsed the first time it is accessed. Only the
+    timestamps line of each cue is decoded upfront to validate it. Blocks
+    that do not look like a single valid cue, or holding characters the
+    tolerant parser splits lines on or strips, like \\u2028 or \\xa0, are
+    parsed eagerly by the tolerant parser, honoring `error_handling`.
+
+    When errors are logged or raised, the line number of each cue is kept
+    as well so that they report the same lines than the other parsers.
+    """
+
+    def __init__(self, mapping, encoding, offset=0, error_handling=0):
+        self.mapping = mapping
+        self.encoding = encoding
+        self.starts = array(INTEGER_TYPECODE)
+        self.ends = array(INTEGER_TYPECODE)
+        self.lines = array(INTEGER_TYPECODE) if error_handling else None
+        self.items = []
+        self.error_handling = error_handling
+        self._locate_cues(offset)
+
+    @classmethod
+    def open(cls, path, encoding=None, error_handling=0):
+        """
+        open(path[, encoding][, error_handling]) -> (MappedStorage, eol)
+
+        Map `path` in memory and locate its cues. Encoding is detected from
+        the byte order mark if not provided.
+        """
+        mapping, encoding, offset = map_file(path, encoding)
+        storage = cls(mapping, encoding, offset, error_handling)
+        return storage, guess_eol(mapping, encoding, offset)
+
+    def close(self):
+        """
+        Release the mapping. Cues not accessed yet can't be read anymore.
+        """
+        if hasattr(self.mapping, 'close'):
+            self.mapping.close()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        item = self.items[index]
+        while item is None:
+            row = index + len(self) if index < 0 else index
+            item = self.items[row] = self._parse(row)
+            if item is None:
+                # Dropped like the tolerant parser drops invalid blocks
+                del self[row]
+                item = self.items[index]
+        return item
+
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            items = list(item)
+            if step == 1:
+                del self[index]
+                for offset, item in enumerate(items):
+                    self.insert(start + offset, item)
+                return
+            rows = range(start, stop, step)
+            if len(items) != len(rows):
+                raise ValueError('attempt to assign sequence of size %d to '
+                                 'extended slice of size %d'
+                                 % (len(items), len(rows)))
+            for row, item in zip(rows, items):
+                self[row] = item
+            return
+        self.items[index] = item
+        self.starts[index] = self.ends[index] = -1
+
+    def __delitem__(self, index):
+        del self.items[index]
+        del self.starts[index]
+        del self.ends[index]
+        if self.lines is not None:
+            del self.lines[index]
+
+    def insert(self, index, item):
+        row = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        self.items.insert(row, item)
+        self.starts.insert(row, -1)
+        self.ends.insert(row, -1)
+        if self.lines is not None:
+            self.lines.insert(row, -1)
+
+    def sort(self, key=None, reverse=False):
+        key = key or SubRipItem.sort_key
+        order = sorted(range(len(self)), reverse=reverse,
+                       key=lambda row: key(self[row]))
+        self.items = [self.items[row] for row in order]
+        self.starts = array(self.starts.typecode, [self.starts[r] for r in order])
+        self.ends = array(self.ends.typecode, [self.ends[r] for r in order])
+        if self.lines is not None:
+            self.lines = array(self.lines.typecode,
+                               [self.lines[r] for r in order])
+
+    def reverse(self):
+        self.items.reverse()
+        self.starts.reverse()
+        self.ends.reverse()
+        if self.lines is not None:
+            self.lines.reverse()
+
+    def _decode(self, row):
+        return self.mapping[self.starts[row]:self.ends[row]].decode(self.encoding)
+
+    def _parse(self, row):
+        """
+        Return the item of `row`, or None if it is invalid and
+        `error_handling` allows to drop it.
+        """
+        from pysrt.srtfile import SubRipFile
+        source = self._decode(row)
+        line = 0 if self.lines is None else self.lines[row]
+        for item in SubRipFile._stream_tolerant(
+                source.splitlines(True), self.error_handling,
+                line_offset=line):
+            return item
+
+    def _is_single_cue(self, start, end, separator, newline, special):
+        """
+        Tell whether the block between `start` and `end` holds exactly one
+        cue with valid timestamps, and no character making the tolerant
+        parser split or strip its lines differently. Only the index and
+        timestamps lines are decoded to find out.
+        """
+        mapping = self.mapping
+        match = special.search(mapping, start, end)
+        while match is not None:
+            if not (match.start() - start) % len(newline):
+                return False
+            match = special.search(mapping, match.start() + 1, end)
+        separator_position = mapping.find(separator, start, end)
+        if separator_position < 0 or mapping.find(
+                separator, separator_position + len(separator), end) >= 0:
+            return False
+        head_end = mapping.find(newline, separator_position, end)
+        head_end = end if head_end < 0 else head_end + len(newline)
+        lines = mapping[start:head_end].decode(self.encoding).splitlines()
+        if len(lines) > 2 or len(lines) == 1 and head_end >= end:
+            return False
+        try:
+            start_time, end_time, _ = SubRipItem.split_timestamps(lines[-1])
+            SubRipTime.from_string(start_time)
+            SubRipTime.from_string(end_time)
+        except Error:
+            return False
+        return True
+
+    def _locate_cues(self, offset):
+        from pysrt.srtfile import SubRipFile
+        mapping = self.mapping
+        pattern = build_cue_pattern(self.encoding)
+        special = build_special_pattern(self.encoding)
+        separator = SEPARATOR.encode(self.encoding)
+        newline = NEWLINE.encode(self.encoding)
+        lines = self.lines
+        line = 0  # number of lines before the current block
+        position = offset
+        while True:
+            match = pattern.match(mapping, position)
+            if match is None:
+                break
+            position = match.end()
+            start, end = match.span(1)
+            if lines is not None:
+                line += count_blank_lines(mapping, self.encoding,
+                                          match.start(), start)
+
+            if self._is_single_cue(start, end, separator, newline, special):
+                self.starts.append(start)
+                self.ends.append(end)
+                self.items.append(None)
+                if lines is not None:
+                    lines.append(line)
+                    line += count_lines(mapping, newline, start, end)
+            else:
+                # Anything else is left to the tolerant parser right away
+                source = mapping[start:end].decode(self.encoding)
+                for item in SubRipFile._stream_tolerant(
+                        source.splitlines(True), self.error_handling,
+                        line_offset=line):
+                    self.starts.append(-1)
+                    self.ends.append(-1)
+                    self.items.append(item)
+                    if lines is not None:
+                        lines.append(-1)
+                if lines is not None:
+                    line += len(source.splitlines())
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Byte offset index of SubRip files, used by SubRipFile.open_range.
+
+The index maps every cue to the byte offset of its block, and every group
+of CHECKPOINT_INTERVAL consecutive cues to the earliest start and latest
+end among them. Reading a time window then only means decoding and parsing
+the groups overlapping it.
+
+Sidecar layout, all integers being little endian:
+
+    header      magic, version, checkpoint interval, source size, source
+                modification time, cues count
+    encodings   requested and actual encoding, length prefixed UTF-8
+    eol         length prefixed UTF-8
+    offsets     int64 per cue
+    starts      int64 per checkpoint
+    ends        int64 per checkpoint
+"""
+import os
+import struct
+import tempfile
+from array import array
+
+from pysrt.srtexc import InvalidBinary
+from pysrt.srtmmap import build_cue_pattern, map_file, guess_eol
+from pysrt.srtstorage import INTEGER_TYPECODE
+
+MAGIC = b'PSRI'
+VERSION = 1
+
+HEADER = struct.Struct('<4sBIqdI')
+LENGTH = struct.Struct('<I')
+
+CHECKPOINT_INTERVAL = 64
+
+
+def _pack_string(string):
+    data = string.encode('utf-8')
+    return LENGTH.pack(len(data)) + data
+
+
+def _pack_integers(values):
+    return struct.pack('<%dq' % len(values), *values)
+
+
+class OffsetIndex(object):
+    """
+    OffsetIndex(offsets, starts, ends, size=0, mtime=0.0, encoding='utf-8',
+                eol='\\n', interval=CHECKPOINT_INTERVAL, requested_encoding='')
+
+    offsets -> byte offset of each cue block in the source file.
+    starts, ends -> earliest start and latest end ordinals of each group of
+        `interval` cues.
+    size, mtime -> size and modification time of the indexed file, an
+        index no longer matching them is stale.
+    requested_encoding -> encoding given when building the index, '' if
+        it was detected.
+
+    Build it with `OffsetIndex.build(path)`, or let `OffsetIndex.for_file`
+    load it from its sidecar file, building and saving it when missing or
+    stale.
+    """
+    EXTENSION = '.psrtidx'
+
+    def __init__(self, offsets, starts, ends, size=0, mtime=0.0,
+                 encoding='utf-8', eol='\n', interval=CHECKPOINT_INTERVAL,
+                 requested_encoding=''):
+        self.offsets = array(INTEGER_TYPECODE, offsets)
+        self.starts = array(INTEGER_TYPECODE, starts)
+        self.ends = array(INTEGER_TYPECODE, ends)
+        self.size = size
+        self.mtime = mtime
+        self.encoding = encoding
+        self.eol = eol
+        self.interval = interval
+        self.requested_encoding = requested_encoding
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @classmethod
+    def build(cls, path, encoding=None, interval=CHECKPOINT_INTERVAL):
+        """
+        build(path[, encoding][, interval]) -> OffsetIndex
+
+        Scan `path` once, locating cue blocks in the mapped bytes and only
+        parsing their timings. Blocks without any valid cue are not
+        indexed. Encoding is detected like in SubRipFile.open.
+        """
+        from pysrt.srtfile import SubRipFile
+        status = os.stat(path)
+        mapping, actual_encoding, bom_length = map_file(path, encoding)
+        position = bom_length
+        offsets = []
+        starts = []
+        ends = []
+        try:
+            pattern = build_cue_pattern(actual_encoding)
+            while True:
+                match = pattern.match(mapping, position)
+                if match is None:
+                    break
+                position = match.end()
+                start, end = match.span(1)
+                source = mapping[start:end].decode(actual_encoding)
+                items = list(SubRipFile.stream(source.splitlines(True),
+                                               lazy=True))
+                if not items:
+                    continue
+                offsets.append(start)
+                starts.append(min(item.start.ordinal for item in items))
+                ends.append(max(item.end.ordinal for item in items))
+            eol = guess_eol(mapping, actual_encoding, bom_length)
+        finally:
+            if hasattr(mapping, 'close'):
+                mapping.close()
+
+        checkpoint_starts = []
+        checkpoint_ends = []
+        for first in range(0, len(offsets), interval):
+            checkpoint_starts.append(min(starts[first:first + interval]))
+            checkpoint_ends.append(max(ends[first:first + interval]))
+        return cls(offsets, checkpoint_starts, checkpoint_ends,
+                   status.st_size, status.st_mtime, actual_encoding, eol,
+                   interval, encoding or '')
+
+    @classmethod
+    def for_file(cls, path, encoding=None, interval=CHECKPOINT_INTERVAL):
+        """
+        for_file(path[, encoding][, interval]) -> OffsetIndex
+
+        Load the sidecar index of `path`, next to it, or build it if it is
+        missing, stale or was built with another encoding. A freshly built
+        index is saved, unless the directory is not writable.
+        """
+        index_path = cls.sidecar_path(path)
+        try:
+            index = cls.load(index_path)
+        except (IOError, OSError, InvalidBinary):
+            index = None
+        if index is None or not index.matches(path, encoding):
+            index = cls.build(path, encoding, interval)
+            try:
+                index.save(index_path)
+            except (IOError, OSError):
+                pass
+        return index
+
+    @classmethod
+    def sidecar_path(cls, path):
+        return path + cls.EXTENSION
+
+    def matches(self, path, encoding=None):
+        """
+        Tell whether the index is up to date for `path` opened with
+        `encoding`.
+        """
+        try:
+            status = os.stat(path)
+        except OSError:
+            return False
+        return (status.st_size == self.size and status.st_mtime == self.mtime
+                and (encoding or '') == self.requested_encoding)
+
+    def spans(self, start=None, end=None):
+        """
+        spans([start][, end]) -> list of (begin, end) byte offsets
+
+        Return the byte ranges of the checkpoint groups holding cues which
+        end after `start` and start before `end` ordinals, adjacent groups
+        being merged. None bounds are open.
+        """
+        interval = self.interval
+        offsets = self.offsets
+        count = len(offsets)
+        spans = []
+        for group in range(len(self.starts)):
+            if end is not None and self.starts[group] >= end:
+                continue
+            if start is not None and self.ends[group] <= start:
+                continue
+            first = group * interval
+            last = first + interval
+            span_end = offsets[last] if last < count else self.size
+            if spans and spans[-1][1] == offsets[first]:
+                spans[-1] = (spans[-1][0], span_end)
+            else:
+                spans.append((offsets[first], span_end))
+        return spans
+
+    def dumps(self):
+        """
+        dumps() -> bytes
+        """
+        return b''.join((
+            HEADER.pack(MAGIC, VERSION, self.interval, self.size, self.mtime,
+                        len(self.offsets)),
+            _pack_string(self.requested_encoding),
+            _pack_string(self.encoding),
+            _pack_string(self.eol),
+            _pack_integers(self.offsets),
+            _pack_integers(self.starts),
+            _pack_integers(self.ends),
+        ))
+
+    @classmethod
+    def loads(cls, data):
+        """
+        loads(data) -> OffsetIndex
+
+        Raise InvalidBinary if `data` is not a valid index.
+        """
+        try:
+            magic, version, interval, size, mtime, count = \
+                HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise InvalidBinary('Not an offset index')
+            if version != VERSION:
+                raise InvalidBinary('Unsupported version: %d' % version)
+            offset = HEADER.size
+            strings = []
+            for _ in range(3):
+                length, = LENGTH.unpack_from(data, offset)
+                offset += LENGTH.size
+                if offset + length > len(data):
+                    raise InvalidBinary('Truncated data')
+                strings.append(data[offset:offset + length].decode('utf-8'))
+                offset += length
+            requested_encoding, encoding, eol = strings
+            groups = (count + interval - 1) // interval if interval else 0
+            offsets = struct.unpack_from('<%dq' % count, data, offset)
+            offset += 8 * count
+            starts = struct.unpack_from('<%dq' % groups, data, offset)
+            offset += 8 * groups
+            ends = struct.unpack_from('<%dq' % groups, data, offset)
+        except (struct.error, UnicodeDecodeError) as error:
+            raise InvalidBinary(str(error))
+        return cls(offsets, starts, ends, size, mtime, encoding, eol,
+                   interval, requested_encoding)
+
+    @classmethod
+    def load(cls, path):
+        """
+        load(path) -> OffsetIndex
+        """
+        with open(path, 'rb') as index_file:
+            return cls.loads(index_file.read())
+
+    def save(self, path):
+        """
+        save(path)
+
+        Write the index atomically to `path`.
+        """
+        handle, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(handle, 'wb') as index_file:
+                index_file.write(self.dumps())
+            getattr(os, 'replace', os.rename)(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
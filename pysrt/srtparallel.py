@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel parsing of big SubRip sources
+
+The decoded source is cut at blank lines into chunks, parsed by a pool of
+processes. Items come back as binary dumps (see pysrt.srtbinary), much
+cheaper to load than pickled items, and are yielded in source order.
+
+Errors are reported as if the source had been parsed at once: the same
+line numbers and byte offsets, and with ERROR_LOG the same log, written in
+order by the calling process. With ERROR_RAISE, the first invalid block is
+raised once previous chunks have been yielded.
+"""
+import re
+import sys
+import multiprocessing
+
+from pysrt import srtbinary
+from pysrt.compat import str
+
+# Sources are cut in chunks of at least that many characters
+MIN_CHUNK_SIZE = 256 * 1024
+# Chunks per worker, more of them balance the load between workers better
+CHUNKS_PER_WORKER = 4
+
+BLANK_LINE = re.compile(r'\n[ \t\r\f\v]*\n')
+
+
+class _Log(list):
+    # Stand-in for sys.stderr in workers, so that ERROR_LOG messages are
+    # written in source order by the calling process
+    write = list.append
+
+
+def split(source, count):
+    """
+    split(source, count) -> list of (chunk, lines before chunk)
+
+    Cut `source` into at most `count` chunks of similar size, each ending
+    right after a blank line, so that no block is cut.
+    """
+    size = len(source)
+    chunks = []
+    start = line = 0
+    for part in range(1, count):
+        match = BLANK_LINE.search(source, max(size * part // count, start))
+        if match is None:
+            break
+        chunk = source[start:match.end()]
+        chunks.append((chunk, line))
+        line += len(chunk.splitlines())
+        start = match.end()
+    chunks.append((source[start:], line))
+    return chunks
+
+
+def parse(source, workers=0, error_handling=0, parser=None, stats=None,
+          errors=None):
+    """
+    parse(source[, workers][, error_handling][, parser][, stats][, errors])
+    -> iterator of SubRipItem
+
+    `source` -> a unicode string, or any iterable that yield unicode
+        strings, read at once.
+    `workers` -> number of processes, 0 for one per CPU. Sources are
+        parsed by the calling process when there is a single CPU, or when
+        they are too small to be cut in several MIN_CHUNK_SIZE chunks.
+
+    Other arguments are the ones of SubRipFile.stream. `parser` is used by
+    every worker on its chunks. Counters and timings of `stats` are the sum
+    of the ones of all workers, plus the time spent reading `source`.
+    """
+    from pysrt.srtfile import SubRipFile
+    if parser not in (None, SubRipFile.PARSER_TOLERANT,
+                      SubRipFile.PARSER_FAST):
+        raise ValueError('Unknown parser: %r' % (parser, ))
+    if error_handling == SubRipFile.ERROR_COLLECT and errors is None:
+        raise ValueError('ERROR_COLLECT requires an errors list')
+
+    if not isinstance(source, str):
+        if stats is not None:
+            started = stats.clock()
+        if hasattr(source, 'read'):
+            source = source.read()
+        else:
+            source = ''.join(source)
+        if stats is not None:
+            stats.decode_time += stats.clock() - started
+
+    workers = workers or multiprocessing.cpu_count()
+    count = min(workers * CHUNKS_PER_WORKER, len(source) // MIN_CHUNK_SIZE)
+    chunks = split(source, count) if workers > 1 else [(source, 0)]
+    if len(chunks) == 1:
+        return SubRipFile.stream(source.splitlines(True), error_handling,
+                                 parser, stats=stats, errors=errors)
+    return _parse_chunks(chunks, min(workers, len(chunks)), error_handling,
+                         parser, stats, errors)
+
+
+def _parse_chunks(chunks, workers, error_handling, parser, stats, errors):
+    from pysrt.srtfile import SubRipFile
+    tasks = []
+    offset = 0
+    for chunk, line in chunks:
+        chunk_errors = None
+        if errors is not None:
+            chunk_errors = errors.part(line, offset)
+            offset += len(chunk.encode(errors.encoding or 'utf-8'))
+        chunk_stats = None if stats is None else stats.__class__()
+        tasks.append((chunk, line, error_handling, parser, chunk_stats,
+                      chunk_errors))
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        for data, log, chunk_stats, chunk_errors in pool.imap(_parse_chunk,
+                                                               tasks):
+            if log:
+                sys.stderr.write(''.join(log))
+            if chunk_stats is not None:
+                stats.update(chunk_stats)
+            if chunk_errors is not None:
+                errors.update(chunk_errors)
+            for item in SubRipFile.from_binary(data):
+                yield item
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _parse_chunk(task):
+    from pysrt.srtfile import SubRipFile
+    chunk, line, error_handling, parser, stats, errors = task
+    if parser == SubRipFile.PARSER_FAST:
+        stream = SubRipFile._stream_fast
+    else:
+        stream = SubRipFile._stream_tolerant
+    log = None
+    if error_handling == SubRipFile.ERROR_LOG:
+        stderr = sys.stderr
+        sys.stderr = log = _Log()
+    try:
+        items = stream(chunk.splitlines(True), error_handling, stats=stats,
+                       errors=errors, line_offset=line)
+        data = srtbinary.dumps((item.index, item.start.ordinal,
+                                item.end.ordinal, item.text, item.position)
+                               for item in items)
+    finally:
+        if log is not None:
+            sys.stderr = stderr
+    return data, log, stats, errors
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Single pass SubRip parser working on a whole decoded buffer.
+
+Well formed cues are extracted by a single compiled regex giving all
+eight time fields at once. Anything else is left to the tolerant
+SubRipItem.from_lines parser by the caller.
+"""
+import re
+
+from pysrt.srtitem import SubRipItem, LazySubRipItem
+from pysrt.srttime import SubRipTime
+
+# A block is a run of lines containing at least one non blank character.
+RE_BLOCK = re.compile(r'(?:[^\S\n]*\S[^\n]*(?:\n|\Z))+')
+RE_CUE = re.compile(
+    r'(?:[^\S\n]*(\d+)[^\S\n]*\n)?'
+    r'([^\S\n]*(\d+):(\d+):(\d+)[,.](\d+)[^\S\n]*-->'
+    r'[^\S\n]*(\d+):(\d+):(\d+)[,.](\d+)'
+    r'(?: [^\S\n]*((?:(?!-->)[^\n])*?))?[^\S\n]*)'
+    r'(?:\n(.*))?\Z', re.DOTALL)
+RE_TRAILING_SPACES = re.compile(r'[^\S\n]+$', re.MULTILINE)
+# Every character but \n that str.splitlines() considers a line boundary.
+RE_LINE_BOUNDARIES = re.compile(
+    u'[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+HOURS_RATIO = SubRipTime.HOURS_RATIO
+MINUTES_RATIO = SubRipTime.MINUTES_RATIO
+SECONDS_RATIO = SubRipTime.SECONDS_RATIO
+
+
+def normalize_newlines(buffer):
+    """
+    Make `\\n` the only line boundary of `buffer`, like line based
+    iteration would.
+    """
+    if RE_LINE_BOUNDARIES.search(buffer):
+        return '\n'.join(buffer.splitlines()) + '\n'
+    return buffer
+
+
+def iter_blocks(buffer):
+    """
+    Yield a match object for each block of non blank lines of `buffer`.
+    """
+    return RE_BLOCK.finditer(buffer)
+
+
+def match_cue(buffer, block):
+    """
+    Return the RE_CUE match for `block`, or None if it is not well formed
+    enough to be handled by the fast path.
+    """
+    match = RE_CUE.match(buffer, block.start(), block.end())
+    if match is None or match.group(1) is None and not match.group(12):
+        return None
+    return match
+
+
+def make_time(ordinal):
+    # Skip SubRipTime.__init__ arithmetic, the ordinal is already known.
+    time = SubRipTime.__new__(SubRipTime)
+    time.ordinal = ordinal
+    return time
+
+
+def item_from_match(match, lazy=False):
+    """
+    Build a SubRipItem, or a LazySubRipItem if `lazy`, out of a match
+    returned by `match_cue()`.
+    """
+    groups = match.groups()
+    index, timestamps, position, text = \
+        groups[0], groups[1], groups[10], groups[11]
+    (start_hours, start_minutes, start_seconds, start_milliseconds,
+     end_hours, end_minutes, end_seconds, end_milliseconds) = \
+        map(int, groups[2:10])
+    start = make_time(start_hours * HOURS_RATIO
+                      + start_minutes * MINUTES_RATIO
+                      + start_seconds * SECONDS_RATIO
+                      + start_milliseconds)
+    end = make_time(end_hours * HOURS_RATIO
+                    + end_minutes * MINUTES_RATIO
+                    + end_seconds * SECONDS_RATIO
+                    + end_milliseconds)
+    if lazy:
+        return LazySubRipItem(index, start, end, (timestamps, text or ''))
+    if text:
+        if text.endswith('\n'):
+            text = text[:-1]
+        text = RE_TRAILING_SPACES.sub('', text)
+    return SubRipItem(index, start, end, text or '', position or '')
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental SubRip parser fed with bytes
+"""
+import codecs
+
+from pysrt.srtfile import SubRipFile, BOMS, BIGGER_BOM
+from pysrt.srtitem import SubRipItem, LazySubRipItem
+from pysrt.srterrors import SubRipErrors
+
+
+class SubRipPushParser(object):
+    """
+    SubRipPushParser([encoding][, error_handling][, lazy][, max_errors])
+
+    Push style parser for SubRip data received as arbitrary byte chunks,
+    e.g. from a socket. Chunks may end anywhere, including in the middle
+    of a line or of a multi bytes character: `feed()` returns the items
+    completed by each chunk, and `close()` the remaining ones.
+
+    Items, and line numbers reported by `error_handling`, are the same as
+    SubRipFile.stream would give for the whole data. Encoding is detected
+    from the byte order mark if not provided, like in SubRipFile.open.
+
+    `eol` is set to the end of line of the first line once known. With
+    SubRipFile.ERROR_COLLECT, invalid blocks are recorded in `errors`, at
+    most `max_errors` of them.
+
+    Example:
+        >>> parser = SubRipPushParser()
+        >>> for chunk in iter(lambda: connection.recv(4096), b''):
+        ...     for item in parser.feed(chunk):
+        ...         print(item.text)
+        >>> for item in parser.close():
+        ...     print(item.text)
+    """
+
+    def __init__(self, encoding=None, error_handling=SubRipFile.ERROR_PASS,
+                 lazy=False, max_errors=None):
+        self.encoding = encoding
+        self.error_handling = error_handling
+        self.item_class = LazySubRipItem if lazy else SubRipItem
+        self.eol = None
+        self.closed = False
+        self._decoder = None
+        self._head = b''
+        self._pending = ''
+        self._block = []
+        self._line_count = 0
+        self.errors = SubRipErrors(max_errors, encoding)
+
+    def feed(self, data):
+        """
+        feed(data) -> list of SubRipItem
+
+        Parse a chunk of bytes and return the items it completes.
+        """
+        if self.closed:
+            raise ValueError('feed() called on a closed parser')
+        if self._decoder is None:
+            # Wait for enough bytes to recognize a byte order mark
+            self._head += data
+            if len(self._head) < BIGGER_BOM:
+                return []
+            data = self._start()
+        return self._parse(self._decoder.decode(data))
+
+    def close(self):
+        """
+        close() -> list of SubRipItem
+
+        Signal the end of data and return the last items. Raise
+        UnicodeDecodeError if data ends in the middle of a character.
+        """
+        if self.closed:
+            return []
+        data = self._start() if self._decoder is None else b''
+        items = self._parse(self._decoder.decode(data, True), final=True)
+        self.closed = True
+        return items
+
+    def _start(self):
+        data = self._head
+        self._head = None
+        encoding = self.encoding
+        bom_length = 0
+        for bom, bom_encoding in BOMS:
+            if data.startswith(bom):
+                encoding = encoding or bom_encoding
+                if codecs.lookup(encoding).name == \
+                        codecs.lookup(bom_encoding).name:
+                    data = data[len(bom):]
+                    bom_length = len(bom)
+                break
+        self.encoding = encoding or SubRipFile.DEFAULT_ENCODING
+        self.errors = SubRipErrors(self.errors.max_errors, self.encoding,
+                                   bom_length)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)()
+        return data
+
+    def _parse(self, text, final=False):
+        text = self._pending + text
+        self._pending = ''
+        lines = text.splitlines(True)
+        if final:
+            lines.append('\n')  # flush the last block like SubRipFile.stream
+        elif lines:
+            last = lines[-1]
+            # Keep incomplete lines, including those ending with a \r which
+            # may be followed by a \n in the next chunk.
+            if last.endswith('\r') or last.splitlines() == [last]:
+                self._pending = lines.pop()
+        if self.eol is None and lines and not (final and len(lines) == 1):
+            self.eol = SubRipFile._guess_eol(lines)
+
+        items = []
+        block = self._block
+        errors = None
+        if self.error_handling == SubRipFile.ERROR_COLLECT:
+            errors = self.errors
+            lines = errors.track(lines)
+        for line in lines:
+            if line.strip():
+                block.append(line)
+            elif block:
+                item = SubRipFile._parse_block(self.item_class, block,
+                                               self.error_handling,
+                                               self._line_count, errors=errors)
+                if item is not None:
+                    items.append(item)
+                block = self._block = []
+            self._line_count += 1
+        return items
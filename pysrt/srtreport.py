@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Timing and reading speed checks of subtitle files
+"""
+
+
+class SubRipReport(object):
+    """
+    SubRipReport(count)
+
+    Returned by SubRipFile.analyze(). Cues are referred to by their row,
+    their position in the file, and durations are in milliseconds.
+
+    count -> int: number of cues.
+    overlaps -> list of (row, other row, overlap) tuples: cues starting
+        before the end of an earlier starting one, the one ending last.
+    short_gaps -> list of (row, next row, gap) tuples: cues followed by
+        another one less than `min_gap` after their end.
+    negative_durations -> list of rows of cues ending before they start,
+        left out of overlaps and short gaps.
+    min_duration, max_duration -> (duration, row) tuples, None if there
+        is no cue.
+    cps_outliers -> list of (row, characters per second) tuples of cues
+        read faster than `max_cps`.
+    """
+    MIN_GAP = 80  # two frames at 25 fps
+    MAX_CPS = 25.0
+
+    def __init__(self, count=0):
+        self.count = count
+        self.overlaps = []
+        self.short_gaps = []
+        self.negative_durations = []
+        self.min_duration = None
+        self.max_duration = None
+        self.cps_outliers = []
+
+    @property
+    def problems_count(self):
+        return (len(self.overlaps) + len(self.short_gaps)
+                + len(self.negative_durations) + len(self.cps_outliers))
+
+    @classmethod
+    def analyze(cls, starts, ends, speeds=None, min_gap=MIN_GAP,
+                max_cps=MAX_CPS):
+        """
+        analyze(starts, ends[, speeds][, min_gap][, max_cps]) -> SubRipReport
+
+        `starts`, `ends` -> sequences of start and end ordinals per row.
+        `speeds` -> sequence of characters per second per row, required
+            unless `max_cps` is None.
+
+        Cues are sorted by start once, then checked in a single pass.
+        """
+        count = len(starts)
+        report = cls(count)
+        overlaps = report.overlaps
+        short_gaps = report.short_gaps
+        min_duration = max_duration = None
+        # Row of the cue ending last among the ones already seen
+        last_row = last_end = None
+        for row in sorted(range(count), key=lambda row: (starts[row], ends[row])):
+            start = starts[row]
+            end = ends[row]
+            duration = end - start
+            if min_duration is None or duration < min_duration[0]:
+                min_duration = (duration, row)
+            if max_duration is None or duration > max_duration[0]:
+                max_duration = (duration, row)
+            if duration < 0:
+                # Reported on their own, not as overlaps nor gaps
+                report.negative_durations.append(row)
+                continue
+            if last_row is not None:
+                if start < last_end:
+                    overlaps.append((row, last_row, min(end, last_end) - start))
+                elif start - last_end < min_gap:
+                    short_gaps.append((last_row, row, start - last_end))
+            if last_row is None or end > last_end:
+                last_row = row
+                last_end = end
+        report.negative_durations.sort()
+        report.min_duration = min_duration
+        report.max_duration = max_duration
+
+        if max_cps is not None:
+            report.cps_outliers = [(row, cps) for row, cps in enumerate(speeds)
+                                   if cps > max_cps]
+        return report
+
+    def as_dict(self):
+        """
+        as_dict() -> dict of every attribute
+        """
+        return {
+            'count': self.count,
+            'overlaps': list(self.overlaps),
+            'short_gaps': list(self.short_gaps),
+            'negative_durations': list(self.negative_durations),
+            'min_duration': self.min_duration,
+            'max_duration': self.max_duration,
+            'cps_outliers': list(self.cps_outliers),
+        }
+
+    def __repr__(self):
+        return ('<%s %d cues, %d overlaps, %d short gaps, %d negative '
+                'durations, %d cps outliers>' % (
+                    self.__class__.__name__, self.count, len(self.overlaps),
+                    len(self.short_gaps), len(self.negative_durations),
+                    len(self.cps_outliers)))
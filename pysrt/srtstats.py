@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Counters and timings of parsing and serialization
+"""
+import timeit
+from itertools import islice
+
+
+class SubRipStats(object):
+    """
+    SubRipStats()
+
+    Given as `stats` argument to SubRipFile.open, from_string, read, stream
+    and to the serialization methods, it accumulates what they did. The same
+    instance can be used for several files, or reset().
+
+    Parsing:
+        bytes_read -> int: bytes read from the file by SubRipFile.open.
+        lines -> int: decoded lines.
+        cues -> int: items parsed.
+        errors -> dict: invalid blocks count by error class name.
+        decode_time -> float: seconds spent reading and decoding the source.
+        parse_time -> float: seconds spent splitting the source into blocks
+            (and matching cues with the fast parser).
+        build_time -> float: seconds spent turning blocks into items.
+
+    Serialization:
+        cues_written -> int: items serialized.
+        bytes_written -> int: encoded bytes, by save and to_bytes.
+        serialize_time -> float: seconds spent turning items into strings.
+        encode_time -> float: seconds spent encoding strings into bytes.
+        write_time -> float: seconds spent in the output file write calls.
+
+    Timings are taken once per cue, per batch of lines when reading line by
+    line, or per chunk of cues when writing, so that stats are cheap enough
+    to be left on. Time spent by the caller between two yielded items is
+    never counted.
+    """
+    clock = staticmethod(timeit.default_timer)
+
+    # Values read at once by timed()
+    BATCH_SIZE = 64
+
+    COUNTERS = ('bytes_read', 'lines', 'cues', 'cues_written',
+                'bytes_written')
+    TIMINGS = ('decode_time', 'parse_time', 'build_time', 'serialize_time',
+               'encode_time', 'write_time')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Set every counter and timing back to zero.
+        """
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        for name in self.TIMINGS:
+            setattr(self, name, 0.0)
+        self.errors = {}
+
+    @property
+    def errors_count(self):
+        return sum(self.errors.values())
+
+    def add_error(self, error):
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def timed(self, iterable, attribute):
+        """
+        timed(iterable, attribute) -> iterator
+
+        Yield the values of `iterable`, adding the time spent producing
+        them to `attribute` once exhausted or closed. Values are read
+        BATCH_SIZE at a time to only read the clock twice per batch.
+        """
+        clock = self.clock
+        iterator = iter(iterable)
+        batch_size = self.BATCH_SIZE
+        elapsed = 0.0
+        try:
+            while True:
+                started = clock()
+                values = list(islice(iterator, batch_size))
+                elapsed += clock() - started
+                if not values:
+                    return
+                for value in values:
+                    yield value
+        finally:
+            setattr(self, attribute, getattr(self, attribute) + elapsed)
+
+    def update(self, other):
+        """
+        Add the counters and timings of another SubRipStats.
+        """
+        for name in self.COUNTERS + self.TIMINGS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name, count in other.errors.items():
+            self.errors[name] = self.errors.get(name, 0) + count
+
+    def as_dict(self):
+        """
+        as_dict() -> dict of every counter and timing
+        """
+        values = dict((name, getattr(self, name))
+                      for name in self.COUNTERS + self.TIMINGS)
+        values['errors'] = dict(self.errors)
+        return values
+
+    def __repr__(self):
+        return '<%s %d cues, %d errors, %d lines, %d bytes read>' % (
+            self.__class__.__name__, self.cues, self.errors_count,
+            self.lines, self.bytes_read)
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+Column oriented storage for SubRipFile
+"""
+from array import array
+
+try:
+    from collections.abc import MutableSequence
+except ImportError:
+    from collections import MutableSequence
+
+from pysrt.srttime import SubRipTime
+from pysrt.srtitem import SubRipItem
+from pysrt.compat import str
+
+try:
+    array('q')
+    INTEGER_TYPECODE = 'q'
+except ValueError:  # Python 2 has no long long arrays
+    INTEGER_TYPECODE = 'l'
+
+
+class ColumnarTime(SubRipTime):
+    """
+    SubRipTime whose ordinal lives in a ColumnarStorage column.
+
+    Instances built by `bind()` read and write the storage directly, while
+    instances built the usual way (e.g. as the result of an arithmetic
+    operation) behave like plain SubRipTime values.
+    """
+    __slots__ = ('_storage', '_column', '_row', '_ordinal')
+
+    def __init__(self, *args, **kwargs):
+        self._storage = None
+        self._column = None
+        self._row = None
+        super(ColumnarTime, self).__init__(*args, **kwargs)
+
+    @classmethod
+    def bind(cls, storage, column, row):
+        view = cls.__new__(cls)
+        view._storage = storage
+        view._column = column
+        view._row = row
+        return view
+
+    def _get_ordinal(self):
+        if self._storage is None:
+            return self._ordinal
+        return getattr(self._storage, self._column)[self._row]
+
+    def _set_ordinal(self, ordinal):
+        if self._storage is None:
+            self._ordinal = ordinal
+        else:
+            getattr(self._storage, self._column)[self._row] = int(ordinal)
+
+    ordinal = property(_get_ordinal, _set_ordinal)
+
+    def __reduce__(self):
+        return (SubRipTime, (0, 0, 0, self.ordinal))
+
+
+class ColumnarItem(SubRipItem):
+    """
+    SubRipItem view over a ColumnarStorage row.
+
+    Views are bound to a row position: any change made through them is
+    written back to the storage, but they will point to another cue once
+    rows are inserted, removed or reordered.
+    """
+    __slots__ = ('_storage', '_row')
+
+    def __init__(self, storage, row):
+        self._storage = storage
+        self._row = row
+
+    def _get_index(self):
+        return self._storage.indexes[self._row]
+
+    def _set_index(self, index):
+        self._storage.set_index(self._row, index)
+
+    index = property(_get_index, _set_index)
+
+    def _get_start(self):
+        return ColumnarTime.bind(self._storage, 'starts', self._row)
+
+    def _set_start(self, start):
+        self._storage.starts[self._row] = SubRipTime.coerce(start).ordinal
+
+    start = property(_get_start, _set_start)
+
+    def _get_end(self):
+        return ColumnarTime.bind(self._storage, 'ends', self._row)
+
+    def _set_end(self, end):
+        self._storage.ends[self._row] = SubRipTime.coerce(end).ordinal
+
+    end = property(_get_end, _set_end)
+
+    def _get_text(self):
+        return self._storage.texts[self._row]
+
+    def _set_text(self, text):
+        self._storage.texts[self._row] = str(text)
+
+    text = property(_get_text, _set_text)
+
+    def _get_position(self):
+        return self._storage.positions[self._storage.position_ids[self._row]]
+
+    def _set_position(self, position):
+        storage = self._storage
+        storage.position_ids[self._row] = storage.position_id(position)
+
+    position = property(_get_position, _set_position)
+
+    def __reduce__(self):
+        return (SubRipItem, self._storage._get_row(self._row))
+
+
+class ColumnarStorage(MutableSequence):
+    """
+    ColumnarStorage(items)
+
+    Mutable sequence of SubRipItem storing cues as columns instead of
+    objects: indexes, start and end ordinals are kept in integer arrays,
+    texts in a list and positions in a deduplicated string table.
+
+    Items are materialized lazily as ColumnarItem views on access.
+    """
+
+    def __init__(self, items=()):
+        self.indexes = array(INTEGER_TYPECODE)
+        self.starts = array(INTEGER_TYPECODE)
+        self.ends = array(INTEGER_TYPECODE)
+        self.texts = []
+        self.positions = ['']
+        self.position_ids = array('L')
+        self._position_table = {'': 0}
+        self.extend(items)
+
+    @classmethod
+    def from_columns(cls, indexes, starts, ends, texts, positions,
+                     position_ids):
+        """
+        from_columns(indexes, starts, ends, texts, positions, position_ids)
+        -> ColumnarStorage
+
+        Build a storage straight from column values, `positions` being the
+        table of distinct positions referenced by `position_ids`, starting
+        with ''.
+        """
+        storage = cls()
+        try:
+            storage.indexes = array(INTEGER_TYPECODE, indexes)
+        except (TypeError, OverflowError):
+            storage.indexes = list(indexes)
+        storage.starts = array(INTEGER_TYPECODE, starts)
+        storage.ends = array(INTEGER_TYPECODE, ends)
+        storage.texts = list(texts)
+        storage.positions = list(positions)
+        storage.position_ids = array('L', position_ids)
+        storage._position_table = dict(
+            (position, position_id)
+            for position_id, position in enumerate(storage.positions))
+        return storage
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield ColumnarItem(self, row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ColumnarItem(self, row)
+                    for row in range(*index.indices(len(self)))]
+        return ColumnarItem(self, self._row(index))
+
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            rows = range(start, stop, step)
+            values = [self._unpack(i) for i in item]
+            if step == 1:
+                del self[index]
+                for offset, value in enumerate(values):
+                    self._insert_row(start + offset, value)
+                return
+            if len(values) != len(rows):
+                raise ValueError('attempt to assign sequence of size %d to '
+                                 'extended slice of size %d'
+                                 % (len(values), len(rows)))
+            for row, value in zip(rows, values):
+                self._set_row(row, value)
+            return
+        self._set_row(self._row(index), self._unpack(item))
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                for column in self._columns():
+                    del column[start:stop]
+            else:
+                for row in sorted(range(start, stop, step), reverse=True):
+                    self._delete_row(row)
+            return
+        self._delete_row(self._row(index))
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, count):
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def insert(self, index, item):
+        row = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        self._insert_row(row, self._unpack(item))
+
+    def append(self, item):
+        self._insert_row(len(self), self._unpack(item))
+
+    def extend(self, items):
+        if items is self:
+            items = list(items)
+        for item in items:
+            self.append(item)
+
+    def pop(self, index=-1):
+        row = self._row(index)
+        item = SubRipItem(*self._get_row(row))
+        self._delete_row(row)
+        return item
+
+    def clear(self):
+        del self[:]
+
+    def reverse(self):
+        for column in self._columns():
+            column.reverse()
+
+    def sort(self, key=None, reverse=False):
+        """
+        sort([key][, reverse])
+
+        Reorder rows. Without `key`, rows are sorted by start and end
+        ordinals straight from the columns without building any view.
+        """
+        if key is None:
+            starts, ends = self.starts, self.ends
+            sort_key = lambda row: (starts[row], ends[row])
+        else:
+            sort_key = lambda row: key(ColumnarItem(self, row))
+        order = sorted(range(len(self)), key=sort_key, reverse=reverse)
+        self.indexes = self._reorder(self.indexes, order)
+        self.starts = self._reorder(self.starts, order)
+        self.ends = self._reorder(self.ends, order)
+        self.texts = self._reorder(self.texts, order)
+        self.position_ids = self._reorder(self.position_ids, order)
+
+    def set_index(self, row, index):
+        try:
+            index = int(index)
+        except (TypeError, ValueError):
+            pass
+        try:
+            self.indexes[row] = index
+        except (TypeError, OverflowError):
+            # Not every index fits an integer array: fallback to a list
+            self.indexes = list(self.indexes)
+            self.indexes[row] = index
+
+    def position_id(self, position):
+        position = str(position)
+        try:
+            return self._position_table[position]
+        except KeyError:
+            self.positions.append(position)
+            position_id = self._position_table[position] = len(self.positions) - 1
+            return position_id
+
+    def _columns(self):
+        return (self.indexes, self.starts, self.ends, self.texts,
+                self.position_ids)
+
+    def _row(self, index):
+        length = len(self)
+        row = index + length if index < 0 else index
+        if not 0 <= row < length:
+            raise IndexError('list index out of range')
+        return row
+
+    def _get_row(self, row):
+        return (self.indexes[row], self.starts[row], self.ends[row],
+                self.texts[row], self.positions[self.position_ids[row]])
+
+    def _set_row(self, row, values):
+        index, start, end, text, position = values
+        self.set_index(row, index)
+        self.starts[row] = start
+        self.ends[row] = end
+        self.texts[row] = text
+        self.position_ids[row] = self.position_id(position)
+
+    def _insert_row(self, row, values):
+        self.indexes.insert(row, 0)
+        self.starts.insert(row, 0)
+        self.ends.insert(row, 0)
+        self.texts.insert(row, '')
+        self.position_ids.insert(row, 0)
+        self._set_row(row, values)
+
+    def _delete_row(self, row):
+        for column in self._columns():
+            del column[row]
+
+    @staticmethod
+    def _reorder(column, order):
+        if isinstance(column, array):
+            return array(column.typecode, [column[row] for row in order])
+        return [column[row] for row in order]
+
+    @staticmethod
+    def _unpack(item):
+        # Read every field before writing anything so that assigning a view
+        # of the storage to another row never sees half updated values.
+        return (item.index, int(item.start.ordinal), int(item.end.ordinal),
+                str(item.text), item.position)
@@ -32,6 +32,8 @@ class TimeItemDescriptor(object):
 
 
 class SubRipTime(ComparableMixin):
+    __slots__ = ('ordinal', )
+
     TIME_PATTERN = '%02d:%02d:%02d,%03d'
     TIME_REPR = 'SubRipTime(%d, %d, %d, %d)'
     RE_TIME_SEP = re.compile(r'\:|\.|\,')
@@ -39,6 +41,13 @@ class SubRipTime(ComparableMixin):
     SECONDS_RATIO = 1000
     MINUTES_RATIO = SECONDS_RATIO * 60
     HOURS_RATIO = MINUTES_RATIO * 60
+    # Bounded memos of from_string() and str() results, shared by all
+    # instances since the same timestamps recur a lot (e.g. round seconds).
+    # Kept per class, subclasses may parse or format times differently.
+    # See set_cache_size().
+    CACHE_SIZE = 4096
+    _parsed = {}
+    _formatted = {}
 
     hours = TimeItemDescriptor(HOURS_RATIO)
     minutes = TimeItemDescriptor(MINUTES_RATIO, HOURS_RATIO)
@@ -60,18 +69,64 @@ class SubRipTime(ComparableMixin):
     def __repr__(self):
         return self.TIME_REPR % tuple(self)
 
-    def __str__(self):
-        if self.ordinal < 0:
-            # Represent negative times as zero
-            return str(SubRipTime.from_ordinal(0))
-        return self.TIME_PATTERN % tuple(self)
+    def __getstate__(self):
+        # A tuple, since a falsy state (a zero ordinal) would never be given
+        # to __setstate__ by protocols 0 and 1
+        return (self.ordinal, )
 
-    def _compare(self, other, method):
-        return super(SubRipTime, self)._compare(self.coerce(other), method)
+    def __setstate__(self, state):
+        self.ordinal, = state
+
+    def __str__(self):
+        ordinal = self.ordinal
+        try:
+            formatted = self._formatted[self.__class__]
+        except KeyError:
+            formatted = self._formatted[self.__class__] = {}
+        string = formatted.get(ordinal)
+        if string is None:
+            string = self.format_ordinal(ordinal)
+            if len(formatted) >= self.CACHE_SIZE:
+                formatted.clear()
+            if self.CACHE_SIZE:
+                formatted[ordinal] = string
+        return string
 
     def _cmpkey(self):
         return self.ordinal
 
+    # Rich comparisons work on ordinals directly, coercing only when the
+    # other operand is not already a SubRipTime.
+    def __lt__(self, other):
+        if isinstance(other, SubRipTime):
+            return self.ordinal < other.ordinal
+        return self.ordinal < self.coerce(other).ordinal
+
+    def __le__(self, other):
+        if isinstance(other, SubRipTime):
+            return self.ordinal <= other.ordinal
+        return self.ordinal <= self.coerce(other).ordinal
+
+    def __eq__(self, other):
+        if isinstance(other, SubRipTime):
+            return self.ordinal == other.ordinal
+        return self.ordinal == self.coerce(other).ordinal
+
+    def __ge__(self, other):
+        if isinstance(other, SubRipTime):
+            return self.ordinal >= other.ordinal
+        return self.ordinal >= self.coerce(other).ordinal
+
+    def __gt__(self, other):
+        if isinstance(other, SubRipTime):
+            return self.ordinal > other.ordinal
+        return self.ordinal > self.coerce(other).ordinal
+
+    def __ne__(self, other):
+        if isinstance(other, SubRipTime):
+            return self.ordinal != other.ordinal
+        return self.ordinal != self.coerce(other).ordinal
+
     def __add__(self, other):
         return self.from_ordinal(self.ordinal + self.coerce(other).ordinal)
 
@@ -133,6 +188,31 @@ class SubRipTime(ComparableMixin):
             self *= kwargs.pop('ratio')
         self += self.__class__(*args, **kwargs)
 
+    @classmethod
+    def format_ordinal(cls, ordinal):
+        """
+        int -> HH:MM:SS,mmm string of a total count of milliseconds,
+        negative ones being represented as zero.
+        """
+        if ordinal < 0:
+            return cls.TIME_PATTERN % (0, 0, 0, 0)
+        hours, rest = divmod(ordinal, cls.HOURS_RATIO)
+        minutes, rest = divmod(rest, cls.MINUTES_RATIO)
+        seconds, milliseconds = divmod(rest, cls.SECONDS_RATIO)
+        return cls.TIME_PATTERN % (hours, minutes, seconds, milliseconds)
+
+    @classmethod
+    def set_cache_size(cls, size):
+        """
+        set_cache_size(size)
+
+        Bound the from_string() and str() memos to `size` entries each, 0
+        disabling them. Memos are emptied once full.
+        """
+        SubRipTime.CACHE_SIZE = size
+        SubRipTime._parsed.clear()
+        SubRipTime._formatted.clear()
+
     @classmethod
     def from_ordinal(cls, ordinal):
         """
@@ -146,10 +226,28 @@ class SubRipTime(ComparableMixin):
         str/unicode(HH:MM:SS,mmm) -> SubRipTime corresponding to serial
         raise InvalidTimeString
         """
-        items = cls.RE_TIME_SEP.split(source)
-        if len(items) != 4:
-            raise InvalidTimeString
-        return cls(*(cls.parse_int(i) for i in items))
+        try:
+            parsed = cls._parsed[cls]
+        except KeyError:
+            parsed = cls._parsed[cls] = {}
+        ordinal = parsed.get(source)
+        if ordinal is None:
+            items = cls.RE_TIME_SEP.split(source)
+            if len(items) != 4:
+                raise InvalidTimeString
+            hours, minutes, seconds, milliseconds = map(cls.parse_int, items)
+            ordinal = hours * cls.HOURS_RATIO + minutes * cls.MINUTES_RATIO \
+                + seconds * cls.SECONDS_RATIO + milliseconds
+            if len(parsed) >= cls.CACHE_SIZE:
+                parsed.clear()
+            if cls.CACHE_SIZE:
+                parsed[source] = ordinal
+        if cls is SubRipTime:
+            # Skip __init__ arithmetic, the ordinal is already known.
+            instance = cls.__new__(cls)
+            instance.ordinal = ordinal
+            return instance
+        return cls(milliseconds=ordinal)
 
     @classmethod
     def parse_int(cls, digits):
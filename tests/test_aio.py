@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt.compat import str
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from pysrt import aio
+else:
+    aio = None
+
+
+def collect(loop, iterator):
+    # No async for here, this module must stay importable by Python 2
+    items = []
+    while True:
+        try:
+            items.append(loop.run_until_complete(iterator.__anext__()))
+        except StopAsyncIteration:
+            return items
+
+
+@unittest.skipIf(aio is None, 'asyncio API requires Python 3.5')
+class TestAio(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+        self.utf8_path = os.path.join(self.static_path, 'utf-8.srt')
+        self.expected = pysrt.open(self.utf8_path)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def reader(self, data, chunk_size):
+        reader = asyncio.StreamReader(loop=self.loop) \
+            if sys.version_info < (3, 10) else asyncio.StreamReader()
+        for offset in range(0, len(data), chunk_size):
+            reader.feed_data(data[offset:offset + chunk_size])
+        reader.feed_eof()
+        return reader
+
+    def assertSameItems(self, items, expected):
+        self.assertEqual([str(i) for i in items], [str(i) for i in expected])
+
+    def test_open(self):
+        srt_file = self.loop.run_until_complete(aio.open(self.utf8_path))
+        self.assertSameItems(srt_file, self.expected)
+
+    def test_save(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'movie.srt')
+            self.loop.run_until_complete(
+                aio.save(self.expected, path, encoding='utf-16'))
+            self.assertSameItems(pysrt.open(path, encoding='utf-16'),
+                                 self.expected)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_stream_path(self):
+        items = collect(self.loop, aio.stream(self.utf8_path))
+        self.assertSameItems(items, self.expected)
+
+    def test_stream_reader(self):
+        data = open(self.utf8_path, 'rb').read()
+        for chunk_size in (1, 7, 4096, len(data)):
+            items = collect(self.loop, aio.stream(self.reader(data, chunk_size)))
+            self.assertSameItems(items, self.expected)
+
+    def test_stream_reader_bom(self):
+        path = os.path.join(self.static_path, 'bom-utf-16-le.srt')
+        items = collect(self.loop, aio.stream(
+            self.reader(open(path, 'rb').read(), 3)))
+        self.assertSameItems(items, pysrt.open(path))
+
+    def test_stream_reader_crlf(self):
+        path = os.path.join(self.static_path, 'windows-1252.srt')
+        items = collect(self.loop, aio.stream(
+            self.reader(open(path, 'rb').read(), 1), encoding='windows-1252'))
+        self.assertSameItems(items, pysrt.open(path, encoding='windows-1252'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import re
+import sys
+import codecs
+import shutil
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO  # also takes the str printed by Python 2
+except ImportError:
+    from io import StringIO
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile
+from pysrt.commands import SubRipShifter
+from pysrt.compat import str
+
+
+class CommandTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+        self.directory = tempfile.mkdtemp()
+        self.stdout = sys.stdout
+        self.stderr = sys.stderr
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        sys.stderr = self.stderr
+        shutil.rmtree(self.directory)
+
+    def copy(self, name, target=None):
+        path = os.path.join(self.directory, target or name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        shutil.copy(os.path.join(self.static_path, name), path)
+        return path
+
+    def run_command(self, *args):
+        """
+        Run the srt command with `args`, returning its exit status and what
+        it printed on stdout and stderr.
+        """
+        sys.stdout = StringIO()
+        sys.stderr = StringIO()
+        try:
+            status = SubRipShifter().run(['--encoding-cache', ''] + list(args))
+            return status, sys.stdout.getvalue(), sys.stderr.getvalue()
+        finally:
+            sys.stdout = self.stdout
+            sys.stderr = self.stderr
+
+    def assertShifted(self, path, original_name, **kwargs):
+        expected = pysrt.open(os.path.join(self.static_path, original_name),
+                              encoding=SubRipFile.ENCODING_AUTO)
+        expected.shift(**kwargs)
+        result = pysrt.open(path, encoding=SubRipFile.ENCODING_AUTO)
+        self.assertEqual([str(i) for i in result],
+                         [str(i) for i in expected])
+
+
+class TestArguments(unittest.TestCase):
+
+    def parse(self, *args):
+        return SubRipShifter().build_parser().parse_args(list(args))
+
+    def test_time_offset(self):
+        arguments = self.parse('shift', '-1s500ms', 'movie.srt')
+        self.assertEqual(arguments.time_offset, -1500)
+        self.assertEqual(arguments.files, ['movie.srt'])
+
+    def test_option_values_are_not_offsets(self):
+        arguments = self.parse('-j', '2', '-o', '10', 'shift', '-1s', 'a.srt')
+        self.assertEqual(arguments.jobs, 2)
+        self.assertEqual(arguments.output_dir, '10')
+        self.assertEqual(arguments.time_offset, -1000)
+
+    def test_subparser_option_values(self):
+        arguments = self.parse('merge', '-t', '100', 'a.srt', 'b.srt')
+        self.assertEqual(arguments.tolerance, 100000)
+        self.assertEqual(arguments.files, ['a.srt', 'b.srt'])
+
+    def test_negative_limits(self):
+        arguments = self.parse('-i', 'split', '-10s', '1m', 'a.srt')
+        self.assertTrue(arguments.in_place)
+        self.assertEqual(arguments.limits, [-10000, 60000])
+        self.assertEqual(arguments.files, ['a.srt'])
+
+
+class TestSingleFile(CommandTestCase):
+
+    def test_missing_file(self):
+        status, stdout, _ = self.run_command(
+            'shift', '1s', os.path.join(self.directory, 'missing.srt'))
+        self.assertEqual(status, 1)
+        self.assertTrue(stdout.startswith('No such file'))
+
+    def test_in_place(self):
+        path = self.copy('utf-8.srt')
+        status, _, _ = self.run_command('-i', 'shift', '1s', path)
+        self.assertEqual(status, 0)
+        self.assertShifted(path, 'utf-8.srt', seconds=1)
+        self.assertShifted(path + SubRipShifter.BACKUP_EXTENSION,
+                           'utf-8.srt')
+
+
+class RecordingShifter(SubRipShifter):
+    """
+    Record when items are read and when output is written.
+    """
+
+    def __init__(self):
+        super(RecordingShifter, self).__init__()
+        self.events = []
+
+    def _iter_items(self, source_file):
+        for item in super(RecordingShifter, self)._iter_items(source_file):
+            self.events.append('read')
+            yield item
+
+
+class RecordingOutput(object):
+
+    def __init__(self, events):
+        self.events = events
+
+    def write(self, string):
+        self.events.append('write')
+
+
+class TestStreaming(CommandTestCase):
+
+    NAMES = ('utf-8.srt', 'windows-1252.srt', 'invalid.srt')
+    COMMANDS = (
+        (('shift', '1s500ms'), lambda subs: subs.shift(seconds=1.5)),
+        (('shift', '-10s'), lambda subs: subs.shift(seconds=-10)),
+        (('rate', '23.9', '25'), lambda subs: subs.shift(ratio=25 / 23.9)),
+        (('break', '12'), lambda subs: TestStreaming.break_lines(subs, 12)),
+    )
+
+    @staticmethod
+    def break_lines(subs, length):
+        split_re = re.compile(r'(.{,%i})(?:\s+|$)' % length)
+        for item in subs:
+            item.text = '\n'.join(split_re.split(item.text)[1::2])
+
+    def load(self, name, transform):
+        """
+        Return the file transformed by loading it whole, like the srt
+        command used to.
+        """
+        subs = SubRipFile.open(os.path.join(self.static_path, name),
+                               encoding=SubRipFile.ENCODING_AUTO)
+        transform(subs)
+        return subs
+
+    def test_in_place(self):
+        for name in self.NAMES:
+            for args, transform in self.COMMANDS:
+                path = self.copy(name)
+                backup_path = path + SubRipShifter.BACKUP_EXTENSION
+                status, _, _ = self.run_command(*('-i', ) + args + (path, ))
+                self.assertEqual(status, 0)
+                subs = self.load(name, transform)
+                expected = io.BytesIO()
+                subs.write_into(codecs.getwriter(subs.encoding)(expected))
+                with open(path, 'rb') as output_file:
+                    self.assertEqual(output_file.read(), expected.getvalue())
+                with open(backup_path, 'rb') as backup_file:
+                    with open(os.path.join(self.static_path, name),
+                              'rb') as source_file:
+                        self.assertEqual(backup_file.read(),
+                                         source_file.read())
+                os.remove(backup_path)
+
+    def test_byte_order_marks(self):
+        for name in ('bom-utf-8.srt', 'bom-utf-16-le.srt', 'bom-utf-16-be.srt',
+                     'bom-utf-32-le.srt', 'bom-utf-32-be.srt'):
+            path = self.copy(name)
+            status, _, _ = self.run_command('-i', 'shift', '1s', path)
+            self.assertEqual(status, 0)
+            subs = self.load(name, lambda subs: subs.shift(seconds=1))
+            bom = u'\ufeff'.encode(subs.encoding)
+            with open(path + SubRipShifter.BACKUP_EXTENSION, 'rb') as backup:
+                self.assertEqual(backup.read(len(bom)), bom)
+            with open(path, 'rb') as output_file:
+                self.assertEqual(output_file.read(), bom + subs.to_bytes())
+
+    def test_split_byte_order_mark(self):
+        path = self.copy('bom-utf-16-be.srt')
+        status, _, _ = self.run_command('split', '10s', path)
+        self.assertEqual(status, 0)
+        for part in ('1', '2'):
+            part_path = os.path.join(self.directory,
+                                     'bom-utf-16-be.%s.srt' % part)
+            with open(part_path, 'rb') as part_file:
+                self.assertEqual(part_file.read(4), b'\xfe\xff\x001')
+
+    def test_byte_order_mark_dropped_with_encoding(self):
+        path = self.copy('bom-utf-16-le.srt')
+        self.run_command('-i', '-e', 'utf_16_le', 'shift', '1s', path)
+        with open(path, 'rb') as output_file:
+            self.assertEqual(output_file.read(2), b'1\x00')
+
+    def test_stdout(self):
+        for name in self.NAMES:
+            path = self.copy(name)
+            for args, transform in self.COMMANDS:
+                status, stdout, _ = self.run_command(*args + (path, ))
+                self.assertEqual(status, 0)
+                expected = StringIO()
+                self.load(name, transform).write_into(expected)
+                self.assertEqual(stdout, expected.getvalue())
+
+    def test_output_before_end_of_input(self):
+        path = self.copy('utf-8.srt')
+        for args, _ in self.COMMANDS:
+            shifter = RecordingShifter()
+            sys.stdout = RecordingOutput(shifter.events)
+            shifter.run(['--encoding-cache', ''] + list(args) + [path])
+            sys.stdout = self.stdout
+            self.assertEqual(shifter.events.count('read'), 1332)
+            self.assertTrue(shifter.events.index('write') < 10)
+
+
+class TestBatch(CommandTestCase):
+
+    NAMES = ('utf-8.srt', 'no-indexes.srt', 'season/utf-8.srt',
+             'season/windows-1252.srt', 'season/episode/bom-utf-8.srt')
+
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        self.source = os.path.join(self.directory, 'source')
+        self.output = os.path.join(self.directory, 'output')
+        for name in self.NAMES:
+            self.copy(os.path.basename(name), os.path.join('source', name))
+        self.copy('utf-8.srt', os.path.join('source', 'notes.txt'))
+
+    def assertOutputTree(self, jobs):
+        status, _, stderr = self.run_command('-j', jobs, '-o', self.output,
+                                             'shift', '2s', self.source)
+        self.assertEqual(status, 0)
+        self.assertTrue('5 files processed, 0 failed' in stderr)
+        written = []
+        for directory, _, names in os.walk(self.output):
+            written.extend(os.path.relpath(os.path.join(directory, name),
+                                           self.output) for name in names)
+        self.assertEqual(sorted(written),
+                         sorted(os.path.join(*name.split('/'))
+                                for name in self.NAMES))
+        for name in self.NAMES:
+            self.assertShifted(os.path.join(self.output, *name.split('/')),
+                               os.path.basename(name), seconds=2)
+
+    def test_serial(self):
+        self.assertOutputTree('1')
+
+    def test_parallel(self):
+        self.assertOutputTree('2')
+
+    def test_glob(self):
+        status, _, stderr = self.run_command(
+            '-o', self.output, 'shift', '1s',
+            os.path.join(self.source, 'season', '*.srt'))
+        self.assertEqual(status, 0)
+        self.assertEqual(sorted(os.listdir(self.output)),
+                         ['utf-8.srt', 'windows-1252.srt'])
+        self.assertShifted(os.path.join(self.output, 'windows-1252.srt'),
+                           'windows-1252.srt', seconds=1)
+
+    def test_glob_tree(self):
+        status, _, _ = self.run_command(
+            '-o', self.output, 'shift', '1s',
+            os.path.join(self.source, '*', '*.srt'))
+        self.assertEqual(status, 0)
+        self.assertEqual(sorted(os.listdir(self.output)), ['season'])
+        self.assertShifted(os.path.join(self.output, 'season', 'utf-8.srt'),
+                           'utf-8.srt', seconds=1)
+
+    def test_output_collision(self):
+        sys.stderr = StringIO()
+        self.assertRaises(SystemExit, SubRipShifter().run, [
+            '--encoding-cache', '', '-o', self.output, 'shift', '1s',
+            os.path.join(self.source, 'utf-8.srt'),
+            os.path.join(self.source, 'season', 'utf-8.srt')])
+        self.assertTrue('would both be written to' in sys.stderr.getvalue())
+        self.assertFalse(os.path.exists(self.output))
+
+    def test_in_place(self):
+        paths = [os.path.join(self.source, name) for name in
+                 ('utf-8.srt', 'no-indexes.srt')]
+        status, _, _ = self.run_command('-j', '2', '-i', 'rate', '25', '50',
+                                        *paths)
+        self.assertEqual(status, 0)
+        for path in paths:
+            name = os.path.basename(path)
+            self.assertShifted(path, name, ratio=2)
+            self.assertShifted(path + SubRipShifter.BACKUP_EXTENSION, name)
+
+    def test_missing_file(self):
+        missing = os.path.join(self.source, 'missing.srt')
+        for jobs in ('1', '2'):
+            status, _, stderr = self.run_command(
+                '-j', jobs, '-o', self.output, 'shift', '1s',
+                os.path.join(self.source, 'utf-8.srt'), missing)
+            self.assertEqual(status, 1)
+            self.assertTrue('%s: error: ' % missing in stderr)
+            self.assertTrue('No such file' in stderr)
+            self.assertTrue('2 files processed, 1 failed' in stderr)
+            self.assertShifted(os.path.join(self.output, 'utf-8.srt'),
+                               'utf-8.srt', seconds=1)
+
+    def test_requires_output(self):
+        sys.stderr = StringIO()
+        self.assertRaises(SystemExit, SubRipShifter().run,
+                          ['shift', '1s', self.source])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+from pysrt import srtbinary
+from pysrt.srtexc import InvalidBinary
+
+
+class TestRoundTrip(unittest.TestCase):
+
+    def test_rows(self):
+        rows = [
+            (1, 0, 1000, u'Hello', u''),
+            (None, -5, 2 ** 40, u'Ça va ?\nOui', u'X1:1 X2:2'),
+            (u'abc', 3, 4, u'', u'X1:1 X2:2'),
+            (2 ** 70, 5, 6, u'\U0001f600', u''),
+        ]
+        data = srtbinary.dumps(rows, eol='\r\n', encoding='utf_16_le')
+        eol, encoding, columns = srtbinary.loads(data)
+        self.assertEqual((eol, encoding), ('\r\n', 'utf_16_le'))
+        indexes, starts, ends, texts, positions, position_ids = columns
+        self.assertEqual(indexes, [1, None, u'abc', str(2 ** 70)])
+        self.assertEqual(list(starts), [0, -5, 3, 5])
+        self.assertEqual(list(ends), [1000, 2 ** 40, 4, 6])
+        self.assertEqual(texts, [row[3] for row in rows])
+        self.assertEqual(positions, [u'', u'X1:1 X2:2'])
+        self.assertEqual(list(position_ids), [0, 1, 1, 0])
+
+    def test_empty(self):
+        eol, encoding, columns = srtbinary.loads(srtbinary.dumps([]))
+        self.assertEqual((eol, encoding), ('', ''))
+        self.assertEqual([len(column) for column in columns],
+                         [0, 0, 0, 0, 1, 0])
+
+    def test_invalid(self):
+        data = srtbinary.dumps([(1, 0, 1000, u'Hello', u'')])
+        self.assertRaises(InvalidBinary, srtbinary.loads, b'nope')
+        self.assertRaises(InvalidBinary, srtbinary.loads, data[:-2])
+        self.assertRaises(InvalidBinary, srtbinary.loads,
+                          data[:4] + b'\x09' + data[5:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile
+from pysrt.srtcache import ParseCache
+from pysrt.compat import str
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_memory_eviction(self):
+        cache = ParseCache(max_size=10)
+        cache.put('a', b'1234')
+        cache.put('b', b'1234')
+        cache.get('a')
+        cache.put('c', b'1234')
+        self.assertEqual(list(cache.entries), ['a', 'c'])
+        self.assertEqual(cache.size, 8)
+        cache.put('d', b'x' * 11)
+        self.assertEqual(cache.get('d'), None)
+
+    def test_disk(self):
+        cache = ParseCache(directory=self.directory)
+        cache.put('a', b'1234')
+        self.assertEqual(ParseCache(directory=self.directory).get('a'),
+                         b'1234')
+        cache.discard('a')
+        self.assertEqual(ParseCache(directory=self.directory).get('a'), None)
+
+    def test_disk_eviction(self):
+        cache = ParseCache(directory=self.directory, max_disk_size=10)
+        for key in 'abc':
+            cache.put(key, b'1234')
+            path = cache._entry_path(key)
+            os.utime(path, (ord(key), ord(key)))  # make the order explicit
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['b.psrt', 'c.psrt'])
+
+    def test_key(self):
+        path = os.path.join(self.directory, 'movie.srt')
+        shutil.copy(os.path.join(file_path, 'tests', 'static', 'utf-8.srt'),
+                    path)
+        for cache in (ParseCache(), ParseCache(hash_content=True)):
+            key = cache.key(path)
+            self.assertEqual(cache.key(path), key)
+            self.assertNotEqual(cache.key(path, 'latin-1'), key)
+            with open(path, 'ab') as srt_file:
+                srt_file.write(b'\n')
+            self.assertNotEqual(cache.key(path), key)
+
+
+class TestOpenWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        self.cache = ParseCache()
+
+    def test_hit(self):
+        expected = pysrt.open(self.path, cache=self.cache)
+        self.assertEqual(len(self.cache.entries), 1)
+        for storage in (SubRipFile.STORAGE_LIST, SubRipFile.STORAGE_COLUMNAR):
+            cached = pysrt.open(self.path, cache=self.cache, storage=storage)
+            self.assertEqual([str(i) for i in cached],
+                             [str(i) for i in expected])
+            self.assertEqual(cached.eol, expected.eol)
+            self.assertEqual(cached.encoding, expected.encoding)
+            self.assertEqual(cached.path, self.path)
+
+    def test_skips_parsing(self):
+        pysrt.open(self.path, cache=self.cache)
+        original_stream = SubRipFile.__dict__['stream']
+        SubRipFile.stream = None
+        try:
+            self.assertEqual(len(pysrt.open(self.path, cache=self.cache)), 1332)
+        finally:
+            SubRipFile.stream = original_stream
+
+    def test_corrupted_entry(self):
+        self.cache.put(self.cache.key(self.path), b'garbage')
+        self.assertEqual(len(pysrt.open(self.path, cache=self.cache)), 1332)
+        self.assertNotEqual(self.cache.get(self.cache.key(self.path)),
+                            b'garbage')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+from io import BytesIO
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import srtencoding
+from pysrt.srtencoding import EncodingDetector
+
+
+class TestDetection(unittest.TestCase):
+
+    def setUp(self):
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+        self.detector = EncodingDetector()
+
+    def detect(self, name):
+        return self.detector.detect(os.path.join(self.static_path, name))
+
+    def test_boms(self):
+        self.assertEqual(self.detect('bom-utf-8.srt'), 'utf_8')
+        self.assertEqual(self.detect('bom-utf-16-le.srt'), 'utf_16_le')
+        self.assertEqual(self.detect('bom-utf-32-be.srt'), 'utf_32_be')
+
+    def test_utf8(self):
+        self.assertEqual(self.detect('utf-8.srt'), 'utf_8')
+
+    def test_not_utf8(self):
+        encoding = self.detect('windows-1252.srt')
+        self.assertNotEqual(encoding, 'utf_8')
+        content = open(os.path.join(self.static_path, 'windows-1252.srt'),
+                       'rb').read()
+        self.assertEqual(content.decode(encoding),
+                         content.decode('windows-1252'))
+
+    def test_bounded_sample(self):
+        source = BytesIO(b'a' * 100 + u'\xe9'.encode('latin-1') * 10)
+        detector = EncodingDetector(sample_size=64, chunk_size=16)
+        self.assertEqual(detector.detect_stream(source), 'utf_8')
+        self.assertEqual(source.tell(), 64)
+
+    def test_truncated_character(self):
+        source = BytesIO(u'\xe9'.encode('utf-8')[:1])
+        detector = EncodingDetector(fallback='latin_1')
+        srtencoding_chardet = srtencoding.UniversalDetector
+        srtencoding.UniversalDetector = None
+        try:
+            self.assertEqual(detector.detect_stream(source), 'latin_1')
+        finally:
+            srtencoding.UniversalDetector = srtencoding_chardet
+
+    def test_open_auto(self):
+        path = os.path.join(self.static_path, 'windows-1252.srt')
+        srt_file = pysrt.open(path, encoding=pysrt.ENCODING_AUTO)
+        expected = pysrt.open(path, encoding='windows-1252')
+        self.assertEqual(srt_file.text, expected.text)
+
+
+class TestDefaultDetector(unittest.TestCase):
+
+    def test_created_on_first_use(self):
+        script = ('import sys; sys.path.insert(0, %r); import pysrt; '
+                  'from pysrt import srtencoding; '
+                  'print(srtencoding.default_detector is None)' % file_path)
+        output = subprocess.check_output([sys.executable, '-c', script])
+        self.assertEqual(output.strip(), b'True')
+        srtencoding.detect(os.path.join(file_path, 'tests', 'static',
+                                        'utf-8.srt'))
+        self.assertTrue(isinstance(srtencoding.default_detector,
+                                   EncodingDetector))
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.directory, 'cache.json')
+        self.path = os.path.join(self.directory, 'movie.srt')
+        shutil.copy(os.path.join(file_path, 'tests', 'static', 'utf-8.srt'),
+                    self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_persistence(self):
+        detector = EncodingDetector(self.cache_path)
+        self.assertEqual(detector.detect(self.path), 'utf_8')
+        detector.save()
+        self.assertEqual(list(json.load(open(self.cache_path))),
+                         [os.path.abspath(self.path)])
+
+        detector = EncodingDetector(self.cache_path)
+        detector.detect_stream = None  # detection must be skipped
+        self.assertEqual(detector.detect(self.path), 'utf_8')
+
+    def test_invalidation(self):
+        detector = EncodingDetector(self.cache_path)
+        detector.detect(self.path)
+        with open(self.path, 'ab') as srt_file:
+            srt_file.write(b'\xff')
+        self.assertNotEqual(detector.detect(self.path), 'utf_8')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import pickle
+import shutil
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO  # also takes the str printed by Python 2
+except ImportError:
+    from io import StringIO
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipPushParser
+from pysrt import InvalidItem, InvalidTimeString
+from pysrt.srterrors import SubRipErrors, ErrorRecord
+
+VALID_BLOCK = u'%d\n00:00:0%d,000 --> 00:00:0%d,500\nCaf\xe9 %d\n'
+INVALID_BLOCKS = (
+    (u'%d\n00:00:01 --> 00:00:02\nNo milliseconds\n', InvalidTimeString),
+    (u'%d\nNo timestamps\n', InvalidItem),
+)
+
+
+def build_source(count=9):
+    blocks = []
+    for index in range(1, count + 1):
+        if index % 3:
+            blocks.append(VALID_BLOCK % (index, index, index, index))
+        else:
+            block, _ = INVALID_BLOCKS[index // 3 % 2]
+            blocks.append(block % index)
+    return u'\n'.join(blocks)
+
+
+class TestErrorCollect(unittest.TestCase):
+
+    def setUp(self):
+        self.source = build_source()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def expected(self, source, encoding='utf-8', offset=0):
+        # First line and byte offset of every invalid block of `source`
+        records = []
+        line = 1
+        for block in source.split(u'\n\n'):
+            if u',000 -->' not in block:
+                error = InvalidItem if u'-->' not in block else InvalidTimeString
+                records.append((line, offset, error))
+            line += block.count(u'\n') + 2
+            offset += len((block + u'\n\n').encode(encoding))
+        return records
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as output_file:
+            output_file.write(data)
+        return path
+
+    def test_from_string(self):
+        expected = self.expected(self.source)
+        self.assertEqual(len(expected), 3)
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            srt_file = pysrt.from_string(
+                self.source, error_handling=SubRipFile.ERROR_COLLECT,
+                parser=parser)
+            self.assertEqual(len(srt_file), 6)
+            self.assertEqual([tuple(r) for r in srt_file.errors], expected)
+            self.assertTrue(isinstance(srt_file.errors[0], ErrorRecord))
+
+    def test_open_crlf(self):
+        source = self.source.replace(u'\n', u'\r\n')
+        path = self.write('crlf.srt', source.encode('windows-1252'))
+        expected = self.expected(source.replace(u'\r', u''), 'windows-1252')
+        # Each line ends with one more byte than its decoded counterpart
+        expected = [(line, offset + line - 1, error)
+                    for line, offset, error in expected]
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            srt_file = pysrt.open(path, encoding='windows-1252', parser=parser,
+                                  error_handling=SubRipFile.ERROR_COLLECT)
+            self.assertEqual([tuple(r) for r in srt_file.errors], expected)
+
+    def test_open_bom(self):
+        for encoding, bom in (('utf_8', b'\xef\xbb\xbf'),
+                              ('utf_16_le', b'\xff\xfe')):
+            path = self.write('bom.srt', bom + self.source.encode(encoding))
+            expected = self.expected(self.source, encoding, len(bom))
+            srt_file = pysrt.open(path, error_handling=SubRipFile.ERROR_COLLECT)
+            self.assertEqual(srt_file.encoding, encoding)
+            self.assertEqual([tuple(r) for r in srt_file.errors], expected)
+
+    def test_pickle(self):
+        # Sources with \r are normalized by the fast parser, which then
+        # locates blocks by line
+        for source in (self.source, self.source.replace(u'\n', u'\r\n')):
+            for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+                errors = pysrt.from_string(
+                    source, error_handling=SubRipFile.ERROR_COLLECT,
+                    parser=parser).errors
+                for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                    self.assertEqual(
+                        pickle.loads(pickle.dumps(errors, protocol)), errors)
+
+    def test_max_errors(self):
+        source = build_source(60)
+        srt_file = pysrt.from_string(source, max_errors=5,
+                                     error_handling=SubRipFile.ERROR_COLLECT)
+        self.assertEqual(len(srt_file.errors), 5)
+        self.assertEqual(srt_file.errors.dropped, 15)
+        self.assertEqual(srt_file.errors.count, 20)
+        self.assertEqual(len(srt_file), 40)
+
+    def test_stream(self):
+        errors = SubRipErrors()
+        items = list(SubRipFile.stream(self.source.splitlines(True),
+                                       error_handling=SubRipFile.ERROR_COLLECT,
+                                       errors=errors))
+        self.assertEqual(len(items), 6)
+        self.assertEqual(len(errors), 3)
+        self.assertRaises(ValueError, SubRipFile.stream, [],
+                          error_handling=SubRipFile.ERROR_COLLECT)
+
+    def test_push_parser(self):
+        data = b'\xef\xbb\xbf' + self.source.encode('utf-8')
+        expected = self.expected(self.source, offset=3)
+        for chunk_size in (1, 5, len(data)):
+            parser = SubRipPushParser(error_handling=SubRipFile.ERROR_COLLECT)
+            for offset in range(0, len(data), chunk_size):
+                parser.feed(data[offset:offset + chunk_size])
+            parser.close()
+            self.assertEqual([tuple(r) for r in parser.errors], expected)
+
+    def test_mmap(self):
+        path = self.write('source.srt', self.source.encode('utf-8'))
+        self.assertRaises(ValueError, pysrt.open_mmap, path,
+                          error_handling=SubRipFile.ERROR_COLLECT)
+
+    def test_no_errors_by_default(self):
+        srt_file = pysrt.from_string(self.source)
+        self.assertEqual(list(srt_file.errors), [])
+
+
+class TestErrorLog(unittest.TestCase):
+
+    def test_log(self):
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            srt_file = pysrt.from_string(build_source(),
+                                         error_handling=SubRipFile.ERROR_LOG)
+            output = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+        self.assertEqual(len(srt_file), 6)
+        self.assertEqual(output.count('PySRT-'), 3)
+        self.assertTrue('PySRT-InvalidTimeString(line 22)' in output)
+        self.assertTrue('No milliseconds' in output)
+
+
+if __name__ == '__main__':
+    unittest.main()
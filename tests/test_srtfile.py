@@ -7,13 +7,16 @@ import codecs
 from datetime import time
 import unittest
 import random
+import copy
+import pickle
 from io import StringIO
 
 file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.abspath(file_path))
 
 import pysrt
-from pysrt import SubRipFile, SubRipItem, SubRipTime
+from pysrt import SubRipFile, SubRipItem, SubRipTime, srtarray
+from pysrt.srtitem import LazySubRipItem
 from pysrt.compat import str, open
 
 
@@ -66,6 +69,75 @@ class TestFromString(unittest.TestCase):
             self.utf8_path, encoding='ascii')
 
 
+class TestFastParser(unittest.TestCase):
+
+    def setUp(self):
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+
+    def assertSameItems(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for first_item, second_item in zip(first, second):
+            self.assertEqual(first_item.index, second_item.index)
+            self.assertEqual(first_item.start, second_item.start)
+            self.assertEqual(first_item.end, second_item.end)
+            self.assertEqual(first_item.text, second_item.text)
+            self.assertEqual(first_item.position, second_item.position)
+
+    def test_same_result(self):
+        for name in ('utf-8.srt', 'capability_tester.srt', 'no-indexes.srt',
+                     'bom-utf-16-le.srt', 'empty.srt', 'invalid.srt'):
+            path = os.path.join(self.static_path, name)
+            self.assertSameItems(pysrt.open(path),
+                                 pysrt.open(path, parser=pysrt.PARSER_FAST))
+
+    def test_malformed_cues(self):
+        source = ('1\r\n00:00:01,000 --> 00:00:02,000 X1:40  \r\nHello  \r\n'
+                  'World\r\n\r\nfoo\r\n00:00:03,000 --> 00:00:04.5\r\nBar\r\n'
+                  ' \r\n2\r\n00:00:05,000 -> 00:00:06,000\r\nBaz\r\n')
+        self.assertSameItems(pysrt.from_string(source),
+                             pysrt.from_string(source, parser=pysrt.PARSER_FAST))
+
+    def test_from_string_eol(self):
+        for eol in ('\r\n', '\r', '\n', u'\u2028'):
+            source = eol.join(['1', '00:00:01,000 --> 00:00:02,000', 'Hi'])
+            tolerant = pysrt.from_string(source)
+            fast = pysrt.from_string(source, parser=pysrt.PARSER_FAST)
+            self.assertEqual(fast.eol, tolerant.eol)
+            self.assertSameItems(tolerant, fast)
+
+    def test_extra_arrow(self):
+        source = ('1\n00:00:01,000 --> 00:00:02,000 --> 00:00:03,000\nhello\n'
+                  '\n2\n00:00:04,000 --> 00:00:05,000\nworld\n\n')
+        self.assertSameItems(pysrt.from_string(source),
+                             pysrt.from_string(source, parser=pysrt.PARSER_FAST))
+        for parser in (pysrt.PARSER_TOLERANT, pysrt.PARSER_FAST):
+            self.assertRaises(pysrt.InvalidItem, pysrt.from_string, source,
+                              parser=parser,
+                              error_handling=SubRipFile.ERROR_RAISE)
+
+    def test_error_line(self):
+        source = '\n1\n00:00:01,000 --> 00:00:02,000\nA\n\n\n2\nnope\nB\n\n'
+        for parser in (pysrt.PARSER_TOLERANT, pysrt.PARSER_FAST):
+            try:
+                pysrt.from_string(source, parser=parser,
+                                  error_handling=SubRipFile.ERROR_RAISE)
+            except pysrt.Error as error:
+                self.assertEqual(error.args[0], 9)
+            else:
+                self.fail('InvalidItem not raised')
+
+    def test_lazy(self):
+        path = os.path.join(self.static_path, 'utf-8.srt')
+        expected = pysrt.open(path)
+        for parser in (pysrt.PARSER_TOLERANT, pysrt.PARSER_FAST):
+            lazy_file = pysrt.open(path, parser=parser, lazy=True)
+            self.assertTrue(all(i._text is None for i in lazy_file))
+            self.assertSameItems(expected, lazy_file)
+
+    def test_unknown_parser(self):
+        self.assertRaises(ValueError, pysrt.stream, [], parser='nope')
+
+
 class TestSerialization(unittest.TestCase):
 
     def setUp(self):
@@ -101,6 +173,84 @@ class TestSerialization(unittest.TestCase):
         output_file.read()
         self.assertEqual(output_file.newlines, '\n')
 
+    def test_to_bytes(self):
+        srt_file = pysrt.open(self.windows_path, encoding='windows-1252')
+        self.assertEqual(srt_file.to_bytes('utf-8', eol='\n'),
+                         open(self.utf8_path, 'rb').read())
+        self.assertEqual(srt_file.to_bytes(),
+                         open(self.windows_path, 'rb').read())
+
+    def test_to_bytes_bom(self):
+        srt_file = pysrt.open(self.utf8_path)
+        content = srt_file.to_bytes('utf-16', eol='\n')
+        self.assertEqual(content.count(codecs.BOM_UTF16), 1)
+        self.assertEqual(content.decode('utf-16'),
+                         open(self.utf8_path, 'rb').read().decode('utf-8'))
+        self.assertEqual(SubRipFile().to_bytes('utf-16'), b'')
+
+    def test_write_into_chunks(self):
+        srt_file = pysrt.open(self.utf8_path)
+        chunks = list(srt_file.iter_chunks(chunk_size=100))
+        self.assertEqual(len(chunks), 14)
+        output = StringIO()
+        srt_file.write_into(output, eol='\n')
+        self.assertEqual(output.getvalue(), ''.join(chunks))
+
+
+class TestBinary(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        self.file = pysrt.open(self.path)
+
+    def assertSameFile(self, srt_file):
+        self.assertEqual([str(i) for i in srt_file],
+                         [str(i) for i in self.file])
+        self.assertEqual(srt_file.eol, self.file.eol)
+        self.assertEqual(srt_file.encoding, self.file.encoding)
+
+    def test_round_trip(self):
+        data = self.file.to_binary()
+        self.assertTrue(isinstance(data, bytes))
+        self.assertSameFile(SubRipFile.from_binary(data))
+        columnar = SubRipFile.from_binary(
+            data, storage=SubRipFile.STORAGE_COLUMNAR)
+        self.assertSameFile(columnar)
+        self.assertEqual(columnar.to_binary(), data)
+
+    def test_invalid(self):
+        self.assertRaises(pysrt.InvalidBinary, SubRipFile.from_binary, b'')
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            srt_file = pickle.loads(pickle.dumps(self.file, protocol))
+            self.assertSameFile(srt_file)
+            self.assertEqual(srt_file.path, self.path)
+
+    def test_pickle_columnar(self):
+        columnar = pysrt.open(self.path, storage=SubRipFile.STORAGE_COLUMNAR)
+        srt_file = pickle.loads(pickle.dumps(columnar))
+        self.assertSameFile(srt_file)
+        self.assertEqual(srt_file.data.__class__, columnar.data.__class__)
+
+    def test_pickle_keeps_state(self):
+        invalid_path = os.path.join(file_path, 'tests', 'static', 'invalid.srt')
+        invalid = pysrt.open(invalid_path,
+                             error_handling=SubRipFile.ERROR_COLLECT)
+        lazy = pysrt.open(self.path, lazy=True)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            srt_file = pickle.loads(pickle.dumps(invalid, protocol))
+            self.assertEqual(list(srt_file.errors), list(invalid.errors))
+            srt_file = pickle.loads(pickle.dumps(lazy, protocol))
+            self.assertTrue(isinstance(srt_file[0], LazySubRipItem))
+            self.assertSameFile(srt_file)
+
+    def test_shallow_copy(self):
+        clone = copy.copy(self.file)
+        self.assertTrue(clone[0] is self.file[0])
+        clone.append(SubRipItem())
+        self.assertEqual(len(clone), len(self.file) + 1)
+
 
 class TestSlice(unittest.TestCase):
 
@@ -120,6 +270,62 @@ class TestSlice(unittest.TestCase):
         self.assertEqual(len(self.file.at((0, 0, 31, 0))), 1)
         self.assertEqual(len(self.file.at(seconds=31)), 1)
 
+    def test_index_invalidation(self):
+        self.assertEqual(len(self.file.at(seconds=2)), 1)
+        self.file.shift(seconds=10)
+        self.assertEqual(len(self.file.at(seconds=2)), 0)
+        self.assertEqual(len(self.file.at(seconds=12)), 1)
+        del self.file[:1]
+        self.assertEqual(len(self.file.at(seconds=12)), 0)
+        self.file.insert(0, SubRipItem(0, {'seconds': 0}, {'seconds': 2}))
+        self.assertEqual(len(self.file.at(seconds=1)), 1)
+        self.file[0].end.seconds = 1
+        self.assertEqual(len(self.file.at(seconds=1)), 0)
+
+    def test_direct_item_edits(self):
+        self.assertEqual(len(self.file.at(seconds=2)), 1)
+        self.file[0].shift(seconds=10)
+        self.assertEqual(len(self.file.at(seconds=2)), 0)
+        self.assertEqual(len(self.file.slice(starts_after={'seconds': 10},
+                                             ends_before={'seconds': 15})), 1)
+        self.file[0].end += 5000
+        self.assertEqual(len(self.file.at(seconds=18)), 1)
+
+    def test_frozen_index(self):
+        self.assertEqual(len(self.file.at(seconds=2, frozen=True)), 1)
+        self.file[0].shift(seconds=10)
+        self.assertEqual(len(self.file.at(seconds=2, frozen=True)), 1)
+        self.file.invalidate_index()
+        self.assertEqual(len(self.file.at(seconds=2, frozen=True)), 0)
+        self.file.shift(seconds=-10)
+        self.assertEqual(len(self.file.at(seconds=2, frozen=True)), 1)
+        del self.file[0]
+        self.assertEqual(len(self.file.at(seconds=2, frozen=True)), 0)
+
+    def test_clone_shift_invalidation(self):
+        def visible(srt_file, seconds):
+            time = SubRipTime(seconds=seconds)
+            return [i for i in srt_file if i.start < time < i.end]
+        part = self.file.slice(starts_before={'seconds': 300})
+        self.assertEqual(list(self.file.at(seconds=60)),
+                         visible(self.file, 60))
+        self.assertEqual(list(part.at(seconds=60)), visible(part, 60))
+        self.file.slice(ends_after={'seconds': 20}).shift(seconds=200)
+        self.assertEqual(list(self.file.at(seconds=60)),
+                         visible(self.file, 60))
+        self.assertEqual(list(self.file.at(seconds=260)),
+                         visible(self.file, 260))
+        self.assertEqual(list(part.at(seconds=260)), visible(part, 260))
+        part.clamp(maximum={'seconds': 250})
+        self.assertEqual(list(self.file.at(seconds=260)),
+                         visible(self.file, 260))
+
+    def test_keeps_order(self):
+        random.shuffle(self.file)
+        part = self.file.slice(starts_after=(0, 10, 0, 0))
+        self.assertEqual(list(part),
+                         [i for i in self.file if i.start > (0, 10, 0, 0)])
+
 
 class TestShifting(unittest.TestCase):
 
@@ -130,6 +336,68 @@ class TestShifting(unittest.TestCase):
         srt_file.shift(ratio=2)
         self.assertEqual(srt_file[0].end, (2, 2, 2, 2))
 
+    def test_columnar_shift(self):
+        path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        expected = pysrt.open(path)
+        columnar = pysrt.open(path, storage=SubRipFile.STORAGE_COLUMNAR)
+        for srt_file in (expected, columnar):
+            srt_file.shift(seconds=-2, ratio=25 / 23.976)
+        self.assertEqual(list(columnar), list(expected))
+
+    def test_clamp(self):
+        for storage in (SubRipFile.STORAGE_LIST, SubRipFile.STORAGE_COLUMNAR):
+            srt_file = SubRipFile([
+                SubRipItem(1, {'seconds': 1}, {'seconds': 3}),
+                SubRipItem(2, {'seconds': 5}, {'seconds': 8}),
+            ], storage=storage)
+            srt_file.shift(seconds=-2)
+            srt_file.clamp(maximum={'seconds': 5})
+            self.assertEqual([(i.start.ordinal, i.end.ordinal)
+                              for i in srt_file],
+                             [(0, 1000), (3000, 5000)])
+
+
+@unittest.skipIf(srtarray.get_numpy(required=False) is None,
+                 'NumPy is not installed')
+class TestTimingsArray(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        self.file = pysrt.open(self.path)
+        self.columnar = pysrt.open(self.path,
+                                   storage=SubRipFile.STORAGE_COLUMNAR)
+
+    def test_timings_array(self):
+        for srt_file in (self.file, self.columnar):
+            timings = srt_file.timings_array()
+            self.assertEqual(timings.shape, (len(self.file), 2))
+            self.assertEqual(str(timings.dtype), 'int64')
+            self.assertEqual(timings[1].tolist(), [27074, 30566])
+
+    def test_apply_timings(self):
+        for srt_file in (self.file, self.columnar):
+            timings = srt_file.timings_array()
+            srt_file.apply_timings(timings * 1.5)
+            self.assertEqual(srt_file[1].start, SubRipTime(0, 0, 40, 611))
+            self.assertEqual(srt_file[1].end, SubRipTime(0, 0, 45, 849))
+        self.assertRaises(ValueError, self.file.apply_timings, timings[1:])
+
+    def test_apply_invalidates_index(self):
+        self.assertEqual(len(self.file.at(seconds=20)), 0)
+        timings = self.file.timings_array()
+        timings[0] = 19000, 21000
+        self.file.apply_timings(timings)
+        self.assertEqual(len(self.file.at(seconds=20)), 1)
+
+    def test_slice_mask(self):
+        mask = self.file.slice_mask(starts_after={'minutes': 10},
+                                    ends_before={'minutes': 20})
+        expected = self.file.slice(starts_after={'minutes': 10},
+                                   ends_before={'minutes': 20})
+        self.assertEqual(int(mask.sum()), len(expected))
+        self.assertEqual([self.file[p] for p in mask.nonzero()[0]],
+                         list(expected))
+
 
 class TestText(unittest.TestCase):
 
@@ -147,6 +415,25 @@ class TestText(unittest.TestCase):
         self.assertEqual(srt_file.text, 'Hello\nWorld !')
 
 
+class TestTextMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.file = SubRipFile([SubRipItem(1, 0, 2000, '<i>Hello</i>\nworld !'),
+                                SubRipItem(2, 3000, 3000, 'Empty duration')])
+
+    def test_text_metrics(self):
+        self.assertEqual(self.file.text_metrics(),
+                         [('Hello\nworld !', 12, 2, 6.0),
+                          ('Empty duration', 14, 1, 0.0)])
+        self.assertEqual(self.file.text_metrics(),
+                         [item.text_metrics for item in self.file])
+
+    def test_columnar(self):
+        columnar = SubRipFile(list(self.file),
+                              storage=SubRipFile.STORAGE_COLUMNAR)
+        self.assertEqual(columnar.text_metrics(), self.file.text_metrics())
+
+
 class TestDuckTyping(unittest.TestCase):
 
     def setUp(self):
@@ -199,6 +486,23 @@ class TestCleanIndexes(unittest.TestCase):
         for first, second in zip(self.file[:-1], self.file[1:]):
             self.assertTrue(first <= second)
 
+    def test_same_start(self):
+        self.file[1].start = self.file[0].start
+        self.file[0].end = self.file[1].end + 1
+        first, second = self.file[0], self.file[1]
+        self.file.clean_indexes()
+        self.assertEqual(self.file[:2], [second, first])
+        self.assertEqual([second.index, first.index], [1, 2])
+
+    def test_columnar(self):
+        columnar = SubRipFile(self.file, storage=SubRipFile.STORAGE_COLUMNAR)
+        self.file.reverse()
+        columnar.reverse()
+        self.file.clean_indexes()
+        columnar.clean_indexes()
+        self.assertEqual([str(i) for i in columnar],
+                         [str(i) for i in self.file])
+
 
 class TestBOM(unittest.TestCase):
     "In response of issue #6 https://github.com/byroot/pysrt/issues/6"
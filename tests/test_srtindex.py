@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import random
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+from pysrt.srtindex import IntervalIndex
+
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(42)
+        self.starts = [random.randint(0, 1000) for _ in range(500)]
+        self.ends = [start + random.randint(-50, 200) for start in self.starts]
+        self.index = IntervalIndex(self.starts, self.ends)
+
+    def brute_force(self, starts_before=None, starts_after=None,
+                    ends_before=None, ends_after=None):
+        return [p for p, (start, end) in enumerate(zip(self.starts, self.ends))
+                if (starts_before is None or start < starts_before)
+                and (starts_after is None or start > starts_after)
+                and (ends_before is None or end < ends_before)
+                and (ends_after is None or end > ends_after)]
+
+    def test_query(self):
+        for _ in range(500):
+            bounds = [random.choice((None, random.randint(-100, 1300)))
+                      for _ in range(4)]
+            self.assertEqual(self.index.query(*bounds),
+                             self.brute_force(*bounds))
+
+    def test_empty(self):
+        self.assertEqual(IntervalIndex([], []).query(ends_after=0), [])
+        self.assertEqual(len(IntervalIndex([], [])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,12 +3,14 @@
 import os
 import sys
 from datetime import time
+import pickle
 import unittest
 
 file_path = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, os.path.abspath(file_path))
 
 from pysrt import SubRipItem, SubRipTime, InvalidItem
+from pysrt.srtitem import LazySubRipItem
 from pysrt.compat import basestring
 from pysrt.compat import str
 
@@ -34,6 +36,15 @@ class TestAttributes(unittest.TestCase):
         self.assertTrue(hasattr(self.item, 'end'))
         self.assertTrue(isinstance(self.item.end, SubRipTime))
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.item, '__dict__'))
+
+    def test_pickle(self):
+        item = SubRipItem(1, (0, 0, 1, 0), (0, 0, 2, 0), 'Hello', 'X1:0')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(str(pickle.loads(pickle.dumps(item, protocol))),
+                             str(item))
+
 
 class TestDuration(unittest.TestCase):
 
@@ -102,6 +113,52 @@ class TestTagRemoval(unittest.TestCase):
                 '\nred text, one, two, three.')
 
 
+class TestTextMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.item = SubRipItem(1, 0, 2000, '<i>Hello</i>\nworld !')
+
+    def test_metrics(self):
+        self.assertEqual(self.item.text_without_tags, 'Hello\nworld !')
+        self.assertEqual(self.item.characters_count, 12)
+        self.assertEqual(self.item.lines_count, 2)
+        self.assertEqual(self.item.text_metrics,
+                         ('Hello\nworld !', 12, 2, 6.0))
+
+    def test_empty_text(self):
+        self.item.text = ''
+        self.assertEqual(self.item.text_metrics, ('', 0, 0, 0.0))
+
+    def test_cached(self):
+        cache = self.item._get_text_cache()
+        self.assertTrue(self.item._get_text_cache() is cache)
+        self.item.shift(seconds=1)
+        self.assertTrue(self.item._get_text_cache() is cache)
+
+    def test_invalidated_on_write(self):
+        self.assertEqual(self.item.characters_count, 12)
+        self.item.text = 'Bye'
+        self.assertEqual(self.item.characters_count, 3)
+        self.assertEqual(self.item.lines_count, 1)
+
+    def test_timing_change(self):
+        self.assertEqual(self.item.characters_per_second, 6.0)
+        self.item.end.shift(seconds=2)
+        self.assertEqual(self.item.characters_per_second, 3.0)
+
+    def test_lazy_item(self):
+        item = LazySubRipItem.from_lines(
+            ['1\n', '00:00:00,000 --> 00:00:02,000\n', '<b>Hello</b>\n'])
+        self.assertEqual(item.text_metrics, ('Hello', 5, 1, 2.5))
+        item.text = 'Hi'
+        self.assertEqual(item.characters_count, 2)
+
+    def test_pickle(self):
+        self.assertEqual(self.item.characters_count, 12)
+        item = pickle.loads(pickle.dumps(self.item))
+        self.assertEqual(item.text_metrics, self.item.text_metrics)
+
+
 class TestShifting(unittest.TestCase):
 
     def setUp(self):
@@ -142,6 +199,16 @@ class TestOperators(unittest.TestCase):
     def test_cmp(self):
         self.assertEqual(self.item, self.item)
 
+    def test_order(self):
+        longer = SubRipItem(2, self.item.start, self.item.end + 1)
+        later = SubRipItem(3, self.item.start + 1, self.item.start + 2)
+        self.assertTrue(self.item < longer < later)
+        self.assertEqual(sorted([later, longer, self.item]),
+                         [self.item, longer, later])
+        self.assertEqual(sorted([later, longer, self.item],
+                                key=SubRipItem.sort_key),
+                         [self.item, longer, later])
+
 
 class TestSerialAndParsing(unittest.TestCase):
 
@@ -209,5 +276,36 @@ class TestSerialAndParsing(unittest.TestCase):
         item = SubRipItem.from_string(self.junk_after_timestamp)
         self.assertEqual(item, self.item)
 
+
+class TestLazyItem(unittest.TestCase):
+
+    def setUp(self):
+        self.source = ('1\r\n00:01:00,000 --> 00:01:20,000  X1:000 X2:000 \r\n'
+                       'Hello  \r\nworld !\r\n')
+        self.item = LazySubRipItem.from_string(self.source)
+
+    def test_timings(self):
+        self.assertEqual(self.item.index, 1)
+        self.assertEqual(self.item.start, (0, 1, 0, 0))
+        self.assertEqual(self.item.end, (0, 1, 20, 0))
+        self.assertEqual(self.item._text, None)
+        self.assertEqual(self.item._position, None)
+
+    def test_decoding(self):
+        expected = SubRipItem.from_string(self.source)
+        self.assertEqual(self.item.text, expected.text)
+        self.assertEqual(self.item.position, expected.position)
+        self.assertEqual(str(self.item), str(expected))
+
+    def test_assignment(self):
+        self.item.text = 'Bye'
+        self.item.position = ''
+        self.assertEqual(self.item.text, 'Bye')
+        self.assertEqual(self.item.position, '')
+
+    def test_invalid(self):
+        self.assertRaises(InvalidItem, LazySubRipItem.from_string,
+                          '00:01:00,000 --> 00:01:20,000\n')
+
 if __name__ == '__main__':
     unittest.main()
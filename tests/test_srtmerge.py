@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipItem
+
+
+def timings(srt_file):
+    return [(item.index, item.start.ordinal, item.end.ordinal, item.text)
+            for item in srt_file]
+
+
+class TestMerge(unittest.TestCase):
+
+    def setUp(self):
+        self.english = SubRipFile([SubRipItem(1, 1000, 4000, 'Hello'),
+                                   SubRipItem(2, 5000, 6000, 'Bye')],
+                                  eol='\r\n', encoding='latin-1')
+        self.french = SubRipFile([SubRipItem(1, 1020, 3000, 'Bonjour'),
+                                  SubRipItem(2, 3000, 6000, 'Au revoir')])
+
+    def test_merge(self):
+        merged = pysrt.merge(self.english, self.french)
+        self.assertEqual(timings(merged), [
+            (1, 1000, 1020, 'Hello'),
+            (2, 1020, 3000, 'Hello\nBonjour'),
+            (3, 3000, 4000, 'Hello\nAu revoir'),
+            (4, 4000, 5000, 'Au revoir'),
+            (5, 5000, 6000, 'Bye\nAu revoir'),
+        ])
+        self.assertEqual(merged.eol, '\r\n')
+        self.assertEqual(merged.encoding, 'latin-1')
+
+    def test_track_order(self):
+        merged = pysrt.merge(self.french, self.english)
+        self.assertEqual(merged[1].text, 'Bonjour\nHello')
+
+    def test_tolerance(self):
+        merged = pysrt.merge(self.english, self.french,
+                             tolerance={'milliseconds': 20})
+        self.assertEqual(timings(merged)[0], (1, 1020, 3000, 'Hello\nBonjour'))
+        self.assertEqual(len(merged), 4)
+
+    def test_coalesce(self):
+        track = [SubRipItem(1, 0, 1000, 'Same'),
+                 SubRipItem(2, 1010, 2000, 'Same')]
+        self.assertEqual(timings(pysrt.merge(track)),
+                         [(1, 0, 1000, 'Same'), (2, 1010, 2000, 'Same')])
+        self.assertEqual(timings(pysrt.merge(track, tolerance=10)),
+                         [(1, 0, 2000, 'Same')])
+
+    def test_overlapping_cues(self):
+        track = [SubRipItem(1, 0, 2000, 'First'),
+                 SubRipItem(2, 1000, 3000, 'Second')]
+        self.assertEqual(timings(pysrt.merge(track, [], separator=' / ')), [
+            (1, 0, 1000, 'First'),
+            (2, 1000, 2000, 'First / Second'),
+            (3, 2000, 3000, 'Second'),
+        ])
+
+    def test_skipped_cues(self):
+        track = [SubRipItem(1, 1000, 1000, 'Empty duration'),
+                 SubRipItem(2, 2000, 1000, 'Negative duration'),
+                 SubRipItem(3, 0, 500, '')]
+        self.assertEqual(len(pysrt.merge(track, self.french)), 2)
+
+    def test_empty(self):
+        self.assertEqual(len(pysrt.merge()), 0)
+        self.assertEqual(len(pysrt.merge(SubRipFile(), SubRipFile())), 0)
+
+    def test_many_tracks(self):
+        path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        subs = pysrt.open(path)
+        merged = pysrt.merge(subs, subs, subs)
+        self.assertEqual(len(merged), len(subs))
+        for item, original in zip(merged, subs):
+            self.assertEqual(item.text, '\n'.join([original.text] * 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import sys
+import unittest
+
+try:
+    from StringIO import StringIO  # also takes the str printed by Python 2
+except ImportError:
+    from io import StringIO
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipItem
+from pysrt.srtmmap import MappedStorage
+from pysrt.compat import str
+
+RE_LOG_LINE = re.compile(r'\(line (\d+)\)')
+
+
+class TestOpenMmap(unittest.TestCase):
+
+    def setUp(self):
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+
+    def assertSameFile(self, name, encoding=None):
+        path = os.path.join(self.static_path, name)
+        expected = pysrt.open(path, encoding=encoding)
+        mapped = pysrt.open_mmap(path, encoding=encoding)
+        self.assertEqual(mapped.encoding, expected.encoding)
+        self.assertEqual(mapped.eol, expected.eol)
+        self.assertEqual([str(i) for i in mapped], [str(i) for i in expected])
+
+    def assertSameErrorLog(self, path, encoding):
+        results = []
+        for open_file in (pysrt.open, pysrt.open_mmap):
+            for error_handling in (SubRipFile.ERROR_PASS,
+                                   SubRipFile.ERROR_LOG):
+                stderr = sys.stderr
+                sys.stderr = StringIO()
+                try:
+                    items = [str(item) for item in open_file(
+                        path, encoding=encoding,
+                        error_handling=error_handling)]
+                    results.append((items, sys.stderr.getvalue()))
+                finally:
+                    sys.stderr = stderr
+        self.assertEqual(results[2:], results[:2])
+
+    def test_utf8(self):
+        self.assertSameFile('utf-8.srt')
+
+    def test_windows1252(self):
+        self.assertSameFile('windows-1252.srt', encoding='windows-1252')
+
+    def test_boms(self):
+        for name in ('bom-utf-8.srt', 'bom-utf-16-le.srt', 'bom-utf-16-be.srt',
+                     'bom-utf-32-le.srt', 'bom-utf-32-be.srt'):
+            self.assertSameFile(name)
+
+    def test_invalid(self):
+        self.assertSameFile('invalid.srt')
+        self.assertSameFile('capability_tester.srt')
+        self.assertRaises(pysrt.Error, pysrt.open_mmap,
+                          os.path.join(self.static_path, 'invalid.srt'),
+                          error_handling=SubRipFile.ERROR_RAISE)
+
+    def test_error_lines(self):
+        source = (u'1\n00:00:01,000 --> 00:00:02,000\nhello\n\n\n'
+                  u'2\n00:00:03,000 --> 00:00:04,000\nw\xf6rld\n\u3000\n'
+                  u'broken\n\n3\nnope\n\n'
+                  u'4\n00:00:05,000 --> 00:00:06,000\nagain\n')
+        path = os.path.join(self.static_path, 'temp.srt')
+        self.addCleanup(os.remove, path)
+        for encoding in ('utf-8', 'utf-16-le', 'utf-32-be'):
+            with open(path, 'wb') as temp_file:
+                temp_file.write(source.encode(encoding))
+            logs = []
+            for open_file in (pysrt.open, pysrt.open_mmap):
+                stderr = sys.stderr
+                sys.stderr = StringIO()
+                try:
+                    list(open_file(path, encoding=encoding,
+                                   error_handling=SubRipFile.ERROR_LOG))
+                    logs.append(sorted(RE_LOG_LINE.findall(
+                        sys.stderr.getvalue())))
+                finally:
+                    sys.stderr = stderr
+            self.assertEqual(logs[0], ['10', '13'])
+            self.assertEqual(logs[1], logs[0])
+
+    def test_special_characters(self):
+        path = os.path.join(self.static_path, 'temp.srt')
+        self.addCleanup(os.remove, path)
+        for special in (u'\r', u'\u2028', u'\xa0', u'\u3000', u'\f'):
+            for cue in (u'2\n%s00:01:02,003 --> 00:01:03,004\nworld\n',
+                        u'2\n00:01:02,003 --> 00:01:03,004\nwo%srld\n',
+                        u'2\n00:01:02,003 --> 00:01:03,004\n%s\nworld\n',
+                        u'2\n%s\n00:01:02,003 --> 00:01:03,004\nworld\n'):
+                source = (u'1\n00:00:01,000 --> 00:00:02,000\nhello\n\n'
+                          + cue % special +
+                          u'\n3\n00:00:05,000 --> 00:00:06,000\nagain\n')
+                for encoding in ('utf-8', 'utf-16-le'):
+                    with open(path, 'wb') as temp_file:
+                        temp_file.write(source.encode(encoding))
+                    self.assertSameErrorLog(path, encoding)
+
+    def test_empty_file(self):
+        self.assertEqual(len(pysrt.open_mmap('/dev/null')), 0)
+
+
+class TestLazyAccess(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        self.file = pysrt.open_mmap(path)
+
+    def test_decode_on_access(self):
+        self.assertTrue(isinstance(self.file.data, MappedStorage))
+        self.assertEqual(len(self.file), 1332)
+        self.assertTrue(all(item is None for item in self.file.data.items))
+        self.assertEqual(self.file[-1].index, 1331)
+        self.assertEqual(sum(item is not None for item in self.file.data.items), 1)
+
+    def test_mutations(self):
+        self.file[0].text = 'Hello'
+        self.assertEqual(self.file[0].text, 'Hello')
+        self.file.insert(1, SubRipItem(0, text='World'))
+        del self.file[2]
+        self.assertEqual(self.file[1].text, 'World')
+        self.assertEqual(self.file[2].index, 2)
+        self.file.clean_indexes()
+        self.assertEqual(self.file[-1].index, 1332)
+
+
+if __name__ == '__main__':
+    unittest.main()
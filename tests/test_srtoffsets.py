@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, InvalidBinary
+from pysrt.srtoffsets import OffsetIndex
+from pysrt.compat import str
+
+
+class TestOffsetIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'utf-8.srt')
+        shutil.copy(os.path.join(file_path, 'tests', 'static', 'utf-8.srt'),
+                    self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_build(self):
+        index = OffsetIndex.build(self.path, interval=10)
+        self.assertEqual(len(index), 1332)
+        self.assertEqual(len(index.starts), 134)
+        self.assertEqual(index.encoding, SubRipFile.DEFAULT_ENCODING)
+        self.assertEqual(index.eol, '\n')
+        with open(self.path, 'rb') as srt_file:
+            data = srt_file.read()
+        self.assertEqual(index.offsets[0], 0)
+        self.assertTrue(data[index.offsets[1]:].startswith(b'1\n'))
+
+    def test_round_trip(self):
+        index = OffsetIndex.build(self.path)
+        loaded = OffsetIndex.loads(index.dumps())
+        for name in ('offsets', 'starts', 'ends', 'size', 'mtime', 'encoding',
+                     'eol', 'interval', 'requested_encoding'):
+            self.assertEqual(getattr(loaded, name), getattr(index, name))
+
+    def test_invalid(self):
+        self.assertRaises(InvalidBinary, OffsetIndex.loads, b'garbage')
+        data = OffsetIndex.build(self.path).dumps()
+        self.assertRaises(InvalidBinary, OffsetIndex.loads, data[:-1])
+
+    def test_sidecar(self):
+        index = OffsetIndex.for_file(self.path)
+        index_path = OffsetIndex.sidecar_path(self.path)
+        self.assertTrue(os.path.exists(index_path))
+        self.assertTrue(OffsetIndex.load(index_path).matches(self.path))
+        self.assertFalse(index.matches(self.path, 'latin-1'))
+
+    def test_stale(self):
+        index = OffsetIndex.for_file(self.path)
+        with open(self.path, 'ab') as srt_file:
+            srt_file.write(b'\n1333\n02:00:00,000 --> 02:00:01,000\nLast\n')
+        self.assertFalse(index.matches(self.path))
+        self.assertEqual(len(OffsetIndex.for_file(self.path)), 1333)
+
+    def test_corrupted_sidecar(self):
+        with open(OffsetIndex.sidecar_path(self.path), 'wb') as index_file:
+            index_file.write(b'garbage')
+        self.assertEqual(len(OffsetIndex.for_file(self.path)), 1332)
+
+
+class TestOpenRange(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def copy(self, name):
+        path = os.path.join(self.directory, name)
+        shutil.copy(os.path.join(self.static_path, name), path)
+        return path
+
+    def assertSameRange(self, path, start, end, encoding=None, interval=7):
+        index = OffsetIndex.for_file(path, encoding, interval)
+        expected = pysrt.open(path, encoding=encoding).slice(
+            ends_after=start, starts_before=end)
+        subs = pysrt.open_range(path, start, end, encoding=encoding,
+                                index=index)
+        self.assertEqual([str(i) for i in subs], [str(i) for i in expected])
+        self.assertEqual(subs.eol, expected.eol)
+        self.assertEqual(subs.path, path)
+
+    def test_windows(self):
+        path = self.copy('utf-8.srt')
+        for start, end in (({'seconds': 1}, {'minutes': 2}),
+                           ({'minutes': 40}, {'minutes': 41}),
+                           ({'minutes': 10}, None), (None, {'minutes': 3}),
+                           ({'hours': 10}, None)):
+            self.assertSameRange(path, start, end)
+
+    def test_encodings(self):
+        for name, encoding in (('bom-utf-16-le.srt', None),
+                               ('bom-utf-32-be.srt', None),
+                               ('windows-1252.srt', 'windows-1252')):
+            self.assertSameRange(self.copy(name), {'seconds': 5},
+                                 {'minutes': 1}, encoding)
+
+    def test_invalid(self):
+        self.assertSameRange(self.copy('invalid.srt'), None, None)
+
+    def test_everything(self):
+        path = self.copy('utf-8.srt')
+        self.assertEqual(len(pysrt.open_range(path)), 1332)
+        self.assertTrue(os.path.exists(OffsetIndex.sidecar_path(path)))
+
+    def test_error_collect(self):
+        self.assertRaises(ValueError, SubRipFile.open_range,
+                          self.copy('utf-8.srt'),
+                          error_handling=SubRipFile.ERROR_COLLECT)
+
+
+if __name__ == '__main__':
+    unittest.main()
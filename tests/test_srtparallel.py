@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import unittest
+
+try:
+    from StringIO import StringIO  # also takes the str printed by Python 2
+except ImportError:
+    from io import StringIO
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipStats, InvalidTimeString
+from pysrt import srtparallel
+from pysrt.compat import str
+
+VALID_BLOCK = u'%d\r\n00:%02d:01,000 --> 00:%02d:02,500\r\nCaf\xe9 %d\r\n'
+INVALID_BLOCK = u'%d\r\n00:%02d:01 --> 00:%02d:02\r\nNo milliseconds %d\r\n'
+
+
+def build_source(count=200):
+    blocks = []
+    for index in range(1, count + 1):
+        block = INVALID_BLOCK if index % 7 == 0 else VALID_BLOCK
+        blocks.append(block % (index, index % 60, index % 60, index))
+    # Blank lines made of whitespaces are block separators too
+    return u'\r\n \r\n'.join(blocks)
+
+
+class TestSplit(unittest.TestCase):
+
+    def test_split(self):
+        source = build_source()
+        chunks = srtparallel.split(source, 5)
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(u''.join(chunk for chunk, _ in chunks), source)
+        line = 0
+        for chunk, first_line in chunks:
+            self.assertEqual(first_line, line)
+            line += len(chunk.splitlines())
+        for chunk, _ in chunks[:-1]:
+            self.assertEqual(chunk.splitlines()[-1].strip(), u'')
+
+    def test_no_blank_line(self):
+        self.assertEqual(srtparallel.split(u'1\n2\n3\n', 3), [(u'1\n2\n3\n', 0)])
+
+
+class TestParallelParsing(unittest.TestCase):
+
+    def setUp(self):
+        self.min_chunk_size = srtparallel.MIN_CHUNK_SIZE
+        srtparallel.MIN_CHUNK_SIZE = 512
+        self.source = build_source()
+
+    def tearDown(self):
+        srtparallel.MIN_CHUNK_SIZE = self.min_chunk_size
+
+    def parse(self, **kwargs):
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            srt_file = pysrt.from_string(self.source, **kwargs)
+            return srt_file, sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+
+    def assertSameParsing(self, **kwargs):
+        expected, expected_log = self.parse(**kwargs)
+        srt_file, log = self.parse(workers=2, **kwargs)
+        self.assertEqual(len(srt_file), 172)
+        self.assertEqual([str(i) for i in srt_file],
+                         [str(i) for i in expected])
+        self.assertEqual(srt_file.eol, expected.eol)
+        self.assertEqual(log, expected_log)
+        return srt_file, expected
+
+    def test_parsers(self):
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            self.assertSameParsing(parser=parser)
+
+    def test_error_log(self):
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            self.assertSameParsing(error_handling=SubRipFile.ERROR_LOG,
+                                   parser=parser)
+
+    def test_error_raise(self):
+        # Make the first invalid block land in a later chunk
+        source = u'\r\n'.join(VALID_BLOCK % (index, 0, 0, index)
+                               for index in range(100)) + u'\r\n' + self.source
+        arguments = []
+        for workers in (None, 2):
+            try:
+                pysrt.from_string(source, error_handling=SubRipFile.ERROR_RAISE,
+                                  workers=workers)
+            except InvalidTimeString as error:
+                arguments.append(error.args)
+            else:
+                self.fail('InvalidTimeString not raised')
+        self.assertEqual(arguments[0][0], 433)
+        self.assertEqual(arguments[1], arguments[0])
+
+    def test_error_collect(self):
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            for max_errors in (None, 10):
+                srt_file, expected = self.assertSameParsing(
+                    error_handling=SubRipFile.ERROR_COLLECT, parser=parser,
+                    max_errors=max_errors)
+                self.assertEqual(list(srt_file.errors), list(expected.errors))
+                self.assertEqual(srt_file.errors.count, 28)
+
+    def test_stats(self):
+        expected = SubRipStats()
+        stats = SubRipStats()
+        self.parse(stats=expected)
+        self.parse(workers=2, stats=stats)
+        for name in ('lines', 'cues', 'errors'):
+            self.assertEqual(getattr(stats, name), getattr(expected, name))
+
+    def test_open(self):
+        path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        expected = pysrt.open(path)
+        srt_file = pysrt.open(path, workers=2)
+        self.assertEqual([str(i) for i in srt_file],
+                         [str(i) for i in expected])
+
+    def test_lazy(self):
+        self.assertRaises(ValueError, pysrt.from_string, self.source,
+                          workers=2, lazy=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipPushParser
+from pysrt.srtitem import LazySubRipItem
+from pysrt.compat import str
+
+
+class TestPushParser(unittest.TestCase):
+
+    def setUp(self):
+        self.static_path = os.path.join(file_path, 'tests', 'static')
+
+    def parse(self, data, chunk_size, **kwargs):
+        parser = SubRipPushParser(**kwargs)
+        items = []
+        for offset in range(0, len(data), chunk_size):
+            items.extend(parser.feed(data[offset:offset + chunk_size]))
+        items.extend(parser.close())
+        return parser, items
+
+    def assertSameFile(self, name, encoding=None, chunk_sizes=(1, 3, 1000)):
+        path = os.path.join(self.static_path, name)
+        expected = pysrt.open(path, encoding=encoding)
+        data = open(path, 'rb').read()
+        for chunk_size in chunk_sizes + (len(data), ):
+            parser, items = self.parse(data, chunk_size, encoding=encoding)
+            self.assertEqual([str(i) for i in items],
+                             [str(i) for i in expected])
+            self.assertEqual(parser.eol, expected.eol)
+            self.assertEqual(parser.encoding, expected.encoding)
+
+    def test_utf8(self):
+        # Mid multi bytes character cuts happen with 1 and 3 bytes chunks
+        self.assertSameFile('utf-8.srt')
+
+    def test_crlf(self):
+        self.assertSameFile('windows-1252.srt', encoding='windows-1252')
+
+    def test_boms(self):
+        for name in ('bom-utf-8.srt', 'bom-utf-16-le.srt', 'bom-utf-16-be.srt',
+                     'bom-utf-32-le.srt', 'bom-utf-32-be.srt'):
+            self.assertSameFile(name)
+
+    def test_no_trailing_newline(self):
+        data = b'1\n00:00:01,000 --> 00:00:02,000\nHello'
+        parser, items = self.parse(data, 5)
+        self.assertEqual([i.text for i in items], ['Hello'])
+        self.assertEqual(self.parse(b'', 1)[1], [])
+
+    def test_feed_returns_completed_items(self):
+        parser = SubRipPushParser()
+        self.assertEqual(parser.feed(b'1\n00:00:01,000 --> 00:00:02,000\nHi\n'), [])
+        self.assertEqual([i.text for i in parser.feed(b'\n2\n')], ['Hi'])
+        self.assertEqual(parser.close(), [])
+        self.assertRaises(ValueError, parser.feed, b'')
+
+    def test_error_line(self):
+        data = open(os.path.join(self.static_path, 'invalid.srt'), 'rb').read()
+        with self.assertRaises(pysrt.Error) as context:
+            pysrt.from_string(data.decode('utf-8'),
+                              error_handling=SubRipFile.ERROR_RAISE)
+        for chunk_size in (1, 7, len(data)):
+            with self.assertRaises(pysrt.Error) as push_context:
+                self.parse(data, chunk_size,
+                           error_handling=SubRipFile.ERROR_RAISE)
+            self.assertEqual(push_context.exception.args,
+                             context.exception.args)
+
+    def test_lazy(self):
+        data = open(os.path.join(self.static_path, 'utf-8.srt'), 'rb').read()
+        _, items = self.parse(data, 100, lazy=True)
+        self.assertTrue(isinstance(items[0], LazySubRipItem))
+        self.assertEqual([str(i) for i in items],
+                         [str(i) for i in pysrt.from_string(data.decode('utf-8'))])
+
+    def test_truncated_character(self):
+        parser = SubRipPushParser()
+        parser.feed(u'1\n00:00:01,000 --> 00:00:02,000\n\xe9'.encode('utf-8')[:-1])
+        self.assertRaises(UnicodeDecodeError, parser.close)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipItem, SubRipReport
+
+
+class TestAnalyze(unittest.TestCase):
+
+    def setUp(self):
+        self.file = SubRipFile([
+            SubRipItem(1, 1000, 4000, 'Hello'),
+            SubRipItem(2, 3000, 3500, 'Nested'),
+            SubRipItem(3, 3800, 5000, 'Overlapping'),
+            SubRipItem(4, 5040, 6000, 'Close'),
+            SubRipItem(5, 9000, 8000, 'Backward'),
+            SubRipItem(6, 8000, 8200, 'Way too many characters'),
+        ])
+
+    def test_overlaps(self):
+        report = self.file.analyze()
+        self.assertEqual(report.overlaps, [(1, 0, 500), (2, 0, 200)])
+
+    def test_short_gaps(self):
+        report = self.file.analyze()
+        self.assertEqual(report.short_gaps, [(2, 3, 40)])
+        self.assertEqual(self.file.analyze(min_gap=0).short_gaps, [])
+        self.assertEqual(self.file.analyze(min_gap=2001).short_gaps,
+                         [(2, 3, 40), (3, 5, 2000)])
+
+    def test_durations(self):
+        report = self.file.analyze()
+        self.assertEqual(report.negative_durations, [4])
+        self.assertEqual(report.min_duration, (-1000, 4))
+        self.assertEqual(report.max_duration, (3000, 0))
+
+    def test_cps(self):
+        report = self.file.analyze()
+        self.assertEqual([row for row, _ in report.cps_outliers], [5])
+        self.assertEqual(self.file.analyze(max_cps=None).cps_outliers, [])
+        self.assertEqual(len(self.file.analyze(max_cps=1).cps_outliers), 5)
+
+    def test_unsorted(self):
+        self.file.data.reverse()
+        report = self.file.analyze()
+        self.assertEqual(report.overlaps, [(4, 5, 500), (3, 5, 200)])
+        self.assertEqual(report.short_gaps, [(3, 2, 40)])
+
+    def test_columnar(self):
+        columnar = SubRipFile(list(self.file),
+                              storage=SubRipFile.STORAGE_COLUMNAR)
+        self.assertEqual(columnar.analyze().as_dict(),
+                         self.file.analyze().as_dict())
+
+    def test_empty(self):
+        report = SubRipFile().analyze()
+        self.assertEqual(report.count, 0)
+        self.assertEqual(report.min_duration, None)
+        self.assertEqual(report.problems_count, 0)
+
+    def test_brute_force(self):
+        path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        subs = pysrt.open(path)
+        subs.shift(ratio=1.5)
+        subs[10].end = subs[12].start + 100
+        report = subs.analyze(min_gap=SubRipReport.MIN_GAP)
+        overlapping = set()
+        for row, item in enumerate(subs):
+            for other in subs[:row]:
+                if other.start <= item.start < other.end:
+                    overlapping.add(row)
+        self.assertEqual(set(row for row, _, _ in report.overlaps),
+                         overlapping)
+        self.assertEqual(report.count, 1332)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipStats
+
+INVALID_SOURCE = (
+    u'1\n00:00:01,000 --> 00:00:02,000\nHello\n\n'
+    u'2\n00:00:03 --> 00:00:04\nNo milliseconds\n\n'
+    u'3\n\n'
+    u'4\n00:00:05,000 --> 00:00:06,000\nWorld\n\n'
+    u'5\nnot --> a time\nGarbage'
+)
+
+
+class TestParsingStats(unittest.TestCase):
+
+    def setUp(self):
+        self.utf8_path = os.path.join(file_path, 'tests', 'static',
+                                      'utf-8.srt')
+
+    def assertTimings(self, stats, *names):
+        for name in SubRipStats.TIMINGS:
+            if name in names:
+                self.assertTrue(getattr(stats, name) >= 0)
+            else:
+                self.assertEqual(getattr(stats, name), 0)
+
+    def test_open(self):
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            stats = SubRipStats()
+            srt_file = pysrt.open(self.utf8_path, parser=parser, stats=stats)
+            self.assertEqual(stats.cues, len(srt_file))
+            self.assertEqual(stats.bytes_read, os.path.getsize(self.utf8_path))
+            with open(self.utf8_path, 'rb') as source_file:
+                self.assertEqual(stats.lines, len(source_file.readlines()))
+            self.assertEqual(stats.errors, {})
+            self.assertTimings(stats, 'decode_time', 'parse_time',
+                               'build_time')
+            self.assertTrue(stats.decode_time > 0)
+            self.assertTrue(stats.build_time > 0)
+
+    def test_errors(self):
+        for parser in (SubRipFile.PARSER_TOLERANT, SubRipFile.PARSER_FAST):
+            stats = SubRipStats()
+            srt_file = pysrt.from_string(INVALID_SOURCE, parser=parser,
+                                         stats=stats)
+            self.assertEqual(len(srt_file), 2)
+            self.assertEqual(stats.cues, 2)
+            self.assertEqual(stats.lines, 17)
+            self.assertEqual(stats.errors, {'InvalidTimeString': 2,
+                                            'InvalidItem': 1})
+            self.assertEqual(stats.errors_count, 3)
+
+    def test_raised_error(self):
+        stats = SubRipStats()
+        self.assertRaises(pysrt.Error, pysrt.from_string, INVALID_SOURCE,
+                          error_handling=SubRipFile.ERROR_RAISE, stats=stats)
+        self.assertEqual(stats.errors, {'InvalidTimeString': 1})
+
+    def test_partial_stream(self):
+        stats = SubRipStats()
+        iterator = SubRipFile.stream(INVALID_SOURCE.splitlines(True),
+                                     stats=stats)
+        next(iterator)
+        iterator.close()
+        self.assertEqual(stats.cues, 1)
+        self.assertTrue(0 < stats.lines < 17)
+        self.assertTrue(stats.parse_time >= 0)
+
+    def test_accumulates(self):
+        stats = SubRipStats()
+        for _ in range(2):
+            pysrt.from_string(INVALID_SOURCE, stats=stats)
+        self.assertEqual(stats.cues, 4)
+        self.assertEqual(stats.errors_count, 6)
+        stats.reset()
+        self.assertEqual(stats.as_dict(), SubRipStats().as_dict())
+
+
+class TestSerializationStats(unittest.TestCase):
+
+    def setUp(self):
+        self.srt_file = pysrt.open(os.path.join(file_path, 'tests', 'static',
+                                                'utf-8.srt'))
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write_into(self):
+        stats = SubRipStats()
+        output = StringIO()
+        self.srt_file.write_into(output, stats=stats)
+        self.assertEqual(stats.cues_written, len(self.srt_file))
+        self.assertEqual(stats.bytes_written, 0)
+        self.assertTrue(stats.serialize_time > 0)
+        self.assertEqual(stats.encode_time, 0)
+        self.assertTrue(stats.write_time > 0)
+        self.assertEqual(stats.cues, 0)
+
+    def test_save(self):
+        stats = SubRipStats()
+        path = os.path.join(self.directory, 'output.srt')
+        self.srt_file.save(path, encoding='utf-16', stats=stats)
+        self.assertEqual(stats.cues_written, len(self.srt_file))
+        self.assertEqual(stats.bytes_written, os.path.getsize(path))
+        self.assertTrue(stats.encode_time > 0)
+        self.assertTrue(stats.write_time > 0)
+
+    def test_to_bytes(self):
+        stats = SubRipStats()
+        data = self.srt_file.to_bytes(stats=stats)
+        self.assertEqual(stats.bytes_written, len(data))
+        self.assertEqual(data, self.srt_file.to_bytes())
+
+
+class TestStats(unittest.TestCase):
+
+    def test_update(self):
+        first = SubRipStats()
+        first.cues = 2
+        first.parse_time = 1.5
+        first.errors = {'InvalidItem': 1}
+        second = SubRipStats()
+        second.cues = 3
+        second.errors = {'InvalidItem': 2, 'InvalidTimeString': 1}
+        first.update(second)
+        self.assertEqual(first.cues, 5)
+        self.assertEqual(first.parse_time, 1.5)
+        self.assertEqual(first.errors, {'InvalidItem': 3,
+                                        'InvalidTimeString': 1})
+
+    def test_timed(self):
+        stats = SubRipStats()
+        self.assertEqual(list(stats.timed([1, 2], 'decode_time')), [1, 2])
+        self.assertTrue(stats.decode_time > 0)
+
+    def test_timed_batches(self):
+        ticks = []
+
+        class CountingStats(SubRipStats):
+            @staticmethod
+            def clock():
+                ticks.append(None)
+                return float(len(ticks))
+
+        stats = CountingStats()
+        values = list(range(SubRipStats.BATCH_SIZE * 2 + 1))
+        self.assertEqual(list(stats.timed(values, 'decode_time')), values)
+        # Three full or partial batches, then an empty one
+        self.assertEqual(len(ticks), 8)
+        self.assertEqual(stats.decode_time, 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
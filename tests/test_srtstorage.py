@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import random
+import unittest
+
+file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.abspath(file_path))
+
+import pysrt
+from pysrt import SubRipFile, SubRipItem, SubRipTime
+from pysrt.srtstorage import ColumnarStorage
+from pysrt.compat import str
+
+
+class TestColumnarOpen(unittest.TestCase):
+
+    def setUp(self):
+        self.utf8_path = os.path.join(file_path, 'tests', 'static', 'utf-8.srt')
+        self.file = pysrt.open(self.utf8_path)
+        self.columnar = pysrt.open(self.utf8_path,
+                                   storage=SubRipFile.STORAGE_COLUMNAR)
+
+    def test_storage(self):
+        self.assertTrue(isinstance(self.columnar.data, ColumnarStorage))
+        self.assertEqual(len(self.columnar), 1332)
+
+    def test_same_content(self):
+        for item, columnar_item in zip(self.file, self.columnar):
+            self.assertEqual(str(item), str(columnar_item))
+
+    def test_same_serialization(self):
+        self.assertEqual(pysrt.from_string(str(self.columnar[12])).text,
+                         self.file[12].text)
+
+    def test_unknown_storage(self):
+        self.assertRaises(ValueError, SubRipFile, storage='nope')
+
+
+class TestColumnarViews(unittest.TestCase):
+
+    def setUp(self):
+        self.file = SubRipFile([
+            SubRipItem(1, {'seconds': 1}, {'seconds': 2}, 'Hello'),
+            SubRipItem(2, {'seconds': 3}, {'seconds': 4}, 'World', 'X1:0'),
+        ], storage=SubRipFile.STORAGE_COLUMNAR)
+
+    def test_write_through(self):
+        self.file[0].text = 'Bye'
+        self.file[0].start.seconds = 0
+        self.file[1].end += {'seconds': 1}
+        self.file[1].position = 'X1:10'
+        self.assertEqual(self.file[0].text, 'Bye')
+        self.assertEqual(self.file[0].start, (0, 0, 0, 0))
+        self.assertEqual(self.file[1].end, (0, 0, 5, 0))
+        self.assertEqual(self.file[1].position, 'X1:10')
+
+    def test_shift(self):
+        self.file.shift(seconds=1)
+        self.assertEqual(self.file[0].start, (0, 0, 2, 0))
+        self.file.shift(ratio=2)
+        self.assertEqual(self.file[1].end, (0, 0, 10, 0))
+
+    def test_arithmetic_returns_values(self):
+        start = self.file[0].start
+        later = start + {'seconds': 10}
+        later.seconds = 42
+        self.assertEqual(self.file[0].start, (0, 0, 1, 0))
+
+    def test_string_index(self):
+        self.file[0].index = 'first'
+        self.assertEqual(self.file[0].index, 'first')
+        self.assertEqual(self.file[1].index, 2)
+
+    def test_list_operations(self):
+        self.file.append(SubRipItem(3, {'seconds': 0}, {'seconds': 1}, 'A'))
+        self.file.insert(0, SubRipItem(4, {'seconds': 9}, {'seconds': 10}))
+        self.assertEqual([i.index for i in self.file], [4, 1, 2, 3])
+        popped = self.file.pop(0)
+        self.assertEqual(popped.index, 4)
+        del self.file[-1]
+        self.assertEqual([i.text for i in self.file], ['Hello', 'World'])
+        self.file[1:] = [SubRipItem(5, text='Z')]
+        self.assertEqual([i.text for i in self.file], ['Hello', 'Z'])
+        del self.file[:]
+        self.assertEqual(len(self.file), 0)
+
+    def test_clean_indexes(self):
+        self.file.extend([SubRipItem(i, {'seconds': random.randint(0, 60)})
+                          for i in range(100)])
+        random.shuffle(self.file.data.texts)
+        self.file.clean_indexes()
+        self.assertEqual([i.index for i in self.file],
+                         list(range(1, len(self.file) + 1)))
+        for first, second in zip(self.file[:-1], self.file[1:]):
+            self.assertTrue(first <= second)
+
+    def test_slice(self):
+        part = self.file.slice(starts_after={'seconds': 2})
+        self.assertEqual(len(part), 1)
+        part.shift(seconds=1)
+        self.assertEqual(self.file[1].start, (0, 0, 4, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,21 @@
 #!/usr/bin/env python
 
 import os
+import re
 import sys
 from datetime import time
+import pickle
+import timeit
 import unittest
 
 file_path = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, os.path.abspath(file_path))
 
 from pysrt import SubRipTime, InvalidTimeString
+from pysrt.srtstorage import ColumnarTime
+
+# Timing tests are only run when this environment variable is set
+BENCHMARK_ENVIRONMENT_VARIABLE = 'PYSRT_BENCHMARK'
 
 
 class TestSimpleTime(unittest.TestCase):
@@ -56,6 +63,20 @@ class TestSimpleTime(unittest.TestCase):
     def test_descriptor_from_class(self):
         self.assertRaises(AttributeError, lambda: SubRipTime.hours)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.time, '__dict__'))
+
+    def test_pickle(self):
+        self.time.shift(1, 2, 3, 4)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(self.time, protocol)),
+                             (1, 2, 3, 4))
+
+    def test_pickle_zero(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            time = pickle.loads(pickle.dumps(SubRipTime(), protocol))
+            self.assertEqual(time.ordinal, 0)
+
 
 class TestTimeParsing(unittest.TestCase):
     KNOWN_VALUES = (
@@ -146,5 +167,138 @@ class TestOperators(unittest.TestCase):
         self.time *= 0.5
         self.assertEqual(self.time, (1, 2, 3, 4))
 
+    def test_comparisons(self):
+        later = SubRipTime(1, 2, 3, 5)
+        for other in (later, '01:02:03,005', later.ordinal, (1, 2, 3, 5),
+                      {'hours': 1, 'minutes': 2, 'seconds': 3,
+                       'milliseconds': 5}):
+            self.assertTrue(self.time < other)
+            self.assertTrue(self.time <= other)
+            self.assertTrue(other > self.time)
+            self.assertFalse(self.time >= other)
+            self.assertFalse(self.time > other)
+            self.assertTrue(self.time != other)
+            self.assertFalse(self.time == other)
+        self.assertTrue(self.time == SubRipTime(1, 2, 3, 4))
+        self.assertTrue(ColumnarTime(1, 2, 3, 4) == self.time)
+
+
+class TestCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_size = SubRipTime.CACHE_SIZE
+
+    def tearDown(self):
+        SubRipTime.set_cache_size(self.cache_size)
+
+    def test_format_ordinal(self):
+        for ordinal in (0, 1, 999, 1000, 59999, 60000, 3599999, 3600000,
+                        45296789, 100 * SubRipTime.HOURS_RATIO + 1):
+            time = SubRipTime.from_ordinal(ordinal)
+            self.assertEqual(SubRipTime.format_ordinal(ordinal),
+                             SubRipTime.TIME_PATTERN % tuple(time))
+        self.assertEqual(SubRipTime.format_ordinal(-1), '00:00:00,000')
+
+    def test_parsed_instances_are_distinct(self):
+        first = SubRipTime.from_string('00:00:01,000')
+        first.seconds += 1
+        second = SubRipTime.from_string('00:00:01,000')
+        self.assertEqual(second, (0, 0, 1, 0))
+        self.assertFalse(first is second)
+
+    def test_string_follows_changes(self):
+        time = SubRipTime(0, 0, 1)
+        self.assertEqual(str(time), '00:00:01,000')
+        time.milliseconds = 5
+        self.assertEqual(str(time), '00:00:01,005')
+
+    def test_subclass(self):
+        time = ColumnarTime.from_string('00:00:01,000')
+        self.assertTrue(isinstance(time, ColumnarTime))
+        self.assertEqual(time.ordinal, 1000)
+
+    def test_bounded(self):
+        SubRipTime.set_cache_size(10)
+        for ordinal in range(100):
+            self.assertEqual(SubRipTime.from_string(
+                str(SubRipTime.from_ordinal(ordinal))).ordinal, ordinal)
+            self.assertTrue(len(SubRipTime._parsed[SubRipTime]) <= 10)
+            self.assertTrue(len(SubRipTime._formatted[SubRipTime]) <= 10)
+
+    def test_disabled(self):
+        SubRipTime.set_cache_size(0)
+        self.assertEqual(str(SubRipTime.from_string('00:00:01,000')),
+                         '00:00:01,000')
+        self.assertEqual(SubRipTime._parsed[SubRipTime], {})
+        self.assertEqual(SubRipTime._formatted[SubRipTime], {})
+
+    def test_invalid_not_cached(self):
+        self.assertRaises(InvalidTimeString, SubRipTime.from_string, 'hello')
+        self.assertFalse('hello' in SubRipTime._parsed.get(SubRipTime, {}))
+
+    def test_subclass_pattern(self):
+        class VttTime(SubRipTime):
+            __slots__ = ()
+            TIME_PATTERN = '%02d:%02d:%02d.%03d'
+            RE_TIME_SEP = re.compile(r'\:|\.')
+
+        self.assertEqual(str(VttTime(0, 0, 1, 5)), '00:00:01.005')
+        self.assertEqual(str(SubRipTime(0, 0, 1, 5)), '00:00:01,005')
+        self.assertEqual(str(SubRipTime(0, 0, 2, 5)), '00:00:02,005')
+        self.assertEqual(str(VttTime(0, 0, 2, 5)), '00:00:02.005')
+        self.assertEqual(SubRipTime.from_string('00:00:03,005').ordinal,
+                         3005)
+        self.assertRaises(InvalidTimeString, VttTime.from_string,
+                          '00:00:03,005')
+
+
+@unittest.skipUnless(os.environ.get(BENCHMARK_ENVIRONMENT_VARIABLE),
+                     'set %s to run benchmarks' % BENCHMARK_ENVIRONMENT_VARIABLE)
+class TestBenchmark(unittest.TestCase):
+    NUMBER = 100000
+
+    def setUp(self):
+        self.time = SubRipTime(1, 2, 3, 456)
+        self.string = str(self.time)
+        self.cache_size = SubRipTime.CACHE_SIZE
+
+    def tearDown(self):
+        SubRipTime.set_cache_size(self.cache_size)
+
+    def best_of(self, function):
+        return min(timeit.repeat(function, number=self.NUMBER, repeat=3))
+
+    def report(self, name, reference, timing):
+        sys.stderr.write('\n%s: %.3fs -> %.3fs (x%.1f) ' % (
+            name, reference, timing, reference / timing))
+
+    def test_format(self):
+        time = self.time
+        descriptors = self.best_of(
+            lambda: SubRipTime.TIME_PATTERN % tuple(time))
+        divmods = self.best_of(
+            lambda: SubRipTime.format_ordinal(time.ordinal))
+        self.report('format', descriptors, divmods)
+        self.assertTrue(divmods < descriptors)
+
+    def test_str_cache(self):
+        time = self.time
+        SubRipTime.set_cache_size(0)
+        uncached = self.best_of(lambda: str(time))
+        SubRipTime.set_cache_size(self.cache_size)
+        cached = self.best_of(lambda: str(time))
+        self.report('str', uncached, cached)
+        self.assertTrue(cached < uncached)
+
+    def test_from_string_cache(self):
+        string = self.string
+        SubRipTime.set_cache_size(0)
+        uncached = self.best_of(lambda: SubRipTime.from_string(string))
+        SubRipTime.set_cache_size(self.cache_size)
+        cached = self.best_of(lambda: SubRipTime.from_string(string))
+        self.report('from_string', uncached, cached)
+        self.assertTrue(cached < uncached)
+
+
 if __name__ == '__main__':
     unittest.main()